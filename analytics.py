@@ -0,0 +1,188 @@
+# analytics.py
+# 항목별 실패율 분석 (이벤트 로그 → 메모리 맵 열 저장소 → 벡터화 집계)
+# 실행: python analytics.py build [로그 폴더] [--store analytics]   # 새로 쌓인 결과만 이어서 변환
+#       python analytics.py report [--store analytics] [--days 90]
+#
+# 저장소는 RESULT 필드마다 파일 하나(<이름>.col, 같은 dtype 값이 이어 붙은 raw 배열)와 meta.json.
+# meta.json 에 로그 파일별 읽은 위치를 남겨서 build 를 다시 돌리면 뒤에 붙은 것만 추가한다.
+# 집계는 np.memmap 을 chunk 단위로 훑으면서 batch_score 의 항목별 점수 함수로 실패 여부를 판정한다.
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+import batch_score as bs
+import eventlog as ev
+from core import COOK_METHODS, DIFFICULTIES
+
+STORE_DIR = os.environ.get("MANDU_ANALYTICS_DIR", "analytics")
+CHUNK = 1 << 20
+
+# 열 이름 -> dtype (RESULT 본문 그대로 + 기록 시각)
+COLUMNS = {name: ev.RESULT_DTYPE.fields[name][0] for name in ev.RESULT_DTYPE.names}
+COLUMNS["ts"] = np.dtype("<f8")
+
+# ---------- 실패 판정 ----------
+# score_attempt 의 각 단계에서 만점을 못 받은 경우 = 실패. t 는 그 행 모드의 표 (bs.TABLES[mode])
+CRITERIA = {
+    "protein": lambda o, a, t: bs.protein_points(o["protein"], a["ings"], t) == 0,
+    "must_have": lambda o, a, t: bs.must_points(o["must"], a["ings"], t) < t["must"][o["must"]],
+    "avoid": lambda o, a, t: bs.avoid_points(o["avoid"], a["ings"], t) < 0,
+    "pleats": lambda o, a, t: bs.pleat_points(o["pleats_min"], o["pleats_max"], a["pleats"], t) < t["w"]["pleats_ok"],
+    "method": lambda o, a, t: bs.method_points(o["method"], a["method"], t) < t["w"]["method_ok"],
+    "cook_time": lambda o, a, t: bs.time_points(o["tmin"], o["tmax"], a["cook_time"], t) < t["w"]["time_ok"],
+}
+
+# ---------- 저장소 ----------
+def _meta_path(store: str) -> str:
+    return os.path.join(store, "meta.json")
+
+def load_meta(store: str = STORE_DIR) -> dict:
+    path = _meta_path(store)
+    if not os.path.exists(path):
+        return {"count": 0, "sources": {}}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def _append(files: dict, bodies: bytearray, stamps: list):
+    arr = np.frombuffer(bytes(bodies), dtype=ev.RESULT_DTYPE)
+    for name in ev.RESULT_DTYPE.names:
+        files[name].write(np.ascontiguousarray(arr[name]).tobytes())
+    files["ts"].write(np.asarray(stamps, dtype=COLUMNS["ts"]).tobytes())
+
+def build(log_dir: str = ev.LOG_DIR, store: str = STORE_DIR, chunk: int = 100_000) -> int:
+    """로그의 RESULT 레코드를 열 파일 뒤에 추가. 추가한 행 수 반환"""
+    os.makedirs(store, exist_ok=True)
+    meta = load_meta(store)
+    files = {name: open(os.path.join(store, f"{name}.col"), "ab") for name in COLUMNS}
+    added = 0
+    try:
+        # 지난번에 meta 를 못 쓰고 끝났으면 열 파일 길이를 meta 기준으로 되돌림
+        for name, f in files.items():
+            f.truncate(meta["count"] * COLUMNS[name].itemsize)
+        for path in ev.log_files(log_dir):
+            key = os.path.basename(path)
+            offset = meta["sources"].get(key, 0)
+            bodies, stamps = bytearray(), []
+            for kind, ts, _, body, offset in ev.iter_file(path, offset):
+                if kind != ev.RESULT:
+                    continue
+                bodies += body
+                stamps.append(ts)
+                if len(stamps) >= chunk:
+                    _append(files, bodies, stamps)
+                    added += len(stamps)
+                    bodies, stamps = bytearray(), []
+            if stamps:
+                _append(files, bodies, stamps)
+                added += len(stamps)
+            meta["sources"][key] = offset
+    finally:
+        for f in files.values():
+            f.close()
+    meta["count"] += added
+    with open(_meta_path(store), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    return added
+
+def open_columns(store: str = STORE_DIR) -> dict:
+    """열 이름 -> 읽기 전용 np.memmap (행이 없으면 빈 배열)"""
+    n = load_meta(store)["count"]
+    if n == 0:
+        return {name: np.empty(0, dtype=dt) for name, dt in COLUMNS.items()}
+    return {name: np.memmap(os.path.join(store, f"{name}.col"), dtype=dt, mode="r", shape=(n,))
+            for name, dt in COLUMNS.items()}
+
+# ---------- 집계 ----------
+# 칸 = 모드 x 난이도 x 주문 조리법
+_SHAPE = (len(ev.MODES), len(DIFFICULTIES), len(COOK_METHODS))
+_CELLS = int(np.prod(_SHAPE))
+
+def breakdown(store: str = STORE_DIR, since: float = None, until: float = None, chunk: int = CHUNK) -> dict:
+    """칸별 시도 수 / 점수 합 / 항목별 실패 수. 모두 _SHAPE 모양 배열.
+
+    chunk 행씩만 메모리에 올려서 처리하므로 저장소 크기와 상관없이 메모리 사용량이 일정하다.
+    """
+    cols = open_columns(store)
+    n = len(cols["ts"])
+    attempts = np.zeros(_CELLS, dtype=np.int64)
+    points = np.zeros(_CELLS, dtype=np.int64)
+    fails = {name: np.zeros(_CELLS, dtype=np.int64) for name in CRITERIA}
+    for start in range(0, n, chunk):
+        part = {name: np.asarray(c[start:start + chunk]) for name, c in cols.items()}
+        keep = None
+        if since is not None:
+            keep = part["ts"] >= since
+        if until is not None:
+            keep = part["ts"] < until if keep is None else keep & (part["ts"] < until)
+        if keep is not None:
+            part = {name: c[keep] for name, c in part.items()}
+        cell = np.ravel_multi_index(
+            (part["mode"], part["difficulty"], part["method"]), _SHAPE).astype(np.intp)
+        attempts += np.bincount(cell, minlength=_CELLS)
+        points += np.bincount(cell, weights=part["points"], minlength=_CELLS).astype(np.int64)
+        # 모드마다 가중치(표)가 다르다 → 모드별로 잘라서 그 모드 표로 판정
+        for code, mode in enumerate(ev.MODES):
+            sel = part["mode"] == code
+            if not sel.any():
+                continue
+            o, a = ev.result_columns({name: c[sel] for name, c in part.items()})
+            for name, failed in CRITERIA.items():
+                fails[name] += np.bincount(cell[sel][failed(o, a, bs.TABLES[mode])], minlength=_CELLS)
+    return {
+        "attempts": attempts.reshape(_SHAPE),
+        "points": points.reshape(_SHAPE),
+        "fails": {name: f.reshape(_SHAPE) for name, f in fails.items()},
+    }
+
+def rates(b: dict, axes: tuple) -> dict:
+    """axes 로 합친 실패율. 예: axes=(0, 2) → 난이도별, (0, 1) → 조리법별, (0,) → 난이도x조리법"""
+    attempts = b["attempts"].sum(axis=axes)
+    safe = np.maximum(attempts, 1)
+    return {
+        "attempts": attempts,
+        "avg_points": b["points"].sum(axis=axes) / safe,
+        "fail_rate": {name: f.sum(axis=axes) / safe for name, f in b["fails"].items()},
+    }
+
+# ---------- 출력 ----------
+def _print_table(title: str, labels: list, r: dict):
+    print(f"\n[{title}]")
+    print(f"{'':<14}{'시도':>9}{'평균':>7}" + "".join(f"{name:>11}" for name in CRITERIA))
+    for i, label in enumerate(labels):
+        idx = np.unravel_index(i, r["attempts"].shape)
+        line = f"{label:<14}{r['attempts'][idx]:>9,}{r['avg_points'][idx]:>7.1f}"
+        line += "".join(f"{r['fail_rate'][name][idx] * 100:>10.1f}%" for name in CRITERIA)
+        print(line)
+
+def report(b: dict):
+    _print_table("난이도별", DIFFICULTIES, rates(b, (0, 2)))
+    _print_table("조리법별", COOK_METHODS, rates(b, (0, 1)))
+    _print_table("난이도 x 조리법", [f"{d}/{m}" for d in DIFFICULTIES for m in COOK_METHODS], rates(b, (0,)))
+
+def main():
+    p = argparse.ArgumentParser(description="항목별 실패율 분석")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    pb = sub.add_parser("build", help="이벤트 로그 → 열 저장소 (이어서 추가)")
+    pb.add_argument("log_dir", nargs="?", default=ev.LOG_DIR)
+    pb.add_argument("--store", default=STORE_DIR)
+    pr = sub.add_parser("report", help="실패율 표 출력")
+    pr.add_argument("--store", default=STORE_DIR)
+    pr.add_argument("--days", type=float, default=None, help="최근 N일만")
+    args = p.parse_args()
+
+    if args.cmd == "build":
+        added = build(args.log_dir, args.store)
+        print(f"{added:,}행 추가 (총 {load_meta(args.store)['count']:,}행)")
+        return
+
+    since = time.time() - args.days * 86400 if args.days else None
+    b = breakdown(args.store, since=since)
+    print(f"시도 {int(b['attempts'].sum()):,}건")
+    report(b)
+
+if __name__ == "__main__":
+    main()
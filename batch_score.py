@@ -0,0 +1,117 @@
+# batch_score.py
+# score_attempt 일괄 채점 (NumPy 벡터화)
+# 재료 목록을 비트 위치로 인코딩해서 주문/시도를 정수 마스크 배열로 다룬다.
+# 점수 규칙은 core.score_attempt 와 완전히 같다 (감점 상한 포함).
+
+import numpy as np
+
+from core import ALL_ING, ING_BIT, METHOD_CODE, ing_mask
+from rules import GAME_MODES
+
+# ---------- 비트 인코딩 ----------
+# ING_BIT / ing_mask 는 core 에 있음 (비트 위치 = core.ALL_ING 순서)
+N_MASKS = 1 << len(ALL_ING)
+
+# 마스크별 켜진 비트 수 (np.bitwise_count 없는 버전도 지원)
+POPCOUNT = np.array([bin(m).count("1") for m in range(N_MASKS)], dtype=np.int16)
+
+def encode_orders(orders) -> dict:
+    """주문 목록 → 열(column) 배열 묶음"""
+    return {
+        "protein": np.array([ING_BIT[o.required_protein] for o in orders], dtype=np.int16),
+        "must": np.array([ing_mask(o.must_have) for o in orders], dtype=np.int16),
+        "must_n": np.array([len(o.must_have) for o in orders], dtype=np.int16),
+        "avoid": np.array([ing_mask(o.avoid) for o in orders], dtype=np.int16),
+        "mix": np.array([ing_mask(o.optional_mixes) for o in orders], dtype=np.int16),
+        "pleats_min": np.array([o.pleats_min for o in orders], dtype=np.int16),
+        "pleats_max": np.array([o.pleats_max for o in orders], dtype=np.int16),
+        "method": np.array([METHOD_CODE[o.method] for o in orders], dtype=np.int8),
+        "tmin": np.array([o.time_target[0] for o in orders], dtype=np.float64),
+        "tmax": np.array([o.time_target[1] for o in orders], dtype=np.float64),
+    }
+
+def encode_attempts(attempts) -> dict:
+    """시도 목록 → 열(column) 배열 묶음"""
+    return {
+        "ings": np.array([ing_mask(a.ingredients) for a in attempts], dtype=np.int16),
+        "pleats": np.array([a.pleats for a in attempts], dtype=np.int16),
+        "method": np.array([METHOD_CODE[a.method] for a in attempts], dtype=np.int8),
+        "cook_time": np.array([a.cook_time for a in attempts], dtype=np.float64),
+    }
+
+# ---------- 항목별 점수 ----------
+# 각 함수는 score_attempt 의 한 단계(1~7)와 1:1 대응. 배열 브로드캐스팅 가능.
+# 가중치는 rules.GAME_MODES[mode]["score"], 재료 개수 → 점수는 모드별 표(TABLES)로 미리 계산.
+def _compile_tables(w: dict) -> dict:
+    return {
+        "w": w,
+        "must": (w["must"] * POPCOUNT).astype(np.int16),
+        "avoid": (w["avoid"] * POPCOUNT).astype(np.int16),
+        "mix": (w["mix"] * POPCOUNT).astype(np.int16),
+    }
+
+TABLES = {mode: _compile_tables(cfg["score"]) for mode, cfg in GAME_MODES.items()}
+_STEP = TABLES["step"]
+
+def protein_points(protein, ings, t=_STEP):
+    return np.where(ings & protein, t["w"]["protein"], 0)
+
+def must_points(must, ings, t=_STEP):
+    return t["must"][ings & must]
+
+def avoid_points(avoid, ings, t=_STEP):
+    return t["avoid"][ings & avoid]
+
+def mix_points(mix, ings, t=_STEP):
+    return t["mix"][ings & mix]
+
+def pleat_points(pleats_min, pleats_max, pleats, t=_STEP):
+    w = t["w"]
+    inside = (pleats_min <= pleats) & (pleats <= pleats_max)
+    diff = np.minimum(np.abs(pleats - pleats_min), np.abs(pleats - pleats_max))
+    return np.where(inside, w["pleats_ok"], -np.minimum(w["pleats_cap"], diff * w["pleats_slope"]))
+
+def method_points(order_method, method, t=_STEP):
+    return np.where(method == order_method, t["w"]["method_ok"], t["w"]["method_miss"])
+
+def time_points(tmin, tmax, cook_time, t=_STEP):
+    w = t["w"]
+    inside = (tmin <= cook_time) & (cook_time <= tmax)
+    off = np.minimum(np.abs(cook_time - tmin), np.abs(cook_time - tmax))
+    # np.round 는 파이썬 round 와 같은 짝수 반올림
+    return np.where(inside, w["time_ok"], -np.minimum(w["time_cap"], np.round(off * w["time_slope"]).astype(np.int64)))
+
+def score_parts(o: dict, a: dict, mode: str = "step") -> dict:
+    """항목별 점수 배열 (보정 전)"""
+    t = TABLES[mode]
+    ings = a["ings"]
+    return {
+        "protein": protein_points(o["protein"], ings, t),
+        "must": must_points(o["must"], ings, t),
+        "avoid": avoid_points(o["avoid"], ings, t),
+        "mix": mix_points(o["mix"], ings, t),
+        "pleats": pleat_points(o["pleats_min"], o["pleats_max"], a["pleats"], t),
+        "method": method_points(o["method"], a["method"], t),
+        "time": time_points(o["tmin"], o["tmax"], a["cook_time"], t),
+    }
+
+def score_encoded(o: dict, a: dict, mode: str = "step") -> np.ndarray:
+    parts = score_parts(o, a, mode)
+    total = sum(np.asarray(p, dtype=np.int64) for p in parts.values())
+    w = TABLES[mode]["w"]
+    return np.clip(total, w["total_min"], w["total_max"])
+
+def score_batch(orders, attempts, mode: str = "step") -> np.ndarray:
+    """시도 배열 채점.
+
+    orders 가 Order 하나면 모든 시도를 그 주문으로, 목록이면 attempts 와 같은 길이로 짝지어 채점.
+    이미 인코딩된 dict 도 그대로 받는다.
+    """
+    if isinstance(orders, dict):
+        o = orders
+    elif isinstance(orders, (list, tuple)):
+        o = encode_orders(orders)
+    else:
+        o = encode_orders([orders])
+    a = attempts if isinstance(attempts, dict) else encode_attempts(attempts)
+    return score_encoded(o, a, mode)
@@ -0,0 +1,211 @@
+# bench.py
+# 핫패스 벤치마크 (채점/주문 생성/유틸 + 앱 전체 플레이스루)
+# 실행: python bench.py             # 측정 후 bench_baseline.json 과 비교
+#       python bench.py --save      # 현재 결과를 기준값으로 저장
+#       python bench.py --quick     # AppTest 플레이스루 생략
+# 기준값 대비 --threshold(%) 이상 느려진 항목은 ⚠️ 로 표시, --strict 면 exit 1.
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+import core
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+
+# ---------- 마이크로 벤치 ----------
+def _sample_inputs(n: int = 256):
+    rng = random.Random(0)
+    gen = core.OrderGenerator("step", seed=0)
+    orders = [gen.order(rng.choice(core.DIFFICULTIES)) for _ in range(n)]
+    attempts = [core.Attempt(rng.sample(core.ALL_ING, rng.randint(1, 6)), rng.randint(4, 16),
+                             rng.choice(core.COOK_METHODS), rng.randint(4, 24) / 2) for _ in range(n)]
+    return orders, attempts
+
+def micro_cases() -> dict:
+    """이름 -> 인자 없는 호출 함수 (매번 다른 입력을 돌아가며 씀)"""
+    orders, attempts = _sample_inputs()
+    pairs = list(zip(orders, attempts))
+    methods = [(m, d) for m in core.COOK_METHODS for d in core.DIFFICULTIES]
+    scores = list(range(0, 101, 5))
+
+    def cycle(items):
+        i = 0
+        n = len(items)
+        def nxt():
+            nonlocal i
+            i = (i + 1) % n
+            return items[i]
+        return nxt
+
+    next_pair, next_method, next_score = cycle(pairs), cycle(methods), cycle(scores)
+    next_diff = cycle(core.DIFFICULTIES)
+    return {
+        "score_attempt": lambda: core.score_attempt(*next_pair()),
+        "evaluate": lambda: core.evaluate(*next_pair()),
+        "generate_order": lambda: core.generate_order(next_diff()),
+        "new_order": lambda: core.new_order(next_diff()),
+        "method_time_range": lambda: core.method_time_range(*next_method()),
+        "boss_comment": lambda: core.boss_comment(next_score()),
+    }
+
+def bench_call(fn, min_secs: float = 0.3) -> dict:
+    # 호출당 시간: 대략 min_secs 동안 반복
+    n = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(n):
+            fn()
+        dt = time.perf_counter() - t0
+        if dt >= min_secs:
+            break
+        n *= 2
+
+    # 호출당 할당: 한 번 호출 중 늘어난 최대 메모리(tracemalloc peak)
+    tracemalloc.start()
+    peaks = []
+    for _ in range(200):
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        fn()
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+
+    return {"ns_per_call": dt / n * 1e9, "alloc_bytes": statistics.median(peaks)}
+
+# ---------- 앱 플레이스루 (AppTest) ----------
+def _click(at, label: str):
+    for b in at.button:
+        if b.label == label:
+            return b.click()
+    raise LookupError(f"버튼 없음: {label} (있는 것: {[b.label for b in at.button]})")
+
+def _timed_run(at, times: list):
+    t0 = time.perf_counter()
+    at.run()
+    times.append((time.perf_counter() - t0) * 1000)
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+def play_step_mode(rounds: int = 5) -> list:
+    """test.py: Step 0 → 4 를 rounds 번. 클릭마다 rerun 시간(ms) 목록 반환"""
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file("test.py", default_timeout=30)
+    times = []
+    _timed_run(at, times)
+    for r in range(rounds):
+        if r == 0:
+            _click(at, "보통 (20초)")
+        else:
+            _click(at, "같은 난이도로 다시 하기")
+        _timed_run(at, times)                                   # Step 1
+        _click(at, "시작하기 ▶"); _timed_run(at, times)          # Step 2
+        at.multiselect[0].set_value([at.session_state.order.required_protein]); _timed_run(at, times)
+        _click(at, "다음 ▶"); _timed_run(at, times)              # Step 3
+        at.number_input[0].set_value(at.session_state.order.pleats_min); _timed_run(at, times)
+        _click(at, "만두 완성! ✅"); _timed_run(at, times)        # Step 4
+        assert at.session_state.step == 4
+    return times
+
+def play_round_mode(rounds: int = 5) -> list:
+    """ex1.py: 게임 시작 → (재료 선택 → 제출 → 새 라운드) 반복"""
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file("ex1.py", default_timeout=30)
+    times = []
+    _timed_run(at, times)
+    _click(at, "게임 시작"); _timed_run(at, times)
+    for _ in range(rounds):
+        at.multiselect[0].set_value([at.session_state.order.required_protein]); _timed_run(at, times)
+        _click(at, "만두 완성! ✅"); _timed_run(at, times)
+        _click(at, "새 라운드"); _timed_run(at, times)
+    return times
+
+APP_CASES = {
+    "app_step_mode": play_step_mode,
+    "app_round_mode": play_round_mode,
+}
+
+def bench_app(play) -> dict:
+    times = play()
+    return {
+        "rerun_p50_ms": statistics.median(times),
+        "rerun_max_ms": max(times),
+        "total_ms": sum(times),
+        "reruns": len(times),
+    }
+
+# ---------- 기준값 비교 ----------
+# 값이 클수록 나쁜 지표들
+_COMPARE_KEYS = ("ns_per_call", "alloc_bytes", "rerun_p50_ms", "total_ms")
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """(이름, 지표, 기준, 현재, 변화율%, 회귀여부) 목록"""
+    rows = []
+    for name, metrics in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        for key in _COMPARE_KEYS:
+            if key in metrics and key in base and base[key]:
+                change = (metrics[key] - base[key]) / base[key] * 100
+                rows.append((name, key, base[key], metrics[key], change, change > threshold))
+    return rows
+
+def run(quick: bool = False) -> dict:
+    results = {}
+    for name, fn in micro_cases().items():
+        results[name] = bench_call(fn)
+        print(f"{name:<18} {results[name]['ns_per_call']:>10,.0f} ns/call  "
+              f"alloc {results[name]['alloc_bytes']:>7,.0f} B")
+    if not quick:
+        for name, play in APP_CASES.items():
+            results[name] = bench_app(play)
+            r = results[name]
+            print(f"{name:<18} rerun p50 {r['rerun_p50_ms']:.1f}ms  max {r['rerun_max_ms']:.1f}ms  "
+                  f"({r['reruns']} reruns, 총 {r['total_ms']:.0f}ms)")
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+def main():
+    p = argparse.ArgumentParser(description="만두 게임 벤치마크")
+    p.add_argument("--save", action="store_true", help="결과를 기준값으로 저장")
+    p.add_argument("--quick", action="store_true", help="AppTest 플레이스루 생략")
+    p.add_argument("--threshold", type=float, default=20.0, help="회귀로 볼 변화율(%%)")
+    p.add_argument("--strict", action="store_true", help="회귀가 있으면 exit 1")
+    p.add_argument("--baseline", default=BASELINE_PATH)
+    args = p.parse_args()
+
+    current = run(quick=args.quick)
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"\n기준값 저장: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("\n기준값 없음 (--save 로 먼저 저장)")
+        return
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    print(f"\n기준값 대비 (threshold {args.threshold:.0f}%)")
+    regressed = False
+    for name, key, base, cur, change, bad in compare(current, baseline, args.threshold):
+        mark = "⚠️" if bad else "  "
+        print(f"{mark} {name:<18} {key:<13} {base:>12,.1f} → {cur:>12,.1f}  ({change:+.1f}%)")
+        regressed = regressed or bad
+    if regressed and args.strict:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# bench_memory.py
+# 세션당 메모리 측정: 앱이 실제로 세션 상태에 들고 있는 것 vs sessions 의 줄이기 단계(compact) 뒤
+# 실행: python bench_memory.py [--sessions 10000]
+# ex1.py / test.py 의 session_init 과 같은 키로 세션 상태를 N개 만들고 tracemalloc 으로 늘어난 양을 잰다.
+# 줄이기는 sessions.compact_state 를 그대로 부른다 (정리 스레드가 하는 것과 같은 일).
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from compact import CompactAttempt, CompactOrder, CompactResult
+from core import ALL_ING, COOK_METHODS, DIFFICULTIES, Attempt, Order, OrderGenerator, evaluate, get_time_limit
+from eventlog import new_session_id
+from history import RoundHistory
+from orderspace import share_code
+from sessions import compact_state
+
+def _inputs(n: int):
+    rng = random.Random(0)
+    gen = OrderGenerator("step", seed=0)
+    orders = [gen.order(rng.choice(DIFFICULTIES)) for _ in range(n)]
+    attempts = [Attempt(rng.sample(ALL_ING, rng.randint(1, 6)), rng.randint(4, 16),
+                        rng.choice(COOK_METHODS), rng.randint(4, 24) / 2) for _ in range(n)]
+    return orders, attempts
+
+def _own(order) -> Order:
+    # 세션마다 생성기가 따로 만든 주문 (리스트/튜플이 세션마다 따로 생긴다)
+    return Order(order.required_protein, list(order.must_have), list(order.optional_mixes),
+                 list(order.avoid), order.pleats_min, order.pleats_max, order.method,
+                 tuple(order.time_target), order.note)
+
+def _test_common(order, ingredients, a: Attempt) -> dict:
+    # test.py session_init 의 키
+    return {"step": 1, "difficulty": "보통", "order": order, "live": None,
+            "ingredients": ingredients, "pleats": a.pleats, "method": a.method, "cook_time": a.cook_time,
+            "result": None, "order_gen": OrderGenerator("step"), "daily": False, "daily_idx": 0, "round": 1,
+            "player_name": "익명", "sid": new_session_id(), "history": RoundHistory("step")}
+
+def test_step1(order, attempt) -> dict:
+    """test.py 주문 확인 화면 (주문만 받아 둔 채 자리 비움)"""
+    return _test_common(_own(order), [], attempt)
+
+def test_result(order, attempt) -> dict:
+    """test.py 결과 화면: ss.result = (점수, ScoreResult, 시간 초과). ScoreResult 가 ss.order 와 시도를 붙잡고 있다"""
+    order = _own(order)
+    ingredients = list(attempt.ingredients)
+    a = Attempt(ingredients, attempt.pleats, attempt.method, attempt.cook_time)    # "만두 완성!" 이 만드는 시도
+    r = evaluate(order, a, "step")
+    state = _test_common(order, ingredients, a)
+    state.update(step=4, result=(r.points, r, False))
+    return state
+
+def ex1_between(order, attempt) -> dict:
+    """ex1.py 라운드 결과 뒤: order/live 는 None 으로 비움 (결과는 그 rerun 에 보여주고 안 남김)"""
+    gen = OrderGenerator("round")
+    ingredients = list(attempt.ingredients)
+    inputs = {"ingredients": ingredients, "pleats": attempt.pleats, "method": attempt.method,
+              "cook_time": attempt.cook_time}
+    return {"started": True, "difficulty": "보통", "order": None, "round": 1, "score_total": 0, "live": None,
+            "time_limit": get_time_limit("보통", "round"), "order_gen": gen, "daily": False,
+            "player_name": "익명", "sid": new_session_id(), "last_inputs": inputs, "history": RoundHistory("round"),
+            "order_code": share_code(gen.order("보통"), "round", "보통"), **inputs}
+
+STATES = {
+    "test.py 주문 확인": test_step1,
+    "test.py 결과": test_result,
+    "ex1.py 라운드 사이": ex1_between,
+}
+
+def measure(build, orders, attempts, compacted: bool) -> float:
+    """세션 하나당 남아 있는 바이트 (만드는 중/줄이는 중 잠깐 쓰고 버린 것은 제외)"""
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    sessions = [build(o, a) for o, a in zip(orders, attempts)]
+    if compacted:
+        for s in sessions:
+            compact_state(s)
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return used / len(sessions)
+
+def conversion_ns(orders, attempts, reps: int = 3) -> dict:
+    results = [evaluate(o, a) for o, a in zip(orders, attempts)]
+    out = {}
+    for name, fn, args in (
+        ("from_order", CompactOrder.from_order, orders),
+        ("to_order", CompactOrder.to_order, [CompactOrder.from_order(o) for o in orders]),
+        ("from_attempt", CompactAttempt.from_attempt, attempts),
+        ("to_attempt", CompactAttempt.to_attempt, [CompactAttempt.from_attempt(a) for a in attempts]),
+        ("from_result", CompactResult.from_result, results),
+        ("to_result", CompactResult.to_result, [CompactResult.from_result(r) for r in results]),
+    ):
+        best = float("inf")
+        for _ in range(reps):
+            t0 = time.perf_counter()
+            for x in args:
+                fn(x)
+            best = min(best, time.perf_counter() - t0)
+        out[name] = best / len(args) * 1e9
+    return out
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--sessions", type=int, default=10_000)
+    args = p.parse_args()
+
+    orders, attempts = _inputs(args.sessions)
+    print(f"세션 {args.sessions:,}개 (B/세션, 세션 상태 전체)")
+    print(f"  {'':<18} {'그대로':>8} {'줄인 뒤':>8}")
+    for name, build in STATES.items():
+        before = measure(build, orders, attempts, compacted=False)
+        after = measure(build, orders, attempts, compacted=True)
+        print(f"  {name:<18} {before:>8,.0f} {after:>8,.0f}  ({before - after:>+6,.0f} B, "
+              f"{(1 - after / before) * 100:.0f}% 감소)")
+    print("변환 비용")
+    for name, ns in conversion_ns(orders[:2000], attempts[:2000]).items():
+        print(f"  {name:<14} {ns:>8,.0f} ns")
+
+if __name__ == "__main__":
+    main()
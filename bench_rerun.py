@@ -0,0 +1,73 @@
+# bench_rerun.py
+# 주문 화면 rerun 비용 측정 (서버 쪽 스크립트 실행 시간 + 화면 요소(delta) 수)
+# 실행: python bench_rerun.py [--reruns 50]
+# Streamlit AppTest 로 ex1.py(라운드 진행 중)와 test.py(Step 1 주문 확인)를 반복 rerun 한다.
+
+import argparse
+import statistics
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from core import Attempt, OrderGenerator
+from timer import start_round
+
+def count_elements(node) -> int:
+    """블록 포함 화면 요소 수 (= 브라우저로 가는 delta 메시지 수와 거의 같음)"""
+    children = getattr(node, "children", None)
+    if not children:
+        return 1
+    return 1 + sum(count_elements(c) for c in children.values())
+
+def _fixed_order(mode: str):
+    return OrderGenerator(mode, seed=42).order("보통")
+
+def setup_ex1() -> AppTest:
+    at = AppTest.from_file("ex1.py", default_timeout=30)
+    order = _fixed_order("round")
+    at.session_state["started"] = True
+    at.session_state["order"] = order
+    at.session_state["round"] = 1
+    at.session_state["time_limit"] = 120
+    at.session_state["live"] = start_round(order, 120, "round", Attempt([], order.pleats_min, order.method, 7.0))
+    return at
+
+def setup_step1() -> AppTest:
+    at = AppTest.from_file("test.py", default_timeout=30)
+    at.session_state["step"] = 1
+    at.session_state["order"] = _fixed_order("step")
+    return at
+
+SCREENS = {
+    "ex1: 라운드 진행": setup_ex1,
+    "test: Step 1 주문": setup_step1,
+}
+
+def measure(setup, reruns: int) -> dict:
+    at = setup()
+    at.run()                    # 첫 실행(모듈 import 등)은 제외
+    times = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - t0) * 1000)
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return {
+        "p50_ms": statistics.median(times),
+        "mean_ms": statistics.fmean(times),
+        "elements": count_elements(at.main) + count_elements(at.sidebar),
+        "markdown": len(at.markdown),
+    }
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--reruns", type=int, default=50)
+    args = p.parse_args()
+    for name, setup in SCREENS.items():
+        r = measure(setup, args.reruns)
+        print(f"{name:<16} rerun p50 {r['p50_ms']:.2f}ms  mean {r['mean_ms']:.2f}ms  "
+              f"elements {r['elements']}  markdown {r['markdown']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+# cli.py
+# 터미널 플레이 (Streamlit 없음, 브라우저 없는 키오스크/QA 장비용)
+# 실행: python cli.py                                # 스텝 모드 (test.py 와 같은 5단계)
+#       python cli.py --mode round                   # 라운드 모드 (ex1.py 처럼 라운드 반복)
+#       python cli.py --script play.txt --seed 1 --json   # 기록된 입력으로 끝까지 자동 진행 (E2E 테스트용)
+# 제한 시간은 앱과 같은 timer.start_round 서버 마감: 입력을 기다리는 동안 남은 시간을 1초마다 다시 그리고,
+# 마감되면 그때까지 입력한 값으로 자동 채점된다.
+# 스크립트 파일은 사람이 치는 입력을 한 줄씩 ('#' 주석/빈 줄 무시). '@timeout' 줄은 그 자리에서 시간이 다 된 것으로 친다.
+# 빈 입력은 스크립트에선 '-' 로 쓴다 (재료 없음 / 기본값 그대로).
+
+import time
+
+_T0 = time.perf_counter()   # --startup: 여기서부터 첫 화면까지 (import 포함)
+
+import argparse
+import json
+import math
+import os
+import sys
+
+from core import COOK_METHODS, DIFFICULTIES, Attempt, OrderGenerator, boss_comment, get_time_limit
+from messages import message
+from orderspace import order_from_code, share_code
+from render import COOK_EMOJI, card_fields
+from rules import GAME_MODES
+from timer import start_round
+
+try:
+    import select
+    _CAN_SELECT = os.name != "nt"      # 윈도우 콘솔 stdin 은 select 불가 → 마감은 입력 후에 확인
+except ImportError:
+    _CAN_SELECT = False
+
+# ---------- 입력 ----------
+class TerminalInput:
+    """사람 입력. 마감이 걸린 질문은 남은 시간을 다시 그리며 기다리다가 마감되면 None"""
+    strict = False
+
+    def __init__(self, out):
+        self.out = out
+
+    def pause(self, prompt: str):
+        input(prompt)
+
+    def ask(self, prompt: str, live=None):
+        if live is None or not _CAN_SELECT or not sys.stdin.isatty():
+            line = input(prompt)
+            return None if live is not None and live.result is not None else line.strip()
+        while True:
+            sys.stdout.write(f"\r⏱️ {math.ceil(live.remaining()):>3}초 | {prompt}")
+            sys.stdout.flush()
+            ready, _, _ = select.select([sys.stdin], [], [], min(1.0, max(0.05, live.remaining())))
+            if live.result is not None:      # 서버 마감이 먼저 (입력 중이던 줄은 버림)
+                sys.stdout.write("\n")
+                return None
+            if ready:
+                line = sys.stdin.readline()
+                if not line:
+                    raise EOFError
+                return line.strip()
+
+class ScriptInput:
+    """기록된 입력 재생 (기다리지 않음). 입력이 틀리면 바로 실패"""
+    strict = True
+
+    def __init__(self, lines, out):
+        self.lines = iter([l.strip() for l in lines if l.strip() and not l.lstrip().startswith("#")])
+        self.out = out
+
+    def pause(self, prompt: str):
+        pass
+
+    def ask(self, prompt: str, live=None):
+        line = next(self.lines, None)
+        if line is None:
+            raise EOFError
+        self.out(f"{prompt}{line}")
+        if line == "@timeout":
+            if live is not None:
+                live.expire()           # 마감 시각에 스케줄러가 하는 것과 같은 처리
+                live.cancel()
+            return None
+        return "" if line == "-" else line
+
+def ask_value(inp, prompt: str, parse, live=None):
+    """파싱될 때까지 묻기. 마감이면 None. 스크립트 입력이 틀리면 ValueError"""
+    while True:
+        line = inp.ask(prompt, live)
+        if line is None:
+            return None
+        try:
+            return parse(line)
+        except ValueError as e:
+            if inp.strict:
+                raise ValueError(f"{prompt.strip()} {line!r}: {e}") from None
+            inp.out(f"  ⚠️ {e}")
+
+# ---------- 입력 해석 ----------
+def _pick(options: list, line: str):
+    # 번호(1부터) 또는 이름
+    if line.isdigit() and 1 <= int(line) <= len(options):
+        return options[int(line) - 1]
+    if line in options:
+        return line
+    raise ValueError(f"{', '.join(f'{i}={o}' for i, o in enumerate(options, 1))} 중에서 골라 주세요")
+
+def parse_difficulty(line: str) -> str:
+    return _pick(DIFFICULTIES, line)
+
+def ingredient_parser(all_ing: list):
+    def parse(line: str) -> list:
+        picked = []
+        for tok in line.replace(",", " ").split():
+            ing = _pick(all_ing, tok)
+            if ing not in picked:
+                picked.append(ing)
+        return picked
+    return parse
+
+def default_parser(parse, default):
+    # 빈 입력 = 기본값 (앱의 위젯 초깃값과 같음)
+    return lambda line: default if line == "" else parse(line)
+
+def parse_pleats(line: str) -> int:
+    n = int(line)
+    if not 4 <= n <= 16:
+        raise ValueError("주름 수는 4~16")
+    return n
+
+def parse_method(line: str) -> str:
+    return _pick(COOK_METHODS, line)
+
+def parse_cook_time(line: str) -> float:
+    t = float(line)
+    if not 2.0 <= t <= 12.0 or t * 2 != int(t * 2):
+        raise ValueError("조리 시간은 2.0~12.0분, 0.5 단위")
+    return t
+
+# ---------- 화면 ----------
+def order_text(order, mode: str) -> str:
+    emoji = GAME_MODES[mode]["ing_emoji"]
+    ings = lambda names: ", ".join(f"{emoji[i]} {i}" for i in names)
+    lines = [
+        f"  메인 단백질: {emoji[order.required_protein]} {order.required_protein}",
+        f"  필수 재료  : {ings(order.must_have)}",
+        f"  선호 믹스  : {ings(order.optional_mixes)}",
+    ]
+    if "avoid" in card_fields(mode):     # 화면 카드와 같게 (라운드 모드는 회피 재료를 안 보여준다)
+        lines.append(f"  회피 재료  : {ings(order.avoid)}")
+    lines += [
+        f"  주름 수    : {order.pleats_min} ~ {order.pleats_max}개",
+        f"  조리법     : {COOK_EMOJI[order.method]} {order.method}",
+        f"  시간       : {order.time_target[0]}~{order.time_target[1]}분",
+        f"  사장님 메모: {order.note}",
+    ]
+    return "\n".join(lines)
+
+def ingredient_menu(all_ing: list, emoji: dict) -> str:
+    return "  " + "  ".join(f"{i}.{emoji[x]} {x}" for i, x in enumerate(all_ing, 1))
+
+# ---------- 게임 ----------
+class Game:
+    def __init__(self, args, inp, out):
+        self.args, self.inp, self.out = args, inp, out
+        self.mode = args.mode
+        self.gen = OrderGenerator(self.mode, args.seed)
+        self.emoji = GAME_MODES[self.mode]["ing_emoji"]
+        self.all_ing = list(self.emoji)
+        self.round = 0
+        self.total = 0
+        self.live = None
+        self.on_finish = None
+        if args.record:
+            # 기록할 때만 import (eventlog 는 numpy 를 끌고 와서 시작이 느려진다)
+            from eventlog import get_event_log, new_session_id
+            from leaderboard import get_leaderboard
+            sid = new_session_id()
+            def on_finish(live, difficulty, round_no):
+                pts, _, timed_out = live.result
+                get_leaderboard().record(args.name, self.mode, difficulty, round_no, pts, timed_out)
+                get_event_log().log_result(sid, self.mode, difficulty, live.order, live.attempt, pts, timed_out)
+            self.on_finish = on_finish
+
+    def next_order(self, difficulty: str):
+        if self.args.code and self.round == 0:
+            difficulty, order = order_from_code(self.args.code, self.mode)
+            return difficulty, order
+        return difficulty, self.gen.order(difficulty)
+
+    def play_round(self, difficulty: str, order, time_limit: float) -> tuple:
+        """입력 받기 → 제출(또는 마감) → (점수, ScoreResult, 시간 초과)"""
+        self.round += 1
+        round_no = self.round
+        ask, inp = ask_value, self.inp
+        pleats, method, cook_time = order.pleats_min, order.method, round(sum(order.time_target) / 2, 1)
+        hook = (lambda live: self.on_finish(live, difficulty, round_no)) if self.on_finish else None
+        live = self.live = start_round(order, time_limit, self.mode, Attempt([], pleats, method, cook_time), on_finish=hook)
+
+        if self.mode == "step":
+            self.out("\n🥢 Step 2. 속 재료 (번호/이름, 띄어쓰기로 여러 개)")
+        self.out(ingredient_menu(self.all_ing, self.emoji))
+        fields = [
+            ("ingredients", "재료: ", ingredient_parser(self.all_ing)),
+            ("pleats", f"주름 수 [{pleats}]: ", default_parser(parse_pleats, pleats)),
+            ("method", f"조리법 1=찜 2=군만두 3=물만두 [{method}]: ", default_parser(parse_method, method)),
+            ("cook_time", f"조리 시간(분) [{cook_time}]: ", default_parser(parse_cook_time, cook_time)),
+        ]
+        values = {}
+        for field, prompt, parse in fields:
+            if self.mode == "step" and field == "pleats":
+                self.out("\n🔥 Step 3. 모양/조리 세팅")
+            value = ask(inp, prompt, parse, live)
+            if value is None:
+                break
+            values[field] = value
+            live.update(**{field: value})      # 마감되면 여기까지 입력한 값으로 채점
+        if live.result is None:
+            attempt = Attempt(values["ingredients"], values["pleats"], values["method"], values["cook_time"])
+            live.submit(attempt)
+        self.live = None
+        return live.result
+
+    def show_result(self, difficulty: str, order, result: tuple):
+        score, r, timed_out = result
+        self.total += score
+        reasons = r.reasons(self.mode)
+        if timed_out:
+            reasons = [message("timeout")] + reasons
+        if self.args.json:
+            a = r.attempt
+            print(json.dumps({
+                "mode": self.mode, "difficulty": difficulty, "round": self.round,
+                "code": share_code(order, self.mode, difficulty), "points": score, "timed_out": timed_out,
+                "attempt": {"ingredients": a.ingredients, "pleats": a.pleats, "method": a.method, "cook_time": a.cook_time},
+            }, ensure_ascii=False), flush=True)
+            return
+        self.out(f"\n📊 결과: {score}점" + ("  ⏰ 제한시간 초과" if timed_out else ""))
+        for line in reasons:
+            self.out("  • " + line)
+        self.out(f"👨‍🍳 사장님 한마디: {boss_comment(score)}")
+
+    def run_step(self):
+        """test.py 흐름: 난이도 → 주문 확인 → 재료 → 주름/조리 → 결과 → (다시 / 난이도 / 종료)"""
+        difficulty = self.args.difficulty
+        while True:
+            if difficulty is None:
+                self.out("\n난이도: " + "  ".join(f"{i}={d}({get_time_limit(d)}초)" for i, d in enumerate(DIFFICULTIES, 1)))
+                difficulty = ask_value(self.inp, "난이도: ", parse_difficulty)
+            difficulty, order = self.next_order(difficulty)
+            self.out(f"\n📋 오늘의 주문 (🔗 {share_code(order, self.mode, difficulty)})\n{order_text(order, self.mode)}")
+            self.inp.pause("엔터를 누르면 시작 ▶ ")
+            result = self.play_round(difficulty, order, get_time_limit(difficulty))
+            self.show_result(difficulty, order, result)
+            if self.args.rounds and self.round >= self.args.rounds:
+                return
+            again = ask_value(self.inp, "\nr=같은 난이도로 다시, d=난이도 다시 선택, q=종료: ",
+                              lambda s: _pick(["r", "d", "q"], s.lower() or "r"))
+            if again == "q":
+                return
+            if again == "d":
+                difficulty = None
+
+    def run_round(self):
+        """ex1.py 흐름: 라운드마다 새 주문, 총점 누적"""
+        difficulty = self.args.difficulty or "보통"
+        time_limit = self.args.time_limit or get_time_limit(difficulty, "round")
+        while True:
+            difficulty, order = self.next_order(difficulty)
+            self.out(f"\n=== 라운드 {self.round + 1} ({difficulty}, {time_limit}초) 🔗 {share_code(order, self.mode, difficulty)}")
+            self.out(order_text(order, self.mode))
+            result = self.play_round(difficulty, order, time_limit)
+            self.show_result(difficulty, order, result)
+            self.out(f"총 점수 {self.total} / 라운드 {self.round}")
+            if self.args.rounds and self.round >= self.args.rounds:
+                return
+            self.inp.pause("엔터: 다음 라운드 (Ctrl+D 종료) ")
+
+    def run(self):
+        try:
+            (self.run_step if self.mode == "step" else self.run_round)()
+        except (EOFError, KeyboardInterrupt):
+            if self.live is not None:
+                self.live.cancel()
+            self.out("")
+        self.out(f"\n🥟 끝! 라운드 {self.round}, 총 점수 {self.total}")
+
+def main():
+    p = argparse.ArgumentParser(description="고향만두 만들기 (터미널)")
+    p.add_argument("--mode", choices=list(GAME_MODES), default="step")
+    p.add_argument("--difficulty", choices=DIFFICULTIES, help="생략하면 물어본다 (라운드 모드는 보통)")
+    p.add_argument("--time-limit", type=float, help="라운드 모드 제한 시간(초)")
+    p.add_argument("--seed", type=int, help="주문 순서 고정")
+    p.add_argument("--code", help="첫 주문을 공유 코드로")
+    p.add_argument("--rounds", type=int, default=0, help="이 라운드 수만큼 하고 종료 (0=계속)")
+    p.add_argument("--script", help="입력 기록 파일 ('-' 면 stdin)")
+    p.add_argument("--json", action="store_true", help="라운드 결과를 JSON 한 줄씩만 출력")
+    p.add_argument("--record", action="store_true", help="랭킹/이벤트 로그에 기록")
+    p.add_argument("--name", default="터미널", help="랭킹 닉네임")
+    p.add_argument("--startup", action="store_true", help="첫 화면까지 걸린 시간 출력")
+    args = p.parse_args()
+
+    out = (lambda *a: None) if args.json else print
+    if args.script:
+        f = sys.stdin if args.script == "-" else open(args.script, encoding="utf-8")
+        with f:
+            inp = ScriptInput(f.readlines(), out)
+    else:
+        inp = TerminalInput(out)
+    if args.startup:
+        print(f"시작까지 {(time.perf_counter() - _T0) * 1000:.1f}ms (import 포함, 인터프리터 기동 제외)", file=sys.stderr)
+    out("🥟 고향만두 만들기 - " + ("스텝 모드" if args.mode == "step" else "라운드 모드"))
+    try:
+        Game(args, inp, out).run()
+    except ValueError as e:         # 스크립트 입력 오류
+        print(f"입력 오류: {e}", file=sys.stderr)
+        sys.exit(2)
+
+if __name__ == "__main__":
+    main()
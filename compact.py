@@ -0,0 +1,175 @@
+# compact.py
+# 세션에 오래 들고 있는 주문/시도를 작게 보관하는 버전 (Streamlit 없음, NumPy 없음)
+# 재료 목록은 비트마스크(core.ING_BIT) 정수 하나, 단백질/조리법은 코드, 메모/시간 범위는 공용 표의 번호.
+# 필드가 전부 작은 정수라서 세션마다 문자열/리스트를 따로 들고 있지 않는다.
+# 채점 결과(core.ScoreResult)도 주문/시도를 붙잡고 있으므로 같이 줄인다 (안 그러면 원래 Order 가 그대로 남음).
+#
+# 재료 목록은 마스크(어떤 재료) + 순열 번호(어떤 순서)로 보관한다. 화면에 나오는 순서까지 원래대로 돌아온다.
+# 순열 번호는 core.ALL_ING 순서로 정렬한 목록 기준의 Lehmer 코드 (이미 정렬돼 있으면 0).
+
+import threading
+from dataclasses import dataclass
+
+from core import ALL_ING, COOK_METHODS, METHOD_CODE, PROTEINS, Attempt, Order, ScoreResult, ing_mask, mask_to_ings
+from rules import ROUND_NOTES, STEP_NOTES
+
+_PROTEIN_CODE = {p: i for i, p in enumerate(PROTEINS)}
+_ING_INDEX = {ing: i for i, ing in enumerate(ALL_ING)}
+# 마스크 → 재료 튜플 (되돌릴 때 매번 비트를 훑지 않게)
+_MASK_INGS = [tuple(mask_to_ings(m)) for m in range(1 << len(ALL_ING))]
+
+def perm_rank(items) -> int:
+    """items 가 ALL_ING 순서로 정렬한 목록의 몇 번째 순열인지"""
+    idx = [_ING_INDEX[i] for i in items]
+    rank = 0
+    for pos, x in enumerate(idx):
+        rank = rank * (len(idx) - pos) + sum(1 for y in idx[pos + 1:] if y < x)
+    return rank
+
+def perm_items(mask: int, rank: int) -> list:
+    """perm_rank 의 반대: 마스크의 재료를 rank 번째 순서로"""
+    items = list(_MASK_INGS[mask])
+    if not rank:
+        return items
+    digits = []
+    for base in range(1, len(items) + 1):
+        rank, d = divmod(rank, base)
+        digits.append(d)
+    return [items.pop(d) for d in reversed(digits)]
+
+class _InternTable:
+    """값 → 번호. 같은 값은 프로세스 안에서 한 번만 저장 (추가만 함)"""
+
+    def __init__(self, values=()):
+        self._values = []
+        self._ids = {}
+        self._lock = threading.Lock()
+        for v in values:
+            self.id(v)
+
+    def id(self, value) -> int:
+        i = self._ids.get(value)
+        if i is None:
+            with self._lock:
+                i = self._ids.get(value)
+                if i is None:
+                    i = len(self._values)
+                    self._values.append(value)
+                    self._ids[value] = i
+        return i
+
+    def __getitem__(self, i):
+        return self._values[i]
+
+    def __len__(self):
+        return len(self._values)
+
+NOTES = _InternTable(ROUND_NOTES + STEP_NOTES)
+TIME_TARGETS = _InternTable()
+
+@dataclass(frozen=True, slots=True)
+class CompactOrder:
+    protein: int        # PROTEINS 번호
+    must: int           # 재료 비트마스크
+    mix: int
+    avoid: int
+    must_perm: int      # 목록 순서 (perm_rank)
+    mix_perm: int
+    avoid_perm: int
+    pleats_min: int
+    pleats_max: int
+    method: int         # COOK_METHODS 번호
+    time_id: int        # TIME_TARGETS 번호
+    note_id: int        # NOTES 번호
+
+    @classmethod
+    def from_order(cls, o: Order) -> "CompactOrder":
+        return cls(
+            _PROTEIN_CODE[o.required_protein],
+            ing_mask(o.must_have), ing_mask(o.optional_mixes), ing_mask(o.avoid),
+            perm_rank(o.must_have), perm_rank(o.optional_mixes), perm_rank(o.avoid),
+            o.pleats_min, o.pleats_max, METHOD_CODE[o.method],
+            TIME_TARGETS.id(tuple(o.time_target)), NOTES.id(o.note),
+        )
+
+    def to_order(self) -> Order:
+        return Order(
+            required_protein=PROTEINS[self.protein],
+            must_have=perm_items(self.must, self.must_perm),
+            optional_mixes=perm_items(self.mix, self.mix_perm),
+            avoid=perm_items(self.avoid, self.avoid_perm),
+            pleats_min=self.pleats_min,
+            pleats_max=self.pleats_max,
+            method=COOK_METHODS[self.method],
+            time_target=TIME_TARGETS[self.time_id],
+            note=NOTES[self.note_id],
+        )
+
+@dataclass(frozen=True, slots=True)
+class CompactAttempt:
+    ings: int           # 재료 비트마스크
+    ings_perm: int      # 고른 순서 (perm_rank)
+    pleats: int
+    method: int         # COOK_METHODS 번호
+    cook_time: float
+
+    @classmethod
+    def from_attempt(cls, a: Attempt) -> "CompactAttempt":
+        return cls(ing_mask(a.ingredients), perm_rank(a.ingredients), a.pleats, METHOD_CODE[a.method], a.cook_time)
+
+    def to_attempt(self) -> Attempt:
+        return Attempt(perm_items(self.ings, self.ings_perm), self.pleats, COOK_METHODS[self.method], self.cook_time)
+
+@dataclass(frozen=True, slots=True)
+class CompactResult:
+    points: int
+    parts: tuple        # 항목별 가감점 (작은 정수라 그대로)
+    order: CompactOrder
+    attempt: CompactAttempt
+
+    @classmethod
+    def from_result(cls, r: ScoreResult) -> "CompactResult":
+        return cls(r.points, r.parts, CompactOrder.from_order(r.order), CompactAttempt.from_attempt(r.attempt))
+
+    def to_result(self) -> ScoreResult:
+        return ScoreResult(self.points, self.parts, self.order.to_order(), self.attempt.to_attempt())
+
+def compact(obj, memo: dict = None):
+    """Order/Attempt/ScoreResult → 작은 버전 (이미 작으면 그대로).
+    튜플은 안쪽까지 (세션의 (점수, ScoreResult, 시간 초과) 같은 값). 바꿀 게 없으면 같은 객체를 돌려준다.
+    memo: 여러 값을 줄일 때 같이 넘기면 같은 주문/시도 객체는 작은 버전 하나를 같이 쓴다 (ss.order 와 결과의 order 등)."""
+    if type(obj) is tuple:
+        small = tuple(compact(x, memo) for x in obj)
+        return obj if all(s is x for s, x in zip(small, obj)) else small
+    if not isinstance(obj, (Order, Attempt, ScoreResult)):
+        return obj
+    if memo is not None and id(obj) in memo:
+        return memo[id(obj)][1]
+    if isinstance(obj, Order):
+        small = CompactOrder.from_order(obj)
+    elif isinstance(obj, Attempt):
+        small = CompactAttempt.from_attempt(obj)
+    else:
+        small = CompactResult(obj.points, obj.parts, compact(obj.order, memo), compact(obj.attempt, memo))
+    if memo is not None:
+        memo[id(obj)] = (obj, small)    # 원래 객체도 들고 있어서 그동안 id 가 재사용되지 않는다
+    return small
+
+def expand(obj, memo: dict = None):
+    """작은 버전 → Order/Attempt/ScoreResult (이미 원래 것이면 같은 객체 그대로). memo 는 compact 와 같은 뜻"""
+    if type(obj) is tuple:
+        big = tuple(expand(x, memo) for x in obj)
+        return obj if all(b is x for b, x in zip(big, obj)) else big
+    if not isinstance(obj, (CompactOrder, CompactAttempt, CompactResult)):
+        return obj
+    if memo is not None and id(obj) in memo:
+        return memo[id(obj)][1]
+    if isinstance(obj, CompactOrder):
+        big = obj.to_order()
+    elif isinstance(obj, CompactAttempt):
+        big = obj.to_attempt()
+    else:
+        big = ScoreResult(obj.points, obj.parts, expand(obj.order, memo), expand(obj.attempt, memo))
+    if memo is not None:
+        memo[id(obj)] = (obj, big)
+    return big
@@ -0,0 +1,329 @@
+# core.py
+# 고향만두 게임 핵심 로직 (Streamlit 없음)
+# 주문 생성 / 채점 / 보스 멘트만 담고 있어서 워커, 테스트, 스크립트에서 바로 import 가능.
+# UI(ex1.py, test.py)는 여기서 가져다 쓴다.
+
+import random
+import time
+from dataclasses import dataclass
+
+from messages import render_parts, render_source
+from rules import GAME_MODES
+
+# ---------- 게임 데이터 ----------
+ALL_ING = ["돼지고기", "닭고기", "새우", "두부", "부추", "양파", "마늘", "김치", "당면", "표고", "당근"]
+PROTEINS = ["돼지고기", "닭고기", "새우", "두부"]
+COOK_METHODS = ["찜", "군만두", "물만두"]
+DIFFICULTIES = ["쉬움", "보통", "어려움"]
+
+# 재료 집합 비트 인코딩: 비트 위치 = ALL_ING 순서 (앱마다 표시 순서가 달라도 같은 집합)
+ING_BIT = {name: 1 << i for i, name in enumerate(ALL_ING)}
+METHOD_CODE = {m: i for i, m in enumerate(COOK_METHODS)}
+
+def ing_mask(ingredients) -> int:
+    mask = 0
+    for i in ingredients:
+        mask |= ING_BIT[i]
+    return mask
+
+def mask_to_ings(mask: int) -> list:
+    return [name for name in ALL_ING if mask & ING_BIT[name]]
+
+@dataclass
+class Order:  # 손님 주문(요구사항)
+    required_protein: str
+    must_have: list         # 반드시 포함
+    optional_mixes: list    # 섞으면 가산점
+    avoid: list             # 넣으면 감점
+    pleats_min: int
+    pleats_max: int
+    method: str
+    time_target: tuple      # (min, max) 분 단위
+    note: str               # 특이사항/힌트
+
+@dataclass
+class Attempt:  # 플레이어 선택(결과 평가용)
+    ingredients: list
+    pleats: int
+    method: str
+    cook_time: float
+
+# ---------- 난이도/타이머 ----------
+def get_time_limit(difficulty: str, mode: str = "step") -> int:
+    # 라운드 제한 시간(초). 스텝 모드: 쉬움 30초, 보통 20초, 어려움 12초
+    return GAME_MODES[mode]["time_limit"][difficulty]
+
+def method_time_range(method: str, difficulty: str, mode: str = "step"):
+    # 난이도에 따라 허용 범위를 조금 타이트하게 (기본 범위/배율은 rules.GAME_MODES[mode])
+    rules = GAME_MODES[mode]
+    base = rules["times"][method]
+    tighten = rules["time_tighten"][difficulty]
+    span = (base[1] - base[0]) * tighten
+    mid = (base[0] + base[1]) / 2
+    return (round(mid - span/2, 1), round(mid + span/2, 1))
+
+# ---------- 주문 생성 ----------
+# 모드별 주문 규칙은 rules.GAME_MODES (라운드 모드 ex1.py / 스텝 모드 test.py)
+
+# 단백질별 나머지 재료 풀 (매번 새로 만들지 않게)
+_POOLS = {p: [i for i in ALL_ING if i != p] for p in PROTEINS}
+
+class OrderGenerator:
+    """자기만의 random.Random 스트림을 가진 주문 생성기.
+
+    같은 seed 면 같은 주문 순서가 나온다 (리플레이/시뮬레이션용).
+    전역 random 을 건드리지 않아서 세션마다 하나씩 가져도 서로 간섭하지 않는다.
+    """
+
+    def __init__(self, mode: str = "step", seed=None):
+        self.mode = mode
+        self.rules = GAME_MODES[mode]
+        self.rng = random.Random()
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        # seed 가 없으면 현재 시각으로 (기존 동작과 같은 '매번 다른' 주문)
+        self.initial_seed = time.time_ns() if seed is None else seed
+        self.rng.seed(self.initial_seed)
+
+    def order(self, difficulty: str) -> Order:
+        return self.orders(1, difficulty)[0]
+
+    def orders(self, n: int, difficulty: str) -> list:
+        """주문 n개를 한 번에 생성 (order() 를 n번 부른 것과 같은 결과)"""
+        rng = self.rng
+        choice, sample = rng.choice, rng.sample
+        must_n = self.rules["must_n"][difficulty]
+        pleats_min, pleats_max = self.rules["pleats"][difficulty]
+        notes = self.rules["notes"]
+        times = {m: method_time_range(m, difficulty, self.mode) for m in COOK_METHODS}
+
+        out = []
+        for _ in range(n):
+            protein = choice(PROTEINS)
+            method = choice(COOK_METHODS)
+
+            # 필수/회피/선호 재료 생성
+            pool = _POOLS[protein]
+            must_have = sample(pool, must_n)
+            rest = [i for i in pool if i not in must_have]
+            avoid = sample(rest, 1)
+            optional_mixes = sample([i for i in rest if i != avoid[0]], 2)
+
+            out.append(Order(
+                required_protein=protein,
+                must_have=must_have,
+                optional_mixes=optional_mixes,
+                avoid=avoid,
+                pleats_min=pleats_min,
+                pleats_max=pleats_max,
+                method=method,
+                time_target=times[method],
+                note=choice(notes)
+            ))
+        return out
+
+_DEFAULT_GEN = {mode: OrderGenerator(mode) for mode in GAME_MODES}
+
+def generate_orders(n: int, difficulty: str, seed=None, mode: str = "step") -> list:
+    """주문 n개 일괄 생성. seed 를 주면 항상 같은 주문들이 나온다."""
+    if seed is None:
+        return _DEFAULT_GEN[mode].orders(n, difficulty)
+    return OrderGenerator(mode, seed).orders(n, difficulty)
+
+def new_order(difficulty: str, gen: OrderGenerator = None) -> Order:
+    """라운드 모드(ex1.py) 주문: 필수 재료 2개, 주름 범위 고정표"""
+    return (gen or _DEFAULT_GEN["round"]).order(difficulty)
+
+def generate_order(difficulty: str, gen: OrderGenerator = None) -> Order:
+    """스텝 모드(test.py) 주문: 난이도별 필수 재료 수, 주름 범위(높을수록 빡빡)"""
+    return (gen or _DEFAULT_GEN["step"]).order(difficulty)
+
+# ---------- 채점 ----------
+# evaluate 는 항목별 가감점 숫자만 계산하고, 항목 상세(Check)와 문구는 보여줄 때 만든다.
+# 점수만 필요한 곳(일괄 채점, 시뮬레이션, 랭킹)은 리스트/문자열을 만들 일이 없다.
+CRITERIA = ("protein", "must", "avoid", "mix", "pleats", "method", "time")
+
+@dataclass(slots=True)
+class Check:  # 채점 항목 하나
+    criterion: str          # CRITERIA 중 하나
+    ok: bool                # 통과(만점) 여부. mix 는 하나라도 넣었는지
+    points: int             # 이 항목 가감점 (감점이면 음수)
+    detail: tuple           # 문구용 값 (시도 값, 요구 값, 감점 ...)
+
+@dataclass(slots=True)
+class ScoreResult:
+    points: int             # 0~100 보정 후 점수
+    parts: tuple            # 항목별 가감점 (CRITERIA 순서)
+    order: Order
+    attempt: Attempt
+
+    @property
+    def checks(self) -> list:
+        return _checks(self.order, self.attempt, self.parts)
+
+    def reasons(self, mode: str = "step", lang: str = "ko") -> list:
+        return render_parts(self.order, self.attempt, self.parts, mode, lang)
+
+# 항목별 점수 식. 가중치는 {이름} 자리에 상수로 박고, 입력은 ings(재료 set) / a_pleats / a_method / a_time (+ tmin, tmax)
+_PART_EXPR = {
+    "protein": "{protein} if order.required_protein in ings else 0",
+    "must": "{must} * len(ings.intersection(order.must_have))",
+    "avoid": "{avoid} * len(ings.intersection(order.avoid))",
+    "mix": "{mix} * len(ings.intersection(order.optional_mixes))",
+    # 범위 밖이면 오차당 감점 (상한까지)
+    "pleats": ("{pleats_ok} if order.pleats_min <= a_pleats <= order.pleats_max else "
+               "-min({pleats_cap}, {pleats_slope} * min(abs(a_pleats - order.pleats_min), abs(a_pleats - order.pleats_max)))"),
+    "method": "{method_ok} if a_method == order.method else {method_miss}",
+    "time": ("{time_ok} if tmin <= a_time <= tmax else "
+             "-min({time_cap}, round(min(abs(a_time - tmin), abs(a_time - tmax)) * {time_slope}))"),
+}
+
+# 모드 설정의 가중치를 상수로 박아 넣은 채점 함수 소스 (compile_scorer 가 모드마다 한 번 컴파일)
+_SCORER_SRC = """
+def evaluate(order, a):
+    ings = set(a.ingredients)
+    a_pleats, a_method, a_time = a.pleats, a.method, a.cook_time
+    tmin, tmax = order.time_target
+
+    # 1) 메인 단백질  2) 필수 재료  3) 회피 재료  4) 선호 믹스
+    protein = {protein}
+    must = {must}
+    avoid = {avoid}
+    mix = {mix}
+    # 5) 주름 수  6) 조리법  7) 시간
+    pleats = {pleats}
+    method = {method}
+    time_ = {time}
+
+    # 보정
+    total = protein + must + avoid + mix + pleats + method + time_
+    return ScoreResult(max({total_min}, min({total_max}, total)), (protein, must, avoid, mix, pleats, method, time_), order, a)
+"""
+
+# 입력 하나만 바뀌었을 때 그 항목만 다시 매기는 함수들 (preview 용). 식은 evaluate 와 같은 _PART_EXPR
+_PARTS_SRC = """
+def ingredient(order, ing):
+    # 재료 하나를 넣었을 때 바뀌는 점수 (1~4 는 재료마다 독립)
+    ings = {{ing}}
+    return ({protein}) + ({must}) + ({avoid}) + ({mix})
+
+def pleats(order, a_pleats):
+    return {pleats}
+
+def method(order, a_method):
+    return {method}
+
+def time(order, a_time):
+    tmin, tmax = order.time_target
+    return {time}
+"""
+
+def _part_exprs(weights: dict) -> dict:
+    return {name: expr.format(**weights) for name, expr in _PART_EXPR.items()}
+
+def compile_scorer(weights: dict, name: str = "custom"):
+    """가중치 설정 → evaluate(order, attempt) 함수. 가중치가 코드 상수라 직접 짠 함수와 같은 속도"""
+    ns = {"ScoreResult": ScoreResult}
+    src = _SCORER_SRC.format(**_part_exprs(weights), total_min=weights["total_min"], total_max=weights["total_max"])
+    exec(compile(src, f"<scorer:{name}>", "exec"), ns)
+    return ns["evaluate"]
+
+def compile_part_scorers(weights: dict, name: str = "custom") -> dict:
+    """항목별 함수 {"ingredient", "pleats", "method", "time"}. 합치면 evaluate 의 보정 전 점수와 같다"""
+    ns = {}
+    exec(compile(_PARTS_SRC.format(**_part_exprs(weights)), f"<parts:{name}>", "exec"), ns)
+    return {k: ns[k] for k in ("ingredient", "pleats", "method", "time")}
+
+SCORERS = {mode: compile_scorer(cfg["score"], mode) for mode, cfg in GAME_MODES.items()}
+PART_SCORERS = {mode: compile_part_scorers(cfg["score"], mode) for mode, cfg in GAME_MODES.items()}
+
+def evaluate(order: Order, a: Attempt, mode: str = "step") -> ScoreResult:
+    """항목별 가감점 + 최종 점수 (문구 없음). 반복 호출이면 SCORERS[mode] 를 직접 써도 된다"""
+    return SCORERS[mode](order, a)
+
+def _checks(order: Order, a: Attempt, parts: tuple) -> list:
+    # evaluate 가 낸 숫자로 항목 상세 복원 (화면 표시할 때만). 통과 여부는 가중치와 무관하게 규칙으로 판정
+    protein, must, avoid, mix, pleats, method, time_ = parts
+    ings = a.ingredients
+    miss = [i for i in order.must_have if i not in ings]
+    avoid_hits = [i for i in order.avoid if i in ings]
+    mix_hits = [i for i in order.optional_mixes if i in ings]
+    tmin, tmax = order.time_target
+    return [
+        Check("protein", order.required_protein in ings, protein, (order.required_protein,)),
+        Check("must", not miss, must, (miss or order.must_have,)),
+        Check("avoid", not avoid_hits, avoid, (avoid_hits,)),
+        Check("mix", bool(mix_hits), mix, (mix_hits,)),
+        Check("pleats", order.pleats_min <= a.pleats <= order.pleats_max, pleats,
+              (a.pleats, order.pleats_min, order.pleats_max, -pleats)),
+        Check("method", a.method == order.method, method, (a.method, order.method)),
+        Check("time", tmin <= a.cook_time <= tmax, time_, (a.cook_time, tmin, tmax, -time_)),
+    ]
+
+# 점수 + 문구를 한 번에: 맞은/빠진 재료 목록을 한 번만 만들어 점수와 문구에 같이 쓴다 (예전 직접 짠 함수 모양)
+_SCORE_ATTEMPT_SRC = """
+def score_attempt(order, a):
+    ings = a.ingredients
+    miss = [i for i in order.must_have if i not in ings]
+    avoid_hits = [i for i in order.avoid if i in ings]
+    mix_hits = [i for i in order.optional_mixes if i in ings]
+    protein = {protein} if order.required_protein in ings else 0
+    must = {must} * (len(order.must_have) - len(miss))
+    avoid = {avoid} * len(avoid_hits)
+    mix = {mix} * len(mix_hits)
+    a_pleats, a_method, a_time = a.pleats, a.method, a.cook_time
+    tmin, tmax = order.time_target
+    pleats = {pleats_part}
+    method = {method_part}
+    time_ = {time_part}
+    total = protein + must + avoid + mix + pleats + method + time_
+"""
+
+_ATTEMPT_SCORERS = {}
+
+def compile_score_attempt(mode: str, lang: str = "ko"):
+    """모드/언어별 score_attempt(order, attempt) -> (점수, 문구 목록). 문구 코드는 messages 에서 받아 붙인다"""
+    fn = _ATTEMPT_SCORERS.get((mode, lang))
+    if fn is None:
+        body, ns = render_source(mode, lang)
+        w = GAME_MODES[mode]["score"]
+        e = _part_exprs(w)
+        src = (_SCORE_ATTEMPT_SRC.format(**w, pleats_part=e["pleats"], method_part=e["method"], time_part=e["time"]) + body
+               + f"    return max({w['total_min']}, min({w['total_max']}, total)), out\n")
+        ns = dict(ns)
+        exec(compile(src, f"<score_attempt:{mode}:{lang}>", "exec"), ns)
+        fn = _ATTEMPT_SCORERS[mode, lang] = ns["score_attempt"]
+    return fn
+
+def score_attempt(order: Order, a: Attempt, mode: str = "step"):
+    """(점수, 문구 목록). 문구가 바로 필요할 때만 (점수만 필요하면 evaluate(...).points)"""
+    return compile_score_attempt(mode)(order, a)
+
+# ---------- 보스 멘트 ----------
+def boss_comment(score: int) -> str:
+    if score >= 90:
+        lines = [
+            "이 정도면 만두 장인이다! 가게 인수해라~",
+            "만두 신 내렸냐? 내가 배워야겠다.",
+            "이 맛… 고향만두 광고 들어오겠다!"
+        ]
+    elif score >= 70:
+        lines = [
+            "오~ 손님들 좋아하시겠다. 근데 주름 좀 삐뚤다?",
+            "맛은 괜찮은데… 이게 만두냐, 송편이냐?",
+            "합격! 하지만 아직 사장님 손맛은 멀었다~"
+        ]
+    elif score >= 50:
+        lines = [
+            "속이 너무 꽉 찼어, 이러다 터진다!",
+            "만두는 만두인데… 정체가 애매하다?",
+            "반은 성공, 반은 실패야."
+        ]
+    else:
+        lines = [
+            "이게 만두냐 송편이냐 당장 그만둬라!!!",
+            "손님이 먹고 바로 도망가겠다!",
+            "오늘은… 네 도시락 내가 안 먹는다…"
+        ]
+    return random.choice(lines)
@@ -0,0 +1,40 @@
+# daily.py
+# 오늘의 챌린지: 날짜별로 정해진 주문 목록을 한 번만 만들어 모든 세션이 같이 쓴다.
+# 같은 날 같은 난이도면 누구나 같은 순서의 주문을 받는다 (라운드 번호로 꺼내 씀).
+
+import datetime
+import threading
+import zlib
+
+from core import Order, OrderGenerator
+
+DAILY_SIZE = 50     # 하루치 주문 수 (난이도별). 넘어가면 처음부터 다시
+
+_cache = {}         # (date, mode, difficulty) -> [Order, ...]
+_lock = threading.Lock()
+
+def daily_seed(day: datetime.date, mode: str, difficulty: str) -> int:
+    # 프로세스가 달라도 같은 값이 나오도록 hash() 대신 crc32
+    return zlib.crc32(f"{day.isoformat()}|{mode}|{difficulty}".encode())
+
+def daily_orders(mode: str, difficulty: str, day: datetime.date = None) -> list:
+    """그날의 주문 목록 (프로세스 전체에서 한 번만 생성, 날짜 바뀌면 예전 것은 버림)"""
+    day = day or datetime.date.today()
+    key = (day, mode, difficulty)
+    orders = _cache.get(key)
+    if orders is not None:
+        return orders
+    with _lock:
+        orders = _cache.get(key)
+        if orders is None:
+            orders = OrderGenerator(mode, daily_seed(day, mode, difficulty)).orders(DAILY_SIZE, difficulty)
+            # 지난 날짜 캐시 정리
+            for old in [k for k in _cache if k[0] < day]:
+                del _cache[old]
+            _cache[key] = orders
+    return orders
+
+def daily_order(index: int, mode: str, difficulty: str, day: datetime.date = None) -> Order:
+    """index 번째 챌린지 주문. 여러 세션이 같은 객체를 공유하니 수정하지 말 것."""
+    orders = daily_orders(mode, difficulty, day)
+    return orders[index % len(orders)]
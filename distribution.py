@@ -0,0 +1,71 @@
+# distribution.py
+# 주문별 "아무렇게나 만들었을 때" 점수 분포 → 백분위 (몇 % 조합보다 잘 만들었나)
+# 시도 공간은 solver 와 같은 입력 격자: 재료 부분집합(2^11) x 주름(4~16) x 조리법 x 조리 시간(2.0~12.0, 0.5 단위).
+# 항목 점수가 축마다 독립이라, 축별 점수 히스토그램을 np.convolve 로 합친 뒤 0~100 으로 보정한다 (전수 조사 없음).
+# 분포는 주문 서명(solver.order_signature) + 모드별로 LRU 캐시, 조회는 누적표 인덱싱 한 번.
+
+from functools import lru_cache
+
+import numpy as np
+
+import batch_score as bs
+from solver import COOK_TIMES, MASKS, METHODS, PLEATS, order_signature
+
+CACHE_SIZE = 256
+
+def _hist(values) -> tuple:
+    """정수 점수 배열 → (최솟값, 개수 배열)"""
+    values = np.asarray(values, dtype=np.int64)
+    lo = int(values.min())
+    return lo, np.bincount(values - lo)
+
+def _convolve(a: tuple, b: tuple) -> tuple:
+    return a[0] + b[0], np.convolve(a[1], b[1])
+
+class ScoreDistribution:
+    """한 주문에 대한 전체 시도 공간의 점수 분포"""
+
+    def __init__(self, sig: tuple, mode: str = "step"):
+        protein, must, avoid, mix, pmin, pmax, method, (tmin, tmax) = sig
+        t = bs.TABLES[mode]
+        lo_total, hi_total = t["w"]["total_min"], t["w"]["total_max"]
+
+        # 축별 점수 히스토그램
+        ing = _hist(bs.protein_points(protein, MASKS, t) + bs.must_points(must, MASKS, t)
+                    + bs.avoid_points(avoid, MASKS, t) + bs.mix_points(mix, MASKS, t))
+        pleat = _hist(bs.pleat_points(pmin, pmax, PLEATS, t))
+        meth = _hist(bs.method_points(method, METHODS, t))
+        tm = _hist(bs.time_points(tmin, tmax, COOK_TIMES, t))
+
+        # 합 = 히스토그램의 합성곱
+        lo, raw = _convolve(_convolve(ing, pleat), _convolve(meth, tm))
+
+        # 보정(0~100): 범위 밖 개수는 양 끝으로
+        scores = np.arange(lo, lo + len(raw))
+        counts = np.zeros(hi_total - lo_total + 1, dtype=np.int64)
+        np.add.at(counts, np.clip(scores, lo_total, hi_total) - lo_total, raw)
+        self.min_score = lo_total
+        self.counts = counts                                # counts[s - min_score] = 점수 s 인 조합 수
+        self.total = int(counts.sum())
+        self.below = np.concatenate(([0], np.cumsum(counts)))  # below[i] = 점수 < min_score + i 인 조합 수
+
+    def percentile(self, points: int) -> float:
+        """이 점수보다 낮은 조합 비율(%)"""
+        i = min(max(points - self.min_score, 0), len(self.counts))
+        return 100.0 * int(self.below[i]) / self.total
+
+    def mean(self) -> float:
+        return float(np.dot(np.arange(self.min_score, self.min_score + len(self.counts)), self.counts) / self.total)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _distribution_for(sig: tuple, mode: str) -> ScoreDistribution:
+    return ScoreDistribution(sig, mode)
+
+def score_distribution(order, mode: str = "step") -> ScoreDistribution:
+    return _distribution_for(order_signature(order), mode)
+
+def percentile(order, points: int, mode: str = "step") -> float:
+    return score_distribution(order, mode).percentile(points)
+
+def cache_info():
+    return _distribution_for.cache_info()
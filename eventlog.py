@@ -0,0 +1,227 @@
+# eventlog.py
+# 라운드 이벤트 로그 (추가만 하는 길이-접두 바이너리 레코드, 크기 기준 파일 회전)
+# 주문 발급 / 스텝 이동 / 위젯 수정 / 최종 시도+점수를 남겨서 나중에 그대로 재생(replay.py)할 수 있다.
+# 기록은 큐에 넣기만 하고, 백그라운드 스레드가 버퍼링해서 파일에 쓴다.
+#
+# 레코드 형식 (little-endian):
+#   u32 길이(이후 바이트 수) | u8 종류 | f64 시각(unix) | u64 세션 id | 본문
+#   ORDER, EDIT 본문: UTF-8 JSON
+#   STEP   본문: i8 이전 스텝, i8 다음 스텝
+#   RESULT 본문: _RESULT 구조체 (재료는 batch_score 비트마스크)
+
+import atexit
+import glob
+import json
+import os
+import queue
+import secrets
+import struct
+import sys
+import threading
+import time
+from dataclasses import asdict
+
+import numpy as np
+
+from core import COOK_METHODS, DIFFICULTIES, ING_BIT, METHOD_CODE, PROTEINS, Attempt, Order, ing_mask, mask_to_ings
+from rules import GAME_MODES
+
+LOG_DIR = os.environ.get("MANDU_LOG_DIR", "logs")
+MAX_FILE_BYTES = 64 * 1024 * 1024
+
+ORDER, STEP, EDIT, RESULT = 1, 2, 3, 4
+MODES = list(GAME_MODES)      # 로그의 모드 번호 = GAME_MODES 순서 (새 모드는 뒤에 붙으니 옛 번호 그대로)
+
+_LEN = struct.Struct("<I")
+_HEAD = struct.Struct("<BdQ")
+_STEP = struct.Struct("<bb")
+# mode, difficulty, protein, must, avoid, mix, pmin, pmax, method, tmin, tmax,
+# ings, pleats, method, cook_time, points, timed_out
+_RESULT = struct.Struct("<BBBHHHBBBddHBBdBB")
+# 같은 구조를 NumPy 로 (RESULT 본문 여러 개를 이어 붙인 바이트를 한 번에 배열로)
+RESULT_DTYPE = np.dtype([
+    ("mode", "u1"), ("difficulty", "u1"), ("protein", "u1"),
+    ("must", "<u2"), ("avoid", "<u2"), ("mix", "<u2"),
+    ("pleats_min", "u1"), ("pleats_max", "u1"), ("method", "u1"),
+    ("tmin", "<f8"), ("tmax", "<f8"),
+    ("ings", "<u2"), ("pleats", "u1"), ("a_method", "u1"), ("cook_time", "<f8"),
+    ("points", "u1"), ("timed_out", "u1"),
+])
+assert RESULT_DTYPE.itemsize == _RESULT.size
+_PROTEIN_BIT = np.array([ING_BIT[p] for p in PROTEINS], dtype=np.int16)
+
+def new_session_id() -> int:
+    return secrets.randbits(63)
+
+# ---------- 인코딩 ----------
+def _frame(kind: int, sid: int, body: bytes, ts: float = None) -> bytes:
+    head = _HEAD.pack(kind, time.time() if ts is None else ts, sid)
+    return _LEN.pack(len(head) + len(body)) + head + body
+
+def encode_result(mode: str, difficulty: str, order: Order, a: Attempt, points: int, timed_out: bool) -> bytes:
+    return _RESULT.pack(
+        MODES.index(mode), DIFFICULTIES.index(difficulty), PROTEINS.index(order.required_protein),
+        ing_mask(order.must_have), ing_mask(order.avoid), ing_mask(order.optional_mixes),
+        order.pleats_min, order.pleats_max, METHOD_CODE[order.method],
+        order.time_target[0], order.time_target[1],
+        ing_mask(a.ingredients), a.pleats, METHOD_CODE[a.method], a.cook_time,
+        points, int(timed_out),
+    )
+
+def decode_result(body: bytes) -> dict:
+    (mode, diff, protein, must, avoid, mix, pmin, pmax, method, tmin, tmax,
+     ings, pleats, a_method, cook_time, points, timed_out) = _RESULT.unpack(body)
+    order = Order(
+        required_protein=PROTEINS[protein],
+        must_have=mask_to_ings(must),
+        optional_mixes=mask_to_ings(mix),
+        avoid=mask_to_ings(avoid),
+        pleats_min=pmin,
+        pleats_max=pmax,
+        method=COOK_METHODS[method],
+        time_target=(tmin, tmax),
+        note="",
+    )
+    attempt = Attempt(mask_to_ings(ings), pleats, COOK_METHODS[a_method], cook_time)
+    return {"mode": MODES[mode], "difficulty": DIFFICULTIES[diff], "order": order,
+            "attempt": attempt, "points": points, "timed_out": bool(timed_out)}
+
+def result_columns(arr: np.ndarray) -> tuple:
+    """RESULT_DTYPE 배열 → batch_score 용 (주문 열, 시도 열). 부호 있는 정수로 바꿔서 뺄셈 안전하게"""
+    o = {
+        "protein": _PROTEIN_BIT[arr["protein"]],
+        "must": arr["must"].astype(np.int16),
+        "avoid": arr["avoid"].astype(np.int16),
+        "mix": arr["mix"].astype(np.int16),
+        "pleats_min": arr["pleats_min"].astype(np.int16),
+        "pleats_max": arr["pleats_max"].astype(np.int16),
+        "method": arr["method"].astype(np.int8),
+        "tmin": arr["tmin"],
+        "tmax": arr["tmax"],
+    }
+    a = {
+        "ings": arr["ings"].astype(np.int16),
+        "pleats": arr["pleats"].astype(np.int16),
+        "method": arr["a_method"].astype(np.int8),
+        "cook_time": arr["cook_time"],
+    }
+    return o, a
+
+def decode_body(kind: int, body: bytes):
+    if kind == RESULT:
+        return decode_result(body)
+    if kind == STEP:
+        return _STEP.unpack(body)
+    return json.loads(body)
+
+# ---------- 쓰기 ----------
+class EventLog:
+    def __init__(self, log_dir: str = LOG_DIR, max_bytes: int = MAX_FILE_BYTES, flush_secs: float = 0.5):
+        self.log_dir = log_dir
+        self.max_bytes = max_bytes
+        self.flush_secs = flush_secs
+        os.makedirs(log_dir, exist_ok=True)
+        self._queue = queue.Queue()
+        self._file = None
+        self._size = 0
+        self._seq = self._last_seq()
+        self._writer = threading.Thread(target=self._write_loop, name="eventlog-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+
+    def _last_seq(self) -> int:
+        files = log_files(self.log_dir)
+        return int(os.path.basename(files[-1])[7:13]) if files else 0
+
+    # 호출하는 쪽 (렌더 스레드): 인코딩만 하고 바로 반환
+    def log_order(self, sid: int, mode: str, difficulty: str, order: Order):
+        body = json.dumps({"mode": mode, "difficulty": difficulty, "order": asdict(order)},
+                          ensure_ascii=False, separators=(",", ":")).encode()
+        self._queue.put(_frame(ORDER, sid, body))
+
+    def log_step(self, sid: int, from_step: int, to_step: int):
+        self._queue.put(_frame(STEP, sid, _STEP.pack(from_step, to_step)))
+
+    def log_edit(self, sid: int, field: str, value):
+        body = json.dumps({"field": field, "value": value}, ensure_ascii=False, separators=(",", ":")).encode()
+        self._queue.put(_frame(EDIT, sid, body))
+
+    def log_result(self, sid: int, mode: str, difficulty: str, order: Order, attempt: Attempt,
+                   points: int, timed_out: bool):
+        self._queue.put(_frame(RESULT, sid, encode_result(mode, difficulty, order, attempt, points, timed_out)))
+
+    def flush(self):
+        """큐에 있는 레코드가 파일에 다 써질 때까지 대기"""
+        self._queue.join()
+
+    # 백그라운드 writer
+    def _open_next(self):
+        if self._file:
+            self._file.close()
+        self._seq += 1
+        path = os.path.join(self.log_dir, f"events-{self._seq:06d}.log")
+        self._file = open(path, "ab", buffering=1024 * 1024)
+        self._size = self._file.tell()
+
+    def _write_loop(self):
+        self._open_next()
+        while True:
+            try:
+                rec = self._queue.get(timeout=self.flush_secs)
+            except queue.Empty:
+                self._file.flush()      # 한가할 때 버퍼 비우기
+                continue
+            try:
+                if self._size + len(rec) > self.max_bytes and self._size:
+                    self._open_next()
+                self._file.write(rec)
+                self._size += len(rec)
+                if self._queue.empty():
+                    self._file.flush()
+            except OSError as e:
+                print(f"[eventlog] 기록 실패: {e}", file=sys.stderr)
+            finally:
+                self._queue.task_done()
+
+_instance = None
+_instance_lock = threading.Lock()
+
+def get_event_log() -> EventLog:
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = EventLog()
+    return _instance
+
+# ---------- 읽기 (스트리밍) ----------
+def log_files(log_dir: str = LOG_DIR) -> list:
+    return sorted(glob.glob(os.path.join(log_dir, "events-*.log")))
+
+def iter_file(path: str, offset: int = 0):
+    """파일 하나를 offset 부터: (kind, ts, sid, body bytes, 다음 레코드 offset)"""
+    with open(path, "rb", buffering=1024 * 1024) as f:
+        f.seek(offset)
+        while True:
+            head = f.read(_LEN.size)
+            if len(head) < _LEN.size:
+                break
+            (n,) = _LEN.unpack(head)
+            data = f.read(n)
+            if len(data) < n:       # 마지막 레코드가 쓰다 만 경우
+                break
+            offset += _LEN.size + n
+            kind, ts, sid = _HEAD.unpack_from(data)
+            yield kind, ts, sid, data[_HEAD.size:], offset
+
+def iter_raw(paths, kinds=None):
+    """(kind, ts, sid, body bytes) 를 파일 순서대로 하나씩. 파일 전체를 메모리에 올리지 않는다."""
+    for path in paths:
+        for kind, ts, sid, body, _ in iter_file(path):
+            if kinds is None or kind in kinds:
+                yield kind, ts, sid, body
+
+def iter_records(paths, kinds=None):
+    """(kind, ts, sid, 디코딩된 본문)"""
+    for kind, ts, sid, body in iter_raw(paths, kinds):
+        yield kind, ts, sid, decode_body(kind, body)
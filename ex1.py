@@ -2,345 +2,287 @@
 # 고향만두 만들기 게임 (Streamlit)
 # 실행: streamlit run app.py
 
-import random
+import math
 import time
-from dataclasses import dataclass, asdict
 import streamlit as st
 
-st.set_page_config(page_title="고향만두 만들기", page_icon="🥟", layout="wide")
-
-# ---------- 데이터 모델 ----------
-ING_EMOJI = {
-    "돼지고기": "🐖",
-    "닭고기": "🐓",
-    "새우": "🦐",
-    "두부": "🧀",  # 대체 아이콘
-    "부추": "🌿",
-    "양파": "🧅",
-    "마늘": "🧄",
-    "김치": "🥬",
-    "당면": "🍜",
-    "표고": "🍄",
-    "당근": "🥕",
-}
-COOK_EMOJI = {"찜": "🧺", "군만두": "🍳", "물만두": "🥘"}
-
-ALL_ING = list(ING_EMOJI.keys())
-PROTEINS = ["돼지고기", "닭고기", "새우", "두부"]
-COOK_METHODS = ["찜", "군만두", "물만두"]
-
-@dataclass
-class Order:  # 손님 주문(요구사항)
-    required_protein: str
-    optional_mixes: list
-    must_have: list         # 반드시 포함
-    avoid: list             # 넣으면 감점
-    pleats_min: int
-    pleats_max: int
-    method: str
-    time_target: tuple      # (min, max) 분 단위
-    note: str               # 특이사항/힌트
-
-@dataclass
-class Attempt:  # 플레이어 선택(결과 평가용)
-    ingredients: list
-    pleats: int
-    method: str
-    cook_time: float
-
-# ---------- 유틸 ----------
-def method_time_range(method: str, difficulty: str):
-    # 난이도에 따라 허용 범위를 조금 타이트하게
-    if method == "찜":
-        base = (7, 10)
-    elif method == "군만두":
-        base = (6, 8)
-    else:  # 물만두
-        base = (4, 6)
-    tighten = {"쉬움": 1.5, "보통": 1, "어려움": 0.5}[difficulty]
-    span = (base[1] - base[0]) * tighten
-    mid = sum(base)/2
-    return (round(mid - span/2, 1), round(mid + span/2, 1))
-
-def new_order(difficulty: str) -> Order:
-    random.seed(time.time_ns())
-    protein = random.choice(PROTEINS)
-    method = random.choice(COOK_METHODS)
-
-    # 필수/회피 재료 생성
-    pool = [i for i in ALL_ING if i != protein]
-    must_have = random.sample(pool, 2)
-    avoid = random.sample([i for i in pool if i not in must_have], 1)
-
-    # 선택(섞으면 가산점)
-    optional_mixes = random.sample([i for i in pool if i not in must_have + avoid], 2)
-
-    # 주름 조건
-    if difficulty == "쉬움":
-        pleats_min, pleats_max = 6, 8
-    elif difficulty == "보통":
-        pleats_min, pleats_max = 7, 10
-    else:
-        pleats_min, pleats_max = 8, 12
-
-    tmin, tmax = method_time_range(method, difficulty)
-    note = random.choice([
-        "속은 촉촉하게, 겉은 바삭하게!",
-        "향이 너무 강하면 안 좋아하세요.",
-        "식감 조화 중요! 너무 질기면 감점!",
-        "담백한 맛 선호.",
-        "매콤한 풍미 좋아하심.",
-    ])
-
-    return Order(
-        required_protein=protein,
-        optional_mixes=optional_mixes,
-        must_have=must_have,
-        avoid=avoid,
-        pleats_min=pleats_min,
-        pleats_max=pleats_max,
-        method=method,
-        time_target=(tmin, tmax),
-        note=note
-    )
+from core import COOK_METHODS, Order, Attempt, OrderGenerator, get_time_limit, new_order
+from daily import daily_order
+from eventlog import get_event_log, new_session_id
+from history import RoundHistory, history_panel
+from leaderboard import get_leaderboard
+from orderspace import order_from_code, share_code
+from render import ROUND_ING_EMOJI, order_card_html
+from preview import preview_enabled, session_preview
+from profiling import ENABLED as PROFILING, count, debug_panel, phase
+from sessions import touch as touch_session
+from timer import start_round
 
-def score_attempt(order: Order, attempt: Attempt):
-    points = 0
-    reasons = []
-
-    # 1) 단백질 정확도
-    if order.required_protein in attempt.ingredients:
-        points += 30
-        reasons.append(f"✅ 메인 단백질 일치: {order.required_protein}")
-    else:
-        reasons.append(f"❌ 메인 단백질 누락 (요구: {order.required_protein})")
+st.set_page_config(page_title="고향만두 만들기", page_icon="🥟", layout="wide")
 
-    # 2) 필수 재료
-    must_hits = [i for i in order.must_have if i in attempt.ingredients]
-    points += 10 * len(must_hits)
-    if len(must_hits) == len(order.must_have):
-        reasons.append(f"✅ 필수 재료 모두 포함: {', '.join(order.must_have)}")
-    else:
-        miss = [i for i in order.must_have if i not in attempt.ingredients]
-        reasons.append(f"❌ 필수 재료 누락: {', '.join(miss)}")
-
-    # 3) 회피 재료
-    avoid_hits = [i for i in order.avoid if i in attempt.ingredients]
-    points -= 15 * len(avoid_hits)
-    if avoid_hits:
-        reasons.append(f"⚠️ 회피 재료 포함: {', '.join(avoid_hits)}")
-
-    # 4) 선택 믹스(가산점)
-    mix_hits = [i for i in order.optional_mixes if i in attempt.ingredients]
-    points += 5 * len(mix_hits)
-    if mix_hits:
-        reasons.append(f"✨ 취향 저격 믹스 추가: {', '.join(mix_hits)}")
-
-    # 5) 주름 수
-    if order.pleats_min <= attempt.pleats <= order.pleats_max:
-        points += 20
-        reasons.append(f"✅ 주름 수 적정 ({attempt.pleats}개)")
-    else:
-        # 범위 밖이면 오차당 감점
-        diff = min(abs(attempt.pleats - order.pleats_min), abs(attempt.pleats - order.pleats_max))
-        penalty = min(20, diff * 4)
-        points -= penalty
-        reasons.append(f"⚠️ 주름 수 범위({order.pleats_min}~{order.pleats_max}) 벗어남: {attempt.pleats}개 (−{penalty}점)")
-
-    # 6) 조리법
-    if attempt.method == order.method:
-        points += 20
-        reasons.append(f"✅ 조리법 일치: {attempt.method}")
-    else:
-        points -= 10
-        reasons.append(f"❌ 조리법 불일치 (요구: {order.method})")
-
-    # 7) 시간
-    tmin, tmax = order.time_target
-    if tmin <= attempt.cook_time <= tmax:
-        points += 15
-        reasons.append(f"✅ 조리 시간 적정 ({attempt.cook_time}분)")
-    else:
-        off = min(abs(attempt.cook_time - tmin), abs(attempt.cook_time - tmax))
-        penalty = min(15, round(off * 5))
-        points -= penalty
-        reasons.append(f"⚠️ 시간 범위({tmin}~{tmax}분) 벗어남: {attempt.cook_time}분 (−{penalty}점)")
+# 버전 호환: 새 버전엔 experimental_rerun 이 없고, 부분 rerun(fragment)이 없으면 일반 함수로
+_RERUN = getattr(st, "rerun", None) or getattr(st, "experimental_rerun", None)
+_FRAGMENT = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
 
-    # 보정
-    points = max(0, min(100, points))
-    return points, reasons
+def safe_rerun():
+    if _RERUN:
+        count("rerun")
+        _RERUN()
 
-def pill(text):
-    return f"<span style='padding:4px 10px;border-radius:999px;background:#f1f5f9;border:1px solid #e2e8f0;font-size:0.9rem;'>{text}</span>"
+# ---------- 화면용 데이터 ----------
+ING_EMOJI = ROUND_ING_EMOJI
+ALL_ING = list(ING_EMOJI.keys())  # 화면 표시 순서
 
 # ---------- 상태 초기화 ----------
-if "started" not in st.session_state:
-    st.session_state.started = False
-if "difficulty" not in st.session_state:
-    st.session_state.difficulty = "보통"
-if "order" not in st.session_state:
-    st.session_state.order = None
-if "round" not in st.session_state:
-    st.session_state.round = 0
-if "score_total" not in st.session_state:
-    st.session_state.score_total = 0
-if "start_time" not in st.session_state:
-    st.session_state.start_time = None
-if "time_limit" not in st.session_state:
-    st.session_state.time_limit = 60  # 초
+if touch_session() == "evicted":     # 오래 비운 세션: 게임 상태가 정리됨 → 기본값으로 새로
+    st.info("오래 자리를 비워서 게임을 새로 시작해요.")
+with phase("ex1.session_init"):
+    if "started" not in st.session_state:
+        st.session_state.started = False
+    if "difficulty" not in st.session_state:
+        st.session_state.difficulty = "보통"
+    if "order" not in st.session_state:
+        st.session_state.order = None
+    if "round" not in st.session_state:
+        st.session_state.round = 0
+    if "score_total" not in st.session_state:
+        st.session_state.score_total = 0
+    if "live" not in st.session_state:
+        st.session_state.live = None  # 진행 중인 라운드 (timer.LiveRound)
+    if "time_limit" not in st.session_state:
+        st.session_state.time_limit = get_time_limit(st.session_state.difficulty, "round")  # 초
+    if "order_gen" not in st.session_state:
+        st.session_state.order_gen = OrderGenerator("round")  # 세션 전용 난수 스트림
+    if "daily" not in st.session_state:
+        st.session_state.daily = False  # 오늘의 챌린지 모드
+    if "player_name" not in st.session_state:
+        st.session_state.player_name = "익명"
+    if "sid" not in st.session_state:
+        st.session_state.sid = new_session_id()  # 이벤트 로그용 세션 id
+    if "last_inputs" not in st.session_state:
+        st.session_state.last_inputs = {}  # 직전 rerun 의 위젯 값 (수정 기록용)
+    if "history" not in st.session_state:
+        st.session_state.history = RoundHistory("round")  # 지난 라운드 기록 (링 버퍼)
+
+def next_order() -> Order:
+    # 챌린지 모드면 모두가 같은 주문(라운드 번호 순서), 아니면 세션 전용 랜덤 주문
+    with phase("generate_order"):
+        if st.session_state.daily:
+            return daily_order(st.session_state.round, "round", st.session_state.difficulty)
+        return new_order(st.session_state.difficulty, st.session_state.order_gen)
+
+def round_finished(name, sid, difficulty, round_no, history):
+    # 채점이 끝나면(제출/마감) 랭킹 + 이벤트 로그 + 세션 기록에 남김
+    started = time.monotonic()
+    def hook(live):
+        pts, _, timed_out = live.result
+        get_leaderboard().record(name, "round", difficulty, round_no, pts, timed_out)
+        get_event_log().log_result(sid, "round", difficulty, live.order, live.attempt, pts, timed_out)
+        history.add(live.order, difficulty, live.attempt, pts, timed_out, time.monotonic() - started)
+    return hook
+
+def start_next_round(shared=None):
+    # 새 주문 + 마감 등록. 마감되면 서버가 그 시점 입력으로 바로 채점/기록한다
+    # shared: 공유 코드로 받은 (난이도, 주문)
+    if st.session_state.live is not None:
+        st.session_state.live.cancel()
+    if shared:
+        st.session_state.difficulty, order = shared
+    else:
+        order = next_order()
+    st.session_state.order_code = share_code(order, "round", st.session_state.difficulty)
+    st.session_state.order = order
+    st.session_state.round += 1
+    name, difficulty, round_no = st.session_state.player_name, st.session_state.difficulty, st.session_state.round
+    get_event_log().log_order(st.session_state.sid, "round", difficulty, order)
+    inputs = {
+        "ingredients": st.session_state.get("ingredients", []),
+        "pleats": st.session_state.get("pleats", order.pleats_min),
+        "method": st.session_state.get("method", order.method),
+        "cook_time": float(st.session_state.get("cook_time", sum(order.time_target)/2)),
+    }
+    st.session_state.last_inputs = inputs  # 새 라운드 시작값은 수정으로 치지 않음
+    st.session_state.live = start_round(
+        order, st.session_state.time_limit, "round", Attempt(**inputs),
+        on_finish=round_finished(name, st.session_state.sid, difficulty, round_no,
+                                 st.session_state.history),
+    )
 
 # ---------- 사이드바 ----------
-with st.sidebar:
+with st.sidebar, phase("ex1.sidebar"):
     st.title("🥟 고향만두 만들기")
     st.caption("주문 조건에 맞춰 만두를 만들어 보세요!")
 
+    st.session_state.player_name = st.text_input("닉네임", value=st.session_state.player_name, max_chars=20)
+
     st.session_state.difficulty = st.radio("난이도", ["쉬움", "보통", "어려움"], index=["쉬움","보통","어려움"].index(st.session_state.difficulty), horizontal=True)
     st.session_state.time_limit = st.slider("라운드 제한 시간(초)", 30, 120, st.session_state.time_limit, step=5)
+    st.session_state.daily = st.checkbox("🗓️ 오늘의 챌린지", value=st.session_state.daily, help="오늘 하루 모든 플레이어가 같은 순서의 주문을 받아요.")
+    if st.session_state.pop("clear_share_code", False):
+        st.session_state.share_code = ""   # 위젯을 만들기 전에만 값을 바꿀 수 있다
+    code = st.text_input("🔗 공유 코드", max_chars=16, key="share_code",
+                         help="친구가 보낸 코드를 넣고 시작하면 같은 주문을 받아요. 한 라운드에만 쓰여요.")
 
     colA, colB = st.columns(2)
     if colA.button("게임 시작" if not st.session_state.started else "새 라운드"):
-        st.session_state.started = True
-        st.session_state.order = new_order(st.session_state.difficulty)
-        st.session_state.round += 1
-        st.session_state.start_time = time.monotonic()
-        st.experimental_rerun()
+        try:
+            shared = order_from_code(code, "round") if code.strip() else None
+        except ValueError as e:
+            st.error(f"공유 코드 오류: {e}")
+        else:
+            st.session_state.started = True
+            start_next_round(shared)
+            # 코드는 한 라운드에만 (안 비우면 "새 라운드"마다 같은 주문) → 다음 rerun 에서 칸을 비운다
+            st.session_state.clear_share_code = True
+            safe_rerun()
 
     if colB.button("전체 초기화"):
+        if st.session_state.live is not None:
+            st.session_state.live.cancel()
         for k in list(st.session_state.keys()):
             del st.session_state[k]
-        st.experimental_rerun()
+        safe_rerun()
 
     st.markdown("---")
     st.subheader("점수")
     st.metric(label="총 점수", value=st.session_state.get("score_total", 0))
     st.metric(label="라운드", value=st.session_state.get("round", 0))
 
+    st.markdown("---")
+    st.subheader(f"🏆 오늘의 랭킹 ({st.session_state.difficulty})")
+    top = get_leaderboard().top_today("round", st.session_state.difficulty, n=5)
+    if top:
+        st.markdown("\n".join(f"{i}. **{name}** — {pts}점" for i, (name, pts, *_) in enumerate(top, 1)))
+    else:
+        st.caption("아직 기록이 없어요.")
+
 # ---------- 메인 UI ----------
-st.header("만두 가게: 오늘의 주문을 맞춰라!")
-
-if not st.session_state.started:
-    st.info("왼쪽에서 **게임 시작**을 눌러 첫 주문을 받아보세요!")
-    st.stop()
-
-order: Order = st.session_state.order
-
-# 남은 시간 표시
-if st.session_state.start_time:
-    elapsed = time.monotonic() - st.session_state.start_time
-else:
-    elapsed = 0.0
-remain = max(0, st.session_state.time_limit - int(elapsed))
-progress = remain / st.session_state.time_limit if st.session_state.time_limit else 0
-st.progress(progress, text=f"남은 시간: {remain}초")
-
-# 시간이 끝나면 자동 평가(재료 공백 시 0점 방지용 기본값)
-if remain == 0:
-    st.warning("⏰ 시간 종료! 현재 선택으로 평가합니다.")
-    # 기본 입력값을 안전하게 읽기
-    ingredients = st.session_state.get("ingredients", [])
-    pleats = st.session_state.get("pleats", order.pleats_min)
-    method = st.session_state.get("method", order.method)
-    cook_time = st.session_state.get("cook_time", sum(order.time_target)/2)
-    attempt = Attempt(ingredients, pleats, method, float(cook_time))
-    pts, reasons = score_attempt(order, attempt)
-    st.session_state.score_total += pts
-    st.session_state.order = None
-    st.session_state.start_time = None
-
-    st.subheader("라운드 결과")
-    st.metric("획득 점수", pts)
-    for r in reasons:
-        st.write(r)
-    if st.button("다음 라운드"):
-        st.session_state.order = new_order(st.session_state.difficulty)
-        st.session_state.round += 1
-        st.session_state.start_time = time.monotonic()
-        st.experimental_rerun()
-    st.stop()
-
-# 주문 카드
-with st.container(border=True):
-    st.subheader("📋 오늘의 주문")
-    c1, c2, c3 = st.columns([3,2,2])
-    with c1:
-        st.markdown(
-            f"{pill('메인 단백질')} {ING_EMOJI[order.required_protein]} **{order.required_protein}**  "
-        , unsafe_allow_html=True)
-        st.markdown(
-            f"{pill('필수 재료')} " + "  ".join(f"{ING_EMOJI[i]} {i}" for i in order.must_have),
-            unsafe_allow_html=True
-        )
+history_panel(st.session_state.history)
+if PROFILING:
+    debug_panel()
+
+with phase("ex1.main"):
+    st.header("만두 가게: 오늘의 주문을 맞춰라!")
+
+    if not st.session_state.started:
+        st.info("왼쪽에서 **게임 시작**을 눌러 첫 주문을 받아보세요!")
+        st.stop()
+
+    order: Order = st.session_state.order
+    if order is None:
+        st.info("왼쪽에서 **새 라운드**를 눌러 다음 주문을 받아보세요!")
+        st.stop()
+    live = st.session_state.live
+
+    # 시간이 끝나면 자동 평가 (서버가 마감 시각의 선택으로 이미 채점해 둠)
+    if live.result is not None and live.result[2]:
+        st.warning("⏰ 시간 종료! 현재 선택으로 평가합니다.")
+        pts, result, _ = live.result
+        st.session_state.score_total += pts
+        st.session_state.order = None
+        st.session_state.live = None
+
+        st.subheader("라운드 결과")
+        st.metric("획득 점수", pts)
+        for r in result.reasons("round"):
+            st.write(r)
+        if st.button("다음 라운드"):
+            start_next_round()
+            safe_rerun()
+        st.stop()
+
+    # 남은 시간 표시: 이 부분만 1초마다 다시 그린다 (전체 스크립트 rerun 없이)
+    def show_countdown():
+        touch_session()
+        remain = math.ceil(live.remaining())
+        limit = st.session_state.time_limit
+        st.progress(remain / limit if limit else 0, text=f"남은 시간: {remain}초")
+        count("countdown")
+        if live.result is not None:
+            safe_rerun()  # 마감 처리 끝남 → 전체 화면 갱신
+
+    if _FRAGMENT:
+        show_countdown = _FRAGMENT(run_every=1)(show_countdown)
+    show_countdown()
+
+    # 주문 카드 (주문마다 한 번 만든 HTML 을 요소 하나로)
+    with st.container(border=True):
+        st.subheader("📋 오늘의 주문")
+        with phase("order_card"):
+            st.markdown(order_card_html(order, "round"), unsafe_allow_html=True)
+        st.caption(f"🔗 공유 코드: `{st.session_state.get('order_code', '')}`")
+
+    st.markdown("### 🧑‍🍳 나의 조합")
+
+    # 재료 선택
+    ingredients = st.multiselect(
+        "속 재료를 고르세요 (메인 단백질 + 추가 재료)",
+        options=ALL_ING,
+        default=st.session_state.get("ingredients", []),
+        format_func=lambda x: f"{ING_EMOJI[x]} {x}",
+        help="필수/회피 재료 조건을 참고하세요!"
+    )
+    st.session_state.ingredients = ingredients
+
+    # 주름 + 조리법 + 시간
+    cA, cB, cC = st.columns(3)
+    with cA:
+        pleats = st.number_input("주름(개)", min_value=4, max_value=16, value=st.session_state.get("pleats", order.pleats_min), step=1)
+        st.session_state.pleats = int(pleats)
+    with cB:
+        method = st.radio("조리법", COOK_METHODS, index=COOK_METHODS.index(st.session_state.get("method", order.method)), horizontal=True)
+        st.session_state.method = method
+    with cC:
+        cook_time = st.slider("조리 시간(분)", 2.0, 12.0, value=float(st.session_state.get("cook_time", sum(order.time_target)/2)), step=0.5)
+        st.session_state.cook_time = cook_time
+    inputs = {"ingredients": ingredients, "pleats": int(pleats), "method": method, "cook_time": float(cook_time)}
+    live.update(**inputs)
+    for field, value in inputs.items():
+        if st.session_state.last_inputs.get(field) != value:
+            get_event_log().log_edit(st.session_state.sid, field, value)
+    st.session_state.last_inputs = inputs
+
+    # 예상 점수 (바뀐 입력 항목만 다시 계산, 어려움은 숨김)
+    if preview_enabled("round", st.session_state.difficulty):
+        pv = session_preview(st.session_state, order, "round")
+        expected = pv.update(**inputs)
+        if not pv.over_budget:
+            st.progress(expected / 100, text=f"예상 점수: {expected}점")
+
+    st.markdown("---")
+
+    # 제출 버튼
+    submit_col1, submit_col2 = st.columns([1,3])
+    with submit_col1:
+        submit = st.button("만두 완성! ✅", type="primary")
+    with submit_col2:
+        st.caption("버튼을 누르면 현재 선택으로 즉시 평가됩니다.")
+
+    if submit:
+        attempt = Attempt(ingredients, int(pleats), method, float(cook_time))
+        pts, result, _ = live.submit(attempt)
+        st.session_state.score_total += pts
+
+        st.subheader("라운드 결과")
+        st.metric("획득 점수", pts)
+        for r in result.reasons("round"):
+            st.write(r)
+
+        st.session_state.order = None
+        st.session_state.live = None
+
+        if st.button("다음 라운드 ▶"):
+            start_next_round()
+            safe_rerun()
+
+    # 힌트 섹션
+    with st.expander("🔎 팁/도움말 보기"):
         st.markdown(
-            f"{pill('선호 믹스')} " + "  ".join(f"{ING_EMOJI[i]} {i}" for i in order.optional_mixes),
-            unsafe_allow_html=True
-        )
-    with c2:
-        st.markdown(f"{pill('주름 수')} **{order.pleats_min} ~ {order.pleats_max}개**", unsafe_allow_html=True)
-        st.markdown(f"{pill('조리법')} {COOK_EMOJI[order.method]} **{order.method}**", unsafe_allow_html=True)
-        st.markdown(f"{pill('시간')} **{order.time_target[0]}~{order.time_target[1]}분**", unsafe_allow_html=True)
-    with c3:
-        st.markdown(f"{pill('사장님 메모')} _{order.note}_", unsafe_allow_html=True)
-
-st.markdown("### 🧑‍🍳 나의 조합")
-
-# 재료 선택
-ingredients = st.multiselect(
-    "속 재료를 고르세요 (메인 단백질 + 추가 재료)",
-    options=ALL_ING,
-    default=st.session_state.get("ingredients", []),
-    format_func=lambda x: f"{ING_EMOJI[x]} {x}",
-    help="필수/회피 재료 조건을 참고하세요!"
-)
-st.session_state.ingredients = ingredients
-
-# 주름 + 조리법 + 시간
-cA, cB, cC = st.columns(3)
-with cA:
-    pleats = st.number_input("주름(개)", min_value=4, max_value=16, value=st.session_state.get("pleats", order.pleats_min), step=1)
-    st.session_state.pleats = int(pleats)
-with cB:
-    method = st.radio("조리법", COOK_METHODS, index=COOK_METHODS.index(st.session_state.get("method", order.method)), horizontal=True)
-    st.session_state.method = method
-with cC:
-    cook_time = st.slider("조리 시간(분)", 2.0, 12.0, value=float(st.session_state.get("cook_time", sum(order.time_target)/2)), step=0.5)
-    st.session_state.cook_time = cook_time
-
-st.markdown("---")
-
-# 제출 버튼
-submit_col1, submit_col2 = st.columns([1,3])
-with submit_col1:
-    submit = st.button("만두 완성! ✅", type="primary")
-with submit_col2:
-    st.caption("버튼을 누르면 현재 선택으로 즉시 평가됩니다.")
-
-if submit:
-    attempt = Attempt(ingredients, int(pleats), method, float(cook_time))
-    pts, reasons = score_attempt(order, attempt)
-    st.session_state.score_total += pts
-
-    st.subheader("라운드 결과")
-    st.metric("획득 점수", pts)
-    for r in reasons:
-        st.write(r)
-
-    st.session_state.order = None
-    st.session_state.start_time = None
-
-    if st.button("다음 라운드 ▶"):
-        st.session_state.order = new_order(st.session_state.difficulty)
-        st.session_state.round += 1
-        st.session_state.start_time = time.monotonic()
-        st.experimental_rerun()
-
-# 힌트 섹션
-with st.expander("🔎 팁/도움말 보기"):
-    st.markdown(
-        """
+            """
 - **메인 단백질**은 반드시 포함해야 큰 점수를 받아요.  
 - **필수 재료**는 놓치지 말고, **회피 재료**는 넣지 마세요.  
 - **주름 수**는 범위를 벗어나면 감점돼요.  
 - **조리법 + 시간**은 주문의 핵심 포인트! 범위를 맞추면 보너스가 커요.  
 - 라운드 제한 시간 안에 제출하지 못하면, 현재 선택으로 자동 평가됩니다.
-        """
-    )
+            """
+        )
@@ -0,0 +1,253 @@
+# history.py
+# 세션별 라운드 기록 (링 버퍼) + CSV/Parquet 스트리밍 내보내기 (Streamlit 없음)
+# 한 라운드 = NumPy structured 배열 한 칸 (재료 목록은 비트 마스크, 문자열은 코드) → 라운드당 40바이트 남짓.
+# 버퍼는 필요할 때 두 배씩 늘리다가 MAX_ROUNDS 에 닿으면 가장 오래된 라운드부터 덮어쓴다.
+# 내보내기는 CHUNK_ROWS 줄씩 글자로 풀어서 흘려보낸다 → 기록이 아무리 많아도 메모리는 한 덩어리만큼만 더 쓴다.
+# Parquet 은 pyarrow 가 있을 때만 (덩어리 하나 = row group 하나, import 는 내보낼 때).
+# 앱에서는 history_panel() 이 사이드바에 최근 기록과 내려받기 버튼을 그린다 (파일은 누를 때 만든다).
+# 실행: python history.py --rounds 50000 --format csv     # 내보내기 시간/메모리 확인
+
+import argparse
+import csv
+import importlib.util
+import io
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+
+from core import (ALL_ING, COOK_METHODS, DIFFICULTIES, METHOD_CODE, PROTEINS, Attempt, Order, OrderGenerator,
+                  ing_mask)
+
+MAX_ROUNDS = int(os.environ.get("MANDU_HISTORY_MAX", 50_000))
+CHUNK_ROWS = 4096
+PARQUET = importlib.util.find_spec("pyarrow") is not None
+
+ROW = np.dtype([
+    ("ended", "f8"),            # time.time()
+    ("tmin", "f4"),             # 주문: 조리 시간 범위
+    ("tmax", "f4"),
+    ("cook_time", "f4"),
+    ("duration", "f4"),         # 라운드 시작 → 제출/마감 (초)
+    ("must", "i2"),             # 주문: 재료 비트 마스크들
+    ("avoid", "i2"),
+    ("mix", "i2"),
+    ("ings", "i2"),             # 시도: 재료 비트 마스크
+    ("points", "i2"),
+    ("protein", "i1"),          # PROTEINS 위치
+    ("pleats_min", "i1"),
+    ("pleats_max", "i1"),
+    ("order_method", "i1"),     # COOK_METHODS 위치
+    ("difficulty", "i1"),
+    ("pleats", "i1"),
+    ("method", "i1"),
+    ("timed_out", "?"),
+])
+_DIFF_CODE = {d: i for i, d in enumerate(DIFFICULTIES)}
+_PROTEIN_CODE = {p: i for i, p in enumerate(PROTEINS)}
+
+COLUMNS = ("round", "ended", "difficulty", "protein", "must_have", "optional_mixes", "avoid",
+           "pleats_range", "order_method", "time_target", "ingredients", "pleats", "method",
+           "cook_time", "points", "timed_out", "duration")
+
+class RoundHistory:
+    """한 세션의 라운드 기록. add 는 마감 스레드에서도 불리므로 락으로"""
+
+    def __init__(self, mode: str, max_rounds: int = MAX_ROUNDS):
+        self.mode = mode
+        self.max_rounds = max_rounds
+        self.total = 0              # 지금까지 기록한 라운드 수 (덮어쓴 것 포함)
+        self._rows = np.zeros(min(64, max_rounds), ROW)
+        self._lock = threading.Lock()
+
+    # pickle (sessions.py 내보내기) 에서 락은 빼고 다시 만든다
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.total, len(self._rows))
+
+    def add(self, order: Order, difficulty: str, attempt: Attempt, points: int, timed_out: bool, duration: float):
+        o = order
+        row = (time.time(), o.time_target[0], o.time_target[1], attempt.cook_time, duration,
+               ing_mask(o.must_have), ing_mask(o.avoid), ing_mask(o.optional_mixes), ing_mask(attempt.ingredients),
+               points, _PROTEIN_CODE[o.required_protein], o.pleats_min, o.pleats_max, METHOD_CODE[o.method],
+               _DIFF_CODE[difficulty], attempt.pleats, METHOD_CODE[attempt.method], timed_out)
+        with self._lock:
+            cap = len(self._rows)
+            if self.total >= cap and cap < self.max_rounds:
+                grown = np.zeros(min(cap * 2, self.max_rounds), ROW)
+                grown[:cap] = self._rows
+                self._rows, cap = grown, len(grown)
+            self._rows[self.total % cap] = row
+            self.total += 1
+
+    def chunks(self, size: int = CHUNK_ROWS):
+        """(첫 라운드 번호, 행 배열) 을 오래된 순으로 size 줄씩. 덩어리마다 락 잡고 복사만.
+        꽉 찬 버퍼를 내보내는 도중 라운드가 끝나면 아직 안 보낸 가장 오래된 줄이 새 라운드로 바뀔 수 있다"""
+        with self._lock:
+            total, cap = self.total, len(self._rows)
+        n = min(total, cap)
+        first = total - n           # 남아 있는 가장 오래된 라운드 (0부터)
+        for off in range(0, n, size):
+            k = min(size, n - off)
+            idx = (first + off + np.arange(k)) % cap
+            with self._lock:
+                rows = self._rows[idx]      # 팬시 인덱싱 = 복사
+            yield first + off + 1, rows
+
+    def recent(self, n: int = 10) -> list:
+        """최근 n 라운드 (최근 것 먼저) 를 dict 로 (화면 표시용)"""
+        with self._lock:
+            total, cap = self.total, len(self._rows)
+            k = min(n, total, cap)
+            rows = self._rows[(total - k + np.arange(k)) % cap]
+        return [dict(zip(COLUMNS, vals)) for vals in _rows_of(columns(rows, total - k + 1))][::-1]
+
+# ---------- 행 → 열 ----------
+@lru_cache(maxsize=1 << len(ALL_ING))
+def _ings_text(mask: int) -> str:
+    return "|".join(i for b, i in enumerate(ALL_ING) if mask >> b & 1)
+
+def _range_text(lo, hi) -> list:
+    return [f"{a:g}-{b:g}" for a, b in zip(lo.tolist(), hi.tolist())]
+
+def columns(rows: np.ndarray, first_round: int) -> dict:
+    """행 배열 → 열 이름 -> 값 (숫자 열은 배열 그대로, 글자 열은 코드/마스크를 표에서 찾아 푼다)"""
+    return {
+        "round": np.arange(first_round, first_round + len(rows)),
+        "ended": [datetime.fromtimestamp(t).isoformat(timespec="seconds") for t in rows["ended"].tolist()],
+        "difficulty": [DIFFICULTIES[d] for d in rows["difficulty"].tolist()],
+        "protein": [PROTEINS[i] for i in rows["protein"].tolist()],
+        "must_have": [_ings_text(m) for m in rows["must"].tolist()],
+        "optional_mixes": [_ings_text(m) for m in rows["mix"].tolist()],
+        "avoid": [_ings_text(m) for m in rows["avoid"].tolist()],
+        "pleats_range": _range_text(rows["pleats_min"], rows["pleats_max"]),
+        "order_method": [COOK_METHODS[m] for m in rows["order_method"].tolist()],
+        "time_target": _range_text(rows["tmin"], rows["tmax"]),
+        "ingredients": [_ings_text(m) for m in rows["ings"].tolist()],
+        "pleats": rows["pleats"].astype(np.int16),
+        "method": [COOK_METHODS[m] for m in rows["method"].tolist()],
+        "cook_time": rows["cook_time"].astype(np.float64).round(2),
+        "points": rows["points"],
+        "timed_out": rows["timed_out"],
+        "duration": rows["duration"].astype(np.float64).round(2),
+    }
+
+def _rows_of(cols: dict):
+    # 열 묶음 → 행 튜플 (NumPy 값은 파이썬 값으로)
+    return zip(*(cols[c].tolist() if isinstance(cols[c], np.ndarray) else cols[c] for c in COLUMNS))
+
+# ---------- 내보내기 ----------
+def iter_csv(history: RoundHistory, chunk_rows: int = CHUNK_ROWS):
+    """CSV 를 bytes 덩어리로 (첫 덩어리에 BOM: 엑셀이 한글을 UTF-8 로 읽게)"""
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    w.writerow(COLUMNS)
+    yield ("\ufeff" + buf.getvalue()).encode()
+    for first, rows in history.chunks(chunk_rows):
+        buf.seek(0)
+        buf.truncate()
+        w.writerows(_rows_of(columns(rows, first)))
+        yield buf.getvalue().encode()
+
+def write_csv(history: RoundHistory, f, chunk_rows: int = CHUNK_ROWS):
+    for data in iter_csv(history, chunk_rows):
+        f.write(data)
+
+def write_parquet(history: RoundHistory, f, chunk_rows: int = CHUNK_ROWS):
+    """덩어리마다 row group 하나. pyarrow 가 없으면 ImportError"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([("round", pa.int64()), ("ended", pa.string()), ("difficulty", pa.string()),
+                        *((c, pa.string()) for c in COLUMNS[3:11]),
+                        ("pleats", pa.int16()), ("method", pa.string()), ("cook_time", pa.float64()),
+                        ("points", pa.int16()), ("timed_out", pa.bool_()), ("duration", pa.float64())])
+    with pq.ParquetWriter(f, schema) as writer:
+        for first, rows in history.chunks(chunk_rows):
+            writer.write_table(pa.table(columns(rows, first), schema=schema))
+
+_WRITERS = {"csv": write_csv, "parquet": write_parquet}
+MIME = {"csv": "text/csv", "parquet": "application/vnd.apache.parquet"}
+
+def export_file(history: RoundHistory, fmt: str = "csv", chunk_rows: int = CHUNK_ROWS):
+    """임시 파일(디스크)에 흘려 쓰고 처음으로 되감은 파일 객체 (streamlit download_button 용)"""
+    f = tempfile.TemporaryFile()
+    _WRITERS[fmt](history, f, chunk_rows)
+    f.seek(0)
+    return f
+
+def history_panel(history: RoundHistory, n: int = 10):
+    """사이드바 라운드 기록 + 내려받기. streamlit 은 여기서만 import"""
+    import streamlit as st
+    from streamlit.errors import StreamlitAPIException
+
+    with st.sidebar.expander(f"📜 라운드 기록 ({len(history)}판)"):
+        if not len(history):
+            st.caption("아직 기록이 없어요.")
+            return
+        # st.table 은 rerun 마다 pandas/Arrow 변환 (~10ms) → 몇 줄짜리라 markdown 표로
+        rows = [f"| {r['round']} | {r['points']} | {r['difficulty']} | {r['duration']:.1f} | "
+                f"{'⏰' if r['timed_out'] else ''} |" for r in history.recent(n)]
+        st.markdown("\n".join(["| # | 점수 | 난이도 | 시간(초) | 마감 |", "|--:|--:|:-:|--:|:-:|", *rows]))
+        if history.total > len(history):
+            st.caption(f"가장 최근 {len(history)}판만 남아 있어요.")
+        fmt = st.radio("형식", ["csv", "parquet"] if PARQUET else ["csv"], horizontal=True, key="history_format")
+        name = f"mandu_{history.mode}_history.{fmt}"
+        try:
+            # 누를 때만 만든다 (rerun 마다 내보내지 않게)
+            st.download_button("내려받기", lambda: export_file(history, fmt), name, MIME[fmt])
+        except StreamlitAPIException:   # callable 을 못 받는 예전 버전 → 지금 만들어서
+            st.download_button("내려받기", export_file(history, fmt), name, MIME[fmt])
+
+# ---------- 확인용 ----------
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--rounds", type=int, default=50_000)
+    p.add_argument("--format", choices=list(_WRITERS), default="csv")
+    p.add_argument("--chunk", type=int, default=CHUNK_ROWS)
+    p.add_argument("--out", help="저장할 경로 (없으면 임시 파일)")
+    args = p.parse_args()
+
+    rng = random.Random(0)
+    gen = OrderGenerator("step", 0)
+    h = RoundHistory("step", max(args.rounds, 1))
+    t0 = time.perf_counter()
+    for _ in range(args.rounds):
+        d = rng.choice(DIFFICULTIES)
+        a = Attempt(rng.sample(ALL_ING, rng.randint(1, 6)), rng.randint(4, 16), rng.choice(COOK_METHODS),
+                    rng.randint(4, 24) / 2)
+        h.add(gen.order(d), d, a, rng.randint(0, 100), rng.random() < 0.1, rng.uniform(3, 30))
+    print(f"기록 {len(h)}라운드: {(time.perf_counter() - t0) / max(1, args.rounds) * 1e6:.1f}µs/라운드, "
+          f"버퍼 {h._rows.nbytes / 1024:.0f}KB ({ROW.itemsize}바이트/라운드)")
+
+    t0 = time.perf_counter()
+    f = export_file(h, args.format, args.chunk)
+    secs = time.perf_counter() - t0
+    tracemalloc.start()         # 메모리는 따로 한 번 더 (tracemalloc 이 느려서 시간과 같이 재면 안 됨)
+    export_file(h, args.format, args.chunk).close()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    size = os.fstat(f.fileno()).st_size
+    print(f"{args.format} 내보내기 {secs * 1000:.0f}ms, {size / 1024:.0f}KB, 최대 추가 메모리 {peak / 1024:.0f}KB")
+    if args.out:
+        with open(args.out, "wb") as out:
+            shutil.copyfileobj(f, out)
+    f.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# import_budget.py
+# core.py import 시간 측정 (워커 프로세스 기동 비용 점검용)
+# 실행: python import_budget.py [--budget-ms 50]
+# 새 인터프리터에서 core 만 import 해보고 시간이 예산을 넘거나 streamlit 이 딸려오면 실패(exit 1).
+
+import argparse
+import subprocess
+import sys
+
+BUDGET_MS = 50
+
+_PROBE = """
+import sys, time
+t = time.perf_counter()
+import core
+ms = (time.perf_counter() - t) * 1000
+print(ms, int("streamlit" in sys.modules))
+"""
+
+def measure(runs: int = 5) -> tuple:
+    """(가장 빠른 import 시간 ms, streamlit 로딩 여부)"""
+    best, leaked = None, False
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True)
+        ms, st_loaded = out.stdout.split()
+        ms = float(ms)
+        best = ms if best is None else min(best, ms)
+        leaked = leaked or st_loaded == "1"
+    return best, leaked
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    p.add_argument("--runs", type=int, default=5)
+    args = p.parse_args()
+
+    ms, leaked = measure(args.runs)
+    print(f"import core: {ms:.1f}ms (예산 {args.budget_ms:.0f}ms)")
+    if leaked:
+        print("❌ core import 가 streamlit 을 불러옴")
+        sys.exit(1)
+    if ms > args.budget_ms:
+        print("❌ import 시간 예산 초과")
+        sys.exit(1)
+    print("✅ OK")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# leaderboard.py
+# 라운드 기록 / 랭킹 저장소 (SQLite, WAL 모드, 로컬 파일)
+# 기록은 큐에 넣기만 하고 (렌더 스레드는 안 기다림), 백그라운드 스레드가 모아서 한 번에 INSERT.
+# 랭킹 조회는 인덱스 탄 쿼리라 매 rerun 마다 불러도 된다.
+
+import atexit
+import datetime
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+DB_PATH = os.environ.get("MANDU_DB", "leaderboard.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY,
+    day TEXT NOT NULL,          -- YYYY-MM-DD
+    ts REAL NOT NULL,
+    name TEXT NOT NULL,
+    mode TEXT NOT NULL,         -- round(ex1) / step(test)
+    difficulty TEXT NOT NULL,
+    round INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    timed_out INTEGER NOT NULL
+);
+-- 랭킹 조회용 커버링 인덱스: top() 이 읽는 열까지 들고 있어서 테이블은 안 본다
+-- (예전 파일의 열이 모자란 인덱스는 지우고 새 이름으로 만든다)
+DROP INDEX IF EXISTS idx_rounds_day;
+DROP INDEX IF EXISTS idx_rounds_all;
+CREATE INDEX IF NOT EXISTS idx_rounds_day_top ON rounds (mode, difficulty, day, points DESC, name, round, timed_out, ts);
+CREATE INDEX IF NOT EXISTS idx_rounds_all_top ON rounds (mode, difficulty, points DESC, name, round, timed_out, ts);
+"""
+
+_INSERT = ("INSERT INTO rounds (day, ts, name, mode, difficulty, round, points, timed_out) "
+           "VALUES (?, ?, ?, ?, ?, ?, ?, ?)")
+
+class Leaderboard:
+    def __init__(self, path: str = DB_PATH, batch_size: int = 200, flush_secs: float = 0.5):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_secs = flush_secs
+        self._queue = queue.Queue()
+        self._local = threading.local()   # 읽기용 연결은 스레드마다 (세션 스레드 공유 X)
+
+        conn = self._connect()
+        conn.executescript(_SCHEMA)
+        conn.close()
+
+        self._writer = threading.Thread(target=self._write_loop, name="leaderboard-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)   # 종료 전에 남은 기록 저장
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ---------- 쓰기 ----------
+    def record(self, name: str, mode: str, difficulty: str, round_no: int, points: int, timed_out: bool):
+        """라운드 결과 기록 (바로 반환, 실제 저장은 백그라운드)"""
+        now = time.time()
+        day = datetime.date.fromtimestamp(now).isoformat()
+        self._queue.put((day, now, name or "익명", mode, difficulty, int(round_no), int(points), int(timed_out)))
+
+    def flush(self):
+        """큐에 쌓인 기록이 다 저장될 때까지 대기 (종료/스크립트용)"""
+        self._queue.join()
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_secs
+            # 잠깐 더 모아서 한 트랜잭션으로
+            while len(batch) < self.batch_size:
+                wait = deadline - time.monotonic()
+                if wait <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=wait))
+                except queue.Empty:
+                    break
+            try:
+                with conn:
+                    conn.executemany(_INSERT, batch)
+            except sqlite3.Error as e:
+                # 저장 실패해도 writer 스레드는 계속 살아 있어야 함
+                print(f"[leaderboard] {len(batch)}건 저장 실패: {e}", file=sys.stderr)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    # ---------- 읽기 ----------
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def top(self, mode: str, difficulty: str, n: int = 10, day: str = None) -> list:
+        """상위 n개 [(name, points, round, timed_out, ts)]. day=None 이면 전체 기간"""
+        if day is None:
+            sql = ("SELECT name, points, round, timed_out, ts FROM rounds "
+                   "WHERE mode = ? AND difficulty = ? ORDER BY points DESC LIMIT ?")
+            args = (mode, difficulty, n)
+        else:
+            sql = ("SELECT name, points, round, timed_out, ts FROM rounds "
+                   "WHERE mode = ? AND difficulty = ? AND day = ? ORDER BY points DESC LIMIT ?")
+            args = (mode, difficulty, day, n)
+        return self._reader().execute(sql, args).fetchall()
+
+    def top_today(self, mode: str, difficulty: str, n: int = 10) -> list:
+        return self.top(mode, difficulty, n, day=datetime.date.today().isoformat())
+
+_instance = None
+_instance_lock = threading.Lock()
+
+def get_leaderboard() -> Leaderboard:
+    """프로세스 전체에서 하나만 (모든 세션이 같은 writer 를 씀)"""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = Leaderboard()
+    return _instance
@@ -0,0 +1,277 @@
+# loadtest.py
+# 동시 접속 부하 테스트 (Streamlit AppTest 로 가상 플레이어 여러 명을 한 프로세스에서 돌림)
+# 실행: python loadtest.py --players 200 --duration 60
+#       python loadtest.py --players 50,100,200,400 --duration 30 --app test   # 인원 늘려가며
+# 플레이어 = AppTest 세션 하나. test.py 는 Step 0→4 를, ex1.py 는 라운드를 반복한다.
+# 동작(위젯 변경/버튼) 하나 = rerun 한 번이고, 동작 사이엔 생각 시간(로그정규, 평균 --think 초)을 쉰다.
+# --afk 비율만큼은 제출하지 않고 제한 시간이 지날 때까지 기다린다 (서버 마감 처리 경로).
+# 플레이어는 스레드 하나씩이 아니라 예약 힙 + 워커 스레드(--workers)로 돌린다 (수천 명도 스레드 수는 그대로).
+# AppTest 는 실행 중에 전역 Runtime 을 바꿔 끼워서 같은 프로세스에서 동시에 돌 수 없다 → 스크립트 실행은 락 하나로 한 번에 하나.
+# 서버 한 프로세스(GIL)를 흉내 내는 셈이라, 플레이어가 늘면 대기 시간이 늘어나는 게 곧 포화 신호다.
+# rerun 지연 = 대기 + 실행 (사용자가 느끼는 시간), '실행만' 줄은 대기를 뺀 값.
+# 보고: rerun 지연 p50/p95/p99 (앱/동작별), 예약 지연(워커 포화 신호), 완료 라운드 처리량,
+#       입력 중 마감(느려서 시간 초과) 수, 세션당 메모리 증가.
+# 메모리는 프로세스 RSS 기준이라 AppTest 자체 비용도 들어간 상한값이다.
+# 로그/랭킹은 따로 지정하지 않으면 임시 폴더에 쓴다 (MANDU_LOG_DIR, MANDU_DB).
+
+import argparse
+import heapq
+import itertools
+import math
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+_RUN_LOCK = threading.Lock()        # AppTest 실행은 프로세스에 하나씩
+DIFFICULTY_BUTTONS = {"쉬움": "쉬움 (30초)", "보통": "보통 (20초)", "어려움": "어려움 (12초)"}
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        # /proc 가 없으면 최대 RSS (KB 단위, macOS 는 바이트)
+        r = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return r / 2**20 if sys.platform == "darwin" else r / 1024
+
+# ---------- 집계 ----------
+class Stats:
+    def __init__(self):
+        self.latency = defaultdict(list)     # (앱, 동작) -> [초] (대기 포함)
+        self.service = []                    # 실행 시간만 [초]
+        self.lag = []                        # 예약 시각보다 늦게 시작한 시간 [초]
+        self.rounds = Counter()              # 앱 -> 완료 라운드
+        self.timeouts = Counter()            # 일부러(--afk) 마감까지 기다린 라운드
+        self.late = Counter()                # 입력 도중 마감된 라운드 (느려서 시간 초과)
+        self.errors = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, app: str, action: str, secs: float, service: float):
+        with self._lock:
+            self.latency[app, action].append(secs)
+            self.service.append(service)
+
+    def add(self, counter: Counter, key, n: int = 1):
+        with self._lock:
+            counter[key] += n
+
+# ---------- 가상 플레이어 ----------
+class Player:
+    """AppTest 세션 하나 + 각본(제너레이터). next(script) = 동작 하나 실행 후 다음까지 쉴 시간"""
+
+    def __init__(self, app: str, rng: random.Random, stats: Stats, args):
+        from streamlit.testing.v1 import AppTest
+        self.app, self.rng, self.stats, self.args = app, rng, stats, args
+        self.at = AppTest.from_file(os.path.join(HERE, f"{app}.py"), default_timeout=args.timeout)
+        self.script = SCRIPTS[app](self)
+
+    def act(self, action: str, fn):
+        t0 = time.perf_counter()
+        with _RUN_LOCK:
+            t1 = time.perf_counter()
+            fn()
+        t2 = time.perf_counter()
+        self.stats.record(self.app, action, t2 - t0, t2 - t1)
+        if self.at.exception:
+            raise RuntimeError(self.at.exception[0].value)
+
+    @staticmethod
+    def _find(widgets, label: str):
+        for w in widgets:
+            if w.label == label:
+                return w
+        raise LookupError(f"화면에 없음: {label}")
+
+    def click(self, label: str):
+        self._find(self.at.button, label).click().run()
+
+    def set(self, widgets, label: str, value):
+        self._find(widgets, label).set_value(value).run()
+
+    def steps(self, actions, done) -> "generator":
+        """(이름, 함수) 동작들을 생각 시간 사이사이에 실행. 도중에 마감되면(done()) 나머지는 건너뜀"""
+        for i, (action, fn) in enumerate(actions, 1):
+            yield self.think()
+            self.act(action, fn)
+            if i < len(actions) and done():
+                self.stats.add(self.stats.late, self.app)
+                return
+
+    def think(self) -> float:
+        # 평균 --think 초 로그정규
+        sigma = 0.6
+        return self.rng.lognormvariate(math.log(self.args.think) - sigma ** 2 / 2, sigma)
+
+    def afk(self) -> bool:
+        return self.rng.random() < self.args.afk
+
+    def attempt(self):
+        from simulate import noisy_expert_player
+        return noisy_expert_player(self.at.session_state.order, self.rng)
+
+def step_script(p: Player):
+    """test.py: 난이도 → 주문 확인 → 재료 → 주름/조리 → 결과 → 같은 난이도로 다시"""
+    at = p.at
+    p.act("load", at.run)
+    yield p.think()
+    difficulty = p.rng.choice(list(DIFFICULTY_BUTTONS))
+    p.act("step0→1", lambda: p.click(DIFFICULTY_BUTTONS[difficulty]))
+    while True:
+        yield p.think()
+        p.act("step1→2", lambda: p.click("시작하기 ▶"))
+        a = p.attempt()
+        if p.afk():
+            from core import get_time_limit
+            yield get_time_limit(difficulty) + 1.0
+            p.act("timeout", at.run)
+            p.stats.add(p.stats.timeouts, p.app)
+        else:
+            yield from p.steps([
+                ("ingredients", lambda: at.multiselect[0].set_value(a.ingredients).run()),
+                ("step2→3", lambda: p.click("다음 ▶")),
+                ("pleats", lambda: p.set(at.number_input, "주름 수", a.pleats)),
+                ("cook_time", lambda: p.set(at.slider, "조리 시간(분)", a.cook_time)),
+                ("step3→4", lambda: p.click("만두 완성! ✅")),
+            ], done=lambda: at.session_state.step == 4)
+        if at.session_state.step == 4:
+            p.stats.add(p.stats.rounds, p.app)
+        yield p.think()
+        p.act("step4→1", lambda: p.click("같은 난이도로 다시 하기"))
+
+def round_script(p: Player):
+    """ex1.py: 게임 시작 → 위젯 입력 → 제출(또는 마감) → 새 라운드"""
+    at = p.at
+    p.act("load", at.run)
+    yield p.think()
+    p.act("start", lambda: p.click("게임 시작"))
+    while True:
+        a = p.attempt()
+        if p.afk():
+            yield at.session_state.time_limit + 1.0
+            p.act("timeout", at.run)
+            p.stats.add(p.stats.timeouts, p.app)
+        else:
+            yield from p.steps([
+                ("ingredients", lambda: at.multiselect[0].set_value(a.ingredients).run()),
+                ("pleats", lambda: p.set(at.number_input, "주름(개)", a.pleats)),
+                ("method", lambda: p.set(at.radio, "조리법", a.method)),
+                ("cook_time", lambda: p.set(at.slider, "조리 시간(분)", a.cook_time)),
+                ("submit", lambda: p.click("만두 완성! ✅")),
+            ], done=lambda: at.session_state.order is None)
+        if at.session_state.order is None:
+            p.stats.add(p.stats.rounds, p.app)
+        yield p.think()
+        p.act("next", lambda: p.click("새 라운드"))
+
+SCRIPTS = {"test": step_script, "ex1": round_script}
+
+# ---------- 실행 ----------
+def run_level(n_players: int, args) -> dict:
+    """n_players 명을 --ramp 초에 걸쳐 투입하고 --duration 초 동안 돌린다"""
+    stats = Stats()
+    rng = random.Random(args.seed)
+    apps = ["test", "ex1"] if args.app == "both" else [args.app]
+    heap, seq = [], itertools.count()
+    cond = threading.Condition()
+    t_start = time.monotonic()
+    t_end = t_start + args.duration
+    rss0 = rss_mb()
+
+    # 투입 시각만 정해 두고, 세션 생성은 워커가 그 시각에 한다
+    for i in range(n_players):
+        heapq.heappush(heap, (t_start + args.ramp * i / n_players, next(seq), apps[i % len(apps)], None))
+
+    def worker():
+        while True:
+            with cond:
+                while True:
+                    now = time.monotonic()
+                    if now >= t_end:
+                        return
+                    if heap and heap[0][0] <= now:
+                        due, _, app, player = heapq.heappop(heap)
+                        break
+                    cond.wait(min(t_end, heap[0][0] if heap else t_end) - now)
+            stats.lag.append(now - due)
+            try:
+                if player is None:
+                    player = Player(app, random.Random(rng.random()), stats, args)
+                pause = next(player.script)
+            except Exception as e:      # 세션 하나가 죽어도 나머지는 계속
+                stats.add(stats.errors, f"{app}: {type(e).__name__}: {e}"[:120])
+                continue
+            with cond:
+                heapq.heappush(heap, (time.monotonic() + pause, next(seq), app, player))
+                cond.notify()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(args.workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.monotonic() - t_start
+    sessions = sum(1 for _, _, _, p in heap if p is not None)
+    return {"players": n_players, "sessions": sessions, "elapsed": elapsed, "stats": stats,
+            "rss0": rss0, "rss1": rss_mb()}
+
+def _pcts(xs) -> tuple:
+    a = np.asarray(xs) * 1000
+    return tuple(np.percentile(a, [50, 95, 99])) if len(a) else (0.0, 0.0, 0.0)
+
+def report(r: dict, detail: bool):
+    s = r["stats"]
+    print(f"\n== 플레이어 {r['players']}명 (살아 있는 세션 {r['sessions']}), {r['elapsed']:.1f}초")
+    print(f"{'rerun ms':<22}{'p50':>8}{'p95':>8}{'p99':>8}{'n':>8}")
+    by_app = defaultdict(list)
+    for (app, action), xs in sorted(s.latency.items()):
+        by_app[app] += xs
+        if detail:
+            print(f"  {app + ' ' + action:<20}" + "".join(f"{v:8.1f}" for v in _pcts(xs)) + f"{len(xs):8d}")
+    for app, xs in sorted(by_app.items()):
+        print(f"{app + '.py':<22}" + "".join(f"{v:8.1f}" for v in _pcts(xs)) + f"{len(xs):8d}")
+    print(f"{'전체':<21}" + "".join(f"{v:8.1f}" for v in _pcts(sum(by_app.values(), []))))
+    print(f"{'실행만':<19}" + "".join(f"{v:8.1f}" for v in _pcts(s.service)))
+    print(f"{'예약 지연(워커 포화)':<17}" + "".join(f"{v:8.1f}" for v in _pcts(s.lag)))
+    done = sum(s.rounds.values())
+    print(f"완료 라운드 {done} ({done / r['elapsed']:.2f}/s) "
+          + " ".join(f"{app}={n}" for app, n in sorted(s.rounds.items()))
+          + f", 일부러 마감 {sum(s.timeouts.values())}, 입력 중 마감 {sum(s.late.values())}"
+          + f", 오류 {sum(s.errors.values())}")
+    grow = r["rss1"] - r["rss0"]
+    print(f"RSS {r['rss0']:.0f} → {r['rss1']:.0f} MB (+{grow * 1024 / max(1, r['sessions']):.0f} KB/세션)")
+    for msg, n in s.errors.most_common(5):
+        print(f"  오류 x{n}: {msg}")
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--players", default="100", help="동시 플레이어 수 (쉼표로 여러 단계)")
+    p.add_argument("--app", choices=["both", "test", "ex1"], default="both")
+    p.add_argument("--duration", type=float, default=60.0, help="단계당 초")
+    p.add_argument("--ramp", type=float, default=10.0, help="플레이어 투입에 걸리는 초")
+    p.add_argument("--think", type=float, default=2.0, help="동작 사이 평균 생각 시간(초)")
+    p.add_argument("--afk", type=float, default=0.05, help="제출 안 하고 마감까지 기다리는 라운드 비율")
+    p.add_argument("--workers", type=int, default=16)
+    p.add_argument("--timeout", type=float, default=30.0, help="rerun 한 번 제한(초), 넘으면 오류로 셈")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--detail", action="store_true", help="동작별 지연도 출력")
+    args = p.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="mandu-load-")
+    os.environ.setdefault("MANDU_LOG_DIR", os.path.join(tmp, "logs"))
+    os.environ.setdefault("MANDU_DB", os.path.join(tmp, "leaderboard.db"))
+    sys.path.insert(0, HERE)
+    print(f"로그/랭킹: {os.environ['MANDU_LOG_DIR']}, {os.environ['MANDU_DB']}")
+
+    for n in (int(x) for x in args.players.split(",")):
+        report(run_level(n, args), args.detail)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+# messages.py
+# 채점 문구 표 (한국어 / 영어)
+# core.evaluate 는 항목별 결과(Check)만 만들고, 문구는 화면에 보여줄 때 여기서 만든다.
+
+import re
+from functools import lru_cache
+
+from rules import GAME_MODES
+
+# (항목, 통과 여부) -> 문구. None 이면 표시 안 함. {w[...]} 는 모드 설정의 wording, {d[i]} 는 Check.detail
+MESSAGES = {
+    "ko": {
+        ("protein", True): "✅ 메인 단백질 일치: {d[0]}",
+        ("protein", False): "❌ 메인 단백질 누락 (요구: {d[0]})",
+        ("must", True): "✅ {w[must_ok]}: {d[0]}",
+        ("must", False): "❌ 필수 재료 누락: {d[0]}",
+        ("avoid", True): None,
+        ("avoid", False): "⚠️ 회피 재료 포함: {d[0]}",
+        ("mix", True): "✨ {w[mix]}: {d[0]}",
+        ("mix", False): None,
+        ("pleats", True): "✅ 주름 수 적정 ({d[0]}개)",
+        ("pleats", False): "⚠️ {w[pleat_range]}({d[1]}~{d[2]}) 벗어남: {d[0]}개 (−{d[3]}점)",
+        ("method", True): "✅ 조리법 일치: {d[0]}",
+        ("method", False): "❌ 조리법 불일치 (요구: {d[1]})",
+        ("time", True): "✅ 조리 시간 적정 ({d[0]}분)",
+        ("time", False): "⚠️ 시간 범위({d[1]}~{d[2]}분) 벗어남: {d[0]}분 (−{d[3]}점)",
+        "timeout": "⏰ 제한시간 초과! 자동 제출되었습니다.",
+    },
+    "en": {
+        ("protein", True): "✅ Main protein matched: {d[0]}",
+        ("protein", False): "❌ Main protein missing (wanted: {d[0]})",
+        ("must", True): "✅ {w[must_ok]}: {d[0]}",
+        ("must", False): "❌ Missing must-haves: {d[0]}",
+        ("avoid", True): None,
+        ("avoid", False): "⚠️ Contains avoided fillings: {d[0]}",
+        ("mix", True): "✨ {w[mix]}: {d[0]}",
+        ("mix", False): None,
+        ("pleats", True): "✅ Pleat count just right ({d[0]})",
+        ("pleats", False): "⚠️ Outside {w[pleat_range]} ({d[1]}~{d[2]}): {d[0]} (−{d[3]} pts)",
+        ("method", True): "✅ Cooking method matched: {d[0]}",
+        ("method", False): "❌ Wrong cooking method (wanted: {d[1]})",
+        ("time", True): "✅ Cooking time just right ({d[0]} min)",
+        ("time", False): "⚠️ Outside time range ({d[1]}~{d[2]} min): {d[0]} min (−{d[3]} pts)",
+        "timeout": "⏰ Time's up! Submitted automatically.",
+    },
+}
+
+# 재료/조리법 이름 (한국어는 그대로)
+NAMES = {
+    "en": {
+        "돼지고기": "pork", "닭고기": "chicken", "새우": "shrimp", "두부": "tofu",
+        "부추": "chives", "양파": "onion", "마늘": "garlic", "김치": "kimchi",
+        "당면": "glass noodles", "표고": "shiitake", "당근": "carrot",
+        "찜": "steamed", "군만두": "pan-fried", "물만두": "boiled",
+    },
+}
+
+@lru_cache(maxsize=None)
+def _templates(lang: str, mode: str) -> dict:
+    # 모드 문구({w[...]})를 미리 채우고 {d[i]} 는 {i} 로 바꿔 둔 표 (매번 인덱싱 파싱 안 하게)
+    w = GAME_MODES[mode]["wording"][lang]
+    out = {}
+    for key, t in MESSAGES[lang].items():
+        if t is not None:
+            t = re.sub(r"\{w\[(\w+)\]\}", lambda m: w[m.group(1)], t)
+            t = re.sub(r"\{d\[(\d+)\]\}", r"{\1}", t)
+        out[key] = t
+    return out
+
+def _value(v, names):
+    # 재료 목록은 ", " 로 잇고, 이름은 언어에 맞게
+    if isinstance(v, list):
+        return ", ".join([names.get(x, x) for x in v])
+    if isinstance(v, str):
+        return names.get(v, v)
+    return v
+
+def render_reasons(checks, mode: str = "step", lang: str = "ko") -> list:
+    """Check 목록 → 화면용 문구 목록 (채점 순서 그대로)"""
+    table = _templates(lang, mode)
+    names = NAMES.get(lang)
+    out = []
+    for c in checks:
+        template = table[c.criterion, c.ok]
+        if template is None:
+            continue
+        if names is None:   # 한국어: 이름 그대로, 목록만 잇기
+            out.append(template.format(*[", ".join(v) if type(v) is list else v for v in c.detail]))
+        else:
+            out.append(template.format(*[_value(v, names) for v in c.detail]))
+    return out
+
+# 항목별 (통과 조건, 문구 인자). 인자 식의 name()/join() 은 언어에 맞게 바뀐다 (한국어는 그대로/", " 잇기)
+_RENDER_RULES = (
+    ("protein", "order.required_protein in ings", ("name(order.required_protein)",)),
+    ("must", "not miss", ("join(miss or order.must_have)",)),
+    ("avoid", "not avoid_hits", ("join(avoid_hits)",)),
+    ("mix", "mix_hits", ("join(mix_hits)",)),
+    ("pleats", "order.pleats_min <= a.pleats <= order.pleats_max",
+     ("a.pleats", "order.pleats_min", "order.pleats_max", "-pleats")),
+    ("method", "a.method == order.method", ("name(a.method)", "name(order.method)")),
+    ("time", "tmin <= a.cook_time <= tmax", ("a.cook_time", "tmin", "tmax", "-time_")),
+)
+
+_RENDER_HEAD = """
+def render(order, a, parts):
+    ings = a.ingredients
+    miss = [i for i in order.must_have if i not in ings]
+    avoid_hits = [i for i in order.avoid if i in ings]
+    mix_hits = [i for i in order.optional_mixes if i in ings]
+    tmin, tmax = order.time_target
+    pleats, time_ = parts[4], parts[6]
+"""
+
+@lru_cache(maxsize=None)
+def render_source(mode: str = "step", lang: str = "ko") -> tuple:
+    """문구 만드는 코드 줄(들여쓰기 4칸)과 그 코드가 쓰는 이름들.
+
+    코드는 order, a, ings, miss, avoid_hits, mix_hits, tmin, tmax, pleats, time_ 가 있다고 보고 out 을 채운다.
+    core.compile_scorer 가 채점 코드 뒤에 그대로 붙여서 채점+문구를 한 함수로 만든다.
+    """
+    table = _templates(lang, mode)
+    names = NAMES.get(lang)
+    if names is None:
+        fix = lambda e: re.sub(r"name\((.*)\)", r"\1", e).replace("join(", '", ".join(')
+    else:
+        fix = lambda e: e
+
+    def emit(template, args):
+        if template is None:
+            return "pass"
+        body = re.sub(r"\{(\d+)\}", lambda m: "{" + fix(args[int(m.group(1))]) + "}", template)
+        return f"out.append(f{body!r})"
+
+    src = "    out = []\n"
+    for criterion, cond, args in _RENDER_RULES:
+        src += (f"    if {cond}:\n        {emit(table[criterion, True], args)}\n"
+                f"    else:\n        {emit(table[criterion, False], args)}\n")
+    ns = {
+        "name": lambda v: names.get(v, v),
+        "join": lambda v: ", ".join([names.get(x, x) for x in v]),
+    } if names is not None else {}
+    return src, ns
+
+@lru_cache(maxsize=None)
+def compile_renderer(mode: str = "step", lang: str = "ko"):
+    """(주문, 시도, 항목별 점수) → 문구 목록 함수. 문구를 f-string 으로 박아 넣어 직접 짠 함수와 같은 속도"""
+    body, ns = render_source(mode, lang)
+    ns = dict(ns)
+    exec(compile(_RENDER_HEAD + body + "    return out\n", f"<render:{mode}:{lang}>", "exec"), ns)
+    return ns["render"]
+
+def render_parts(order, a, parts: tuple, mode: str = "step", lang: str = "ko") -> list:
+    """evaluate 결과(주문, 시도, 항목별 점수) → 문구 목록. render_reasons 와 같은 결과를 Check 없이 바로"""
+    return compile_renderer(mode, lang)(order, a, parts)
+
+def message(key: str, lang: str = "ko") -> str:
+    return MESSAGES[lang][key]
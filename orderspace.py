@@ -0,0 +1,170 @@
+# orderspace.py
+# 주문 공간 번호 매기기 (Streamlit 없음)
+# (모드, 난이도)마다 가능한 주문 = 단백질 x 조리법 x 필수 재료 조합 x 회피 재료 x 선호 믹스 조합 x 메모.
+# 재료는 집합으로 보고(순서 무시) 조합 번호(combinatorial number system)로 바꿔서 혼합 기수로 이어 붙인다.
+# 주문 <-> 0..size-1 정수 변환이 재료 몇 개 도는 정도라 사실상 O(1).
+# 실행: python orderspace.py            # 모드/난이도별 주문 수
+#       python orderspace.py <공유코드>  # 코드 → 주문
+
+import sys
+from functools import lru_cache
+from math import comb
+
+from core import _POOLS, COOK_METHODS, DIFFICULTIES, PROTEINS, Order, method_time_range
+from rules import GAME_MODES
+
+MODES = list(GAME_MODES)
+
+def _rank_subset(positions) -> int:
+    # 오름차순 위치 → 조합 번호 (colex)
+    return sum(comb(p, k + 1) for k, p in enumerate(positions))
+
+def _unrank_subset(rank: int, k: int) -> list:
+    out = []
+    for i in range(k, 0, -1):
+        p = i - 1
+        while comb(p + 1, i) <= rank:
+            p += 1
+        rank -= comb(p, i)
+        out.append(p)
+    return out[::-1]
+
+class OrderSpace:
+    """한 (모드, 난이도)의 주문 전체. rank(order) ↔ unrank(id)"""
+
+    def __init__(self, mode: str, difficulty: str):
+        rules = GAME_MODES[mode]
+        self.mode, self.difficulty = mode, difficulty
+        self.must_n = rules["must_n"][difficulty]
+        self.pleats = rules["pleats"][difficulty]
+        self.notes = rules["notes"]
+        self.times = {m: method_time_range(m, difficulty, mode) for m in COOK_METHODS}
+        pool_n = len(_POOLS[PROTEINS[0]])
+        # 자리별 크기 (앞에서부터): 단백질, 조리법, 필수, 회피, 믹스, 메모
+        self.radix = (len(PROTEINS), len(COOK_METHODS), comb(pool_n, self.must_n),
+                      pool_n - self.must_n, comb(pool_n - self.must_n - 1, 2), len(self.notes))
+        self.size = 1
+        for r in self.radix:
+            self.size *= r
+
+    def __len__(self):
+        return self.size
+
+    def rank(self, order: Order) -> int:
+        """주문 → 번호. 이 공간의 주문이 아니면 ValueError"""
+        try:
+            pool = _POOLS[order.required_protein]
+            must = sorted(pool.index(i) for i in order.must_have)
+            rest = [i for i in pool if i not in order.must_have]
+            avoid_idx = rest.index(order.avoid[0])
+            rest2 = [i for i in rest if i != order.avoid[0]]
+            mix = sorted(rest2.index(i) for i in order.optional_mixes)
+            digits = (PROTEINS.index(order.required_protein), COOK_METHODS.index(order.method),
+                      _rank_subset(must), avoid_idx, _rank_subset(mix), self.notes.index(order.note))
+        except (KeyError, ValueError, IndexError):
+            raise ValueError(f"{self.mode}/{self.difficulty} 주문이 아님: {order}") from None
+        if (len(must) != self.must_n or len(set(must)) != self.must_n or len(order.avoid) != 1
+                or len(set(mix)) != 2 or len(mix) != 2
+                or (order.pleats_min, order.pleats_max) != self.pleats
+                or tuple(order.time_target) != self.times[order.method]):
+            raise ValueError(f"{self.mode}/{self.difficulty} 주문이 아님: {order}")
+        n = 0
+        for d, r in zip(digits, self.radix):
+            n = n * r + d
+        return n
+
+    def unrank(self, n: int) -> Order:
+        """번호 → 주문 (재료 목록은 core.ALL_ING 순서)"""
+        if not 0 <= n < self.size:
+            raise ValueError(f"번호 범위 밖: {n} (0~{self.size - 1})")
+        digits = []
+        for r in reversed(self.radix):
+            n, d = divmod(n, r)
+            digits.append(d)
+        protein_i, method_i, must_r, avoid_i, mix_r, note_i = digits[::-1]
+        protein = PROTEINS[protein_i]
+        pool = _POOLS[protein]
+        must_pos = set(_unrank_subset(must_r, self.must_n))
+        must = [pool[p] for p in sorted(must_pos)]
+        rest = [x for p, x in enumerate(pool) if p not in must_pos]
+        avoid = rest[avoid_i]
+        rest2 = [x for x in rest if x != avoid]
+        method = COOK_METHODS[method_i]
+        return Order(
+            required_protein=protein,
+            must_have=must,
+            optional_mixes=[rest2[p] for p in _unrank_subset(mix_r, 2)],
+            avoid=[avoid],
+            pleats_min=self.pleats[0],
+            pleats_max=self.pleats[1],
+            method=method,
+            time_target=self.times[method],
+            note=self.notes[note_i],
+        )
+
+    def sample(self, rng) -> Order:
+        """균등 추출 (거절 없이 번호 하나 뽑아서 unrank)"""
+        return self.unrank(rng.randrange(self.size))
+
+@lru_cache(maxsize=None)
+def order_space(mode: str, difficulty: str) -> OrderSpace:
+    return OrderSpace(mode, difficulty)
+
+def order_id(order: Order, mode: str, difficulty: str) -> int:
+    return order_space(mode, difficulty).rank(order)
+
+def order_from_id(n: int, mode: str, difficulty: str) -> Order:
+    return order_space(mode, difficulty).unrank(n)
+
+# ---------- 공유 코드 ----------
+# (모드, 난이도, 번호)를 정수 하나로 → Crockford base32 (헷갈리는 I L O U 없음) + 검사 문자 1개
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_DECODE = {c: i for i, c in enumerate(_ALPHABET)}
+_DECODE.update({"O": 0, "I": 1, "L": 1})
+_KINDS = [(m, d) for m in MODES for d in DIFFICULTIES]
+
+def share_code(order: Order, mode: str, difficulty: str) -> str:
+    n = order_id(order, mode, difficulty) * len(_KINDS) + _KINDS.index((mode, difficulty))
+    chars = []
+    while True:
+        n, d = divmod(n, 32)
+        chars.append(_ALPHABET[d])
+        if n == 0:
+            break
+    body = "".join(reversed(chars))
+    return body + _ALPHABET[sum(_DECODE[c] * (i + 1) for i, c in enumerate(body)) % 32]
+
+def parse_share_code(code: str) -> tuple:
+    """공유 코드 → (모드, 난이도, 주문). 잘못된 코드면 ValueError"""
+    code = code.strip().upper().replace("-", "")
+    if len(code) < 2 or any(c not in _DECODE for c in code):
+        raise ValueError(f"잘못된 코드: {code!r}")
+    body, check = code[:-1], code[-1]
+    if _ALPHABET[sum(_DECODE[c] * (i + 1) for i, c in enumerate(body)) % 32] != _ALPHABET[_DECODE[check]]:
+        raise ValueError(f"잘못된 코드(검사 문자 불일치): {code!r}")
+    n = 0
+    for c in body:
+        n = n * 32 + _DECODE[c]
+    n, kind = divmod(n, len(_KINDS))
+    mode, difficulty = _KINDS[kind]
+    return mode, difficulty, order_from_id(n, mode, difficulty)
+
+def order_from_code(code: str, mode: str) -> tuple:
+    """앱용: 공유 코드 → (난이도, 주문). 다른 모드 코드도 ValueError"""
+    code_mode, difficulty, order = parse_share_code(code)
+    if code_mode != mode:
+        raise ValueError(f"{code_mode} 모드 코드예요 (지금은 {mode} 모드)")
+    return difficulty, order
+
+def main():
+    if len(sys.argv) > 1:
+        mode, difficulty, order = parse_share_code(sys.argv[1])
+        print(f"{mode} / {difficulty}")
+        print(order)
+        return
+    for mode in MODES:
+        for d in DIFFICULTIES:
+            print(f"{mode:<6} {d:<4} 주문 {len(order_space(mode, d)):>9,}가지")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# preview.py
+# 입력 중 "예상 점수" 미리보기 (Streamlit 없음)
+# 주문 하나에 대해 항목별 부분 점수를 들고 있다가, 바뀐 위젯에 해당하는 항목만 다시 계산한다.
+# 재료 점수는 재료마다 독립(단백질/필수/회피/믹스 중 하나)이라 넣고 뺀 재료만큼만 더하고 뺀다.
+# 문구는 만들지 않는다 (제출 후 결과 화면에서 core.evaluate 로).
+
+import time
+
+from core import PART_SCORERS, Attempt, Order
+from rules import GAME_MODES
+
+BUDGET_MS = 2.0     # rerun 한 번에 미리보기에 쓸 수 있는 시간
+BUDGET_MISSES = 3   # 연속으로 이만큼 넘으면 이 주문 동안 미리보기를 끈다 (GC 같은 한 번의 튐은 봐줌)
+
+def preview_enabled(mode: str, difficulty: str) -> bool:
+    return GAME_MODES[mode]["preview"][difficulty]
+
+def session_preview(state, order: Order, mode: str) -> "ScorePreview":
+    """세션 상태(state["preview"])에 있는 미리보기. 주문이 바뀌었으면 새로 만든다 (예산 초과 표시도 새로)"""
+    pv = state.get("preview")
+    if pv is None or pv.order is not order:
+        pv = state["preview"] = ScorePreview(order, mode)
+    return pv
+
+class ScorePreview:
+    def __init__(self, order: Order, mode: str = "step"):
+        self.order = order
+        self.w = GAME_MODES[mode]["score"]
+        # 모드의 항목별 채점 함수 (evaluate 와 같은 식) → 바뀐 항목만 다시 매긴다
+        self.part = part = PART_SCORERS[mode]
+        # 재료 하나를 넣었을 때 바뀌는 점수
+        self.ing_points = {i: part["ingredient"](order, i)
+                           for i in {order.required_protein, *order.must_have, *order.avoid, *order.optional_mixes}}
+        self.ingredients = frozenset()
+        self.pleats = self.method = self.cook_time = None
+        # 재료 / 주름 / 조리법 / 시간 부분 점수
+        self.ing_part = self.pleat_part = self.method_part = self.time_part = 0
+        self.misses = 0             # 연속 예산 초과 횟수
+        self.over_budget = False
+
+    def update(self, ingredients=None, pleats=None, method=None, cook_time=None) -> int:
+        """바뀐 입력만 반영하고 예상 점수 반환. None 인 항목은 그대로 둔다"""
+        t0 = time.perf_counter()
+        if ingredients is not None:
+            new = frozenset(ingredients)
+            if new != self.ingredients:
+                get = self.ing_points.get
+                self.ing_part += sum(get(i, 0) for i in new - self.ingredients)
+                self.ing_part -= sum(get(i, 0) for i in self.ingredients - new)
+                self.ingredients = new
+        if pleats is not None and pleats != self.pleats:
+            self.pleats = pleats
+            self.pleat_part = self.part["pleats"](self.order, pleats)
+        if method is not None and method != self.method:
+            self.method = method
+            self.method_part = self.part["method"](self.order, method)
+        if cook_time is not None and cook_time != self.cook_time:
+            self.cook_time = cook_time
+            self.time_part = self.part["time"](self.order, cook_time)
+        if (time.perf_counter() - t0) * 1000 > BUDGET_MS:
+            self.misses += 1
+            self.over_budget = self.misses >= BUDGET_MISSES
+        else:
+            self.misses = 0
+        return self.points
+
+    @property
+    def points(self) -> int:
+        total = self.ing_part + self.pleat_part + self.method_part + self.time_part
+        return max(self.w["total_min"], min(self.w["total_max"], total))
+
+    def attempt(self) -> Attempt:
+        return Attempt(list(self.ingredients), self.pleats, self.method, self.cook_time)
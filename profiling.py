@@ -0,0 +1,212 @@
+# profiling.py
+# rerun 구간별 지연 시간 히스토그램 (옵트인, Streamlit 없음)
+# MANDU_PROFILE=1 일 때만 켜진다. 꺼져 있으면 phase() 는 아무것도 안 하는 공용 컨텍스트를 돌려준다.
+# 히스토그램은 프로세스 전체(모든 세션) 공용이고, 고정 버킷(초 단위, Prometheus 방식 le)에 개수만 센다.
+# 내보내기: to_json() / to_prometheus(). MANDU_PROFILE_EXPORT=<경로.prom> 이면 EXPORT_SECS 마다 파일로 씀
+#           (node_exporter textfile collector 가 읽어가는 형식).
+# 다른 모듈은 gauge() 로 지금 값(세션 수 등)을 등록해 패널/내보내기에 함께 싣는다.
+# 실행: MANDU_PROFILE=1 streamlit run test.py   # 사이드바에 디버그 패널 (debug_panel 만 streamlit 사용)
+
+import bisect
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+
+ENABLED = os.environ.get("MANDU_PROFILE") == "1"
+EXPORT_PATH = os.environ.get("MANDU_PROFILE_EXPORT")
+EXPORT_SECS = 15
+
+# 버킷 상한 (초). 마지막은 +Inf
+BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+           0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+_NULL = contextlib.nullcontext()
+
+class Histogram:
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, secs: float):
+        self.counts[bisect.bisect_left(BUCKETS, secs)] += 1
+        self.count += 1
+        self.sum += secs
+        if secs > self.max:
+            self.max = secs
+
+    def quantile(self, q: float) -> float:
+        """버킷 안은 선형 보간으로 추정한 q 분위수 (초)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            if c and seen + c >= rank:
+                lo = BUCKETS[i - 1] if i else 0.0
+                hi = BUCKETS[i] if i < len(BUCKETS) else self.max
+                return lo + (hi - lo) * (rank - seen) / c
+            seen += c
+        return self.max
+
+class Profiler:
+    """구간 이름 -> Histogram, 이름 -> 횟수. 기록은 락 하나로 (구간당 수 µs 수준)"""
+
+    def __init__(self):
+        self.histograms = {}
+        self.counters = {}
+        self.gauges = {}        # 이름 -> 지금 값을 돌려주는 함수 (다른 모듈이 등록)
+        self.started = time.time()
+        self._lock = threading.Lock()
+        if EXPORT_PATH:
+            threading.Thread(target=self._export_loop, name="profile-export", daemon=True).start()
+
+    def observe(self, name: str, secs: float):
+        with self._lock:
+            h = self.histograms.get(name)
+            if h is None:
+                h = self.histograms[name] = Histogram()
+            h.observe(secs)
+
+    def count(self, name: str, n: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def gauge(self, name: str, fn):
+        with self._lock:
+            self.gauges[name] = fn
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        # 예외(st.rerun / st.stop 포함)로 빠져나가도 기록
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - t0)
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+            self.started = time.time()
+
+    # ---------- 조회/내보내기 ----------
+    def rows(self) -> list:
+        """패널용: (구간, 횟수, 평균 ms, p50 ms, p95 ms, 최대 ms), 총 시간 큰 순"""
+        with self._lock:
+            items = sorted(self.histograms.items(), key=lambda kv: -kv[1].sum)
+            return [(name, h.count, h.sum / h.count * 1000, h.quantile(0.5) * 1000,
+                     h.quantile(0.95) * 1000, h.max * 1000) for name, h in items]
+
+    def counter_items(self) -> list:
+        with self._lock:
+            return sorted(self.counters.items())
+
+    def gauge_items(self) -> list:
+        # 값 함수는 락 밖에서 (그쪽 모듈 락을 잡을 수 있음)
+        with self._lock:
+            fns = sorted(self.gauges.items())
+        return [(name, fn()) for name, fn in fns]
+
+    def to_json(self) -> str:
+        gauges = self.gauge_items()
+        with self._lock:
+            return json.dumps({
+                "started": self.started,
+                "buckets": list(BUCKETS),
+                "phases": {name: {"count": h.count, "sum": h.sum, "max": h.max, "counts": list(h.counts)}
+                           for name, h in self.histograms.items()},
+                "counters": dict(self.counters),
+                "gauges": dict(gauges),
+            }, ensure_ascii=False)
+
+    def to_prometheus(self) -> str:
+        lines = ["# HELP mandu_phase_seconds rerun 구간별 소요 시간",
+                 "# TYPE mandu_phase_seconds histogram"]
+        gauges = self.gauge_items()
+        with self._lock:
+            for name, h in sorted(self.histograms.items()):
+                cum = 0
+                for le, c in zip(BUCKETS + ("+Inf",), h.counts):
+                    cum += c
+                    lines.append(f'mandu_phase_seconds_bucket{{phase="{name}",le="{le}"}} {cum}')
+                lines.append(f'mandu_phase_seconds_sum{{phase="{name}"}} {h.sum:.9f}')
+                lines.append(f'mandu_phase_seconds_count{{phase="{name}"}} {h.count}')
+            lines += ["# HELP mandu_events_total 횟수 카운터", "# TYPE mandu_events_total counter"]
+            lines += [f'mandu_events_total{{name="{name}"}} {n}' for name, n in sorted(self.counters.items())]
+        if gauges:
+            lines += ["# HELP mandu_gauge 현재 값", "# TYPE mandu_gauge gauge"]
+            lines += [f'mandu_gauge{{name="{name}"}} {v}' for name, v in gauges]
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str):
+        # 읽는 쪽이 반쯤 쓴 파일을 보지 않게 임시 파일에 쓰고 교체
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp, path)
+
+    def _export_loop(self):
+        while True:
+            time.sleep(EXPORT_SECS)
+            try:
+                self.export(EXPORT_PATH)
+            except OSError as e:
+                print(f"[profiling] 내보내기 실패: {e}", file=sys.stderr)
+
+_instance = None
+_instance_lock = threading.Lock()
+
+def get_profiler() -> Profiler:
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = Profiler()
+    return _instance
+
+# ---------- 앱에서 쓰는 함수 (꺼져 있으면 거의 비용 없음) ----------
+def phase(name: str):
+    """with phase("이름"): ... 구간 시간 기록"""
+    return get_profiler().phase(name) if ENABLED else _NULL
+
+def count(name: str, n: int = 1):
+    if ENABLED:
+        get_profiler().count(name, n)
+
+def gauge(name: str, fn):
+    """지금 값을 돌려주는 함수 등록 (패널/내보내기 때마다 부름)"""
+    if ENABLED:
+        get_profiler().gauge(name, fn)
+
+def debug_panel():
+    """사이드바 디버그 패널 (켜져 있을 때만 앱에서 호출). streamlit 은 여기서만 import"""
+    import streamlit as st
+
+    prof = get_profiler()
+    with st.sidebar.expander("🛠️ 구간별 지연 시간 (전체 세션)"):
+        rows = prof.rows()
+        if rows:
+            st.table([{"구간": name, "횟수": n, "평균 ms": f"{avg:.2f}", "p50 ms": f"{p50:.2f}",
+                       "p95 ms": f"{p95:.2f}", "최대 ms": f"{mx:.2f}"}
+                      for name, n, avg, p50, p95, mx in rows])
+        else:
+            st.caption("아직 기록이 없어요.")
+        counters = prof.counter_items()
+        if counters:
+            st.caption(" · ".join(f"{k}: {v}" for k, v in counters))
+        gauges = prof.gauge_items()
+        if gauges:
+            st.caption(" · ".join(f"{k}: {v}" for k, v in gauges))
+        c1, c2, c3 = st.columns(3)
+        c1.download_button("JSON", prof.to_json(), "mandu_profile.json", "application/json")
+        c2.download_button("Prometheus", prof.to_prometheus(), "mandu_profile.prom", "text/plain")
+        if c3.button("초기화"):
+            prof.reset()
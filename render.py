@@ -0,0 +1,79 @@
+# render.py
+# 화면용 HTML 조각 만들기 (Streamlit 없음)
+# 주문 카드는 주문 객체마다 한 번만 만들어 두고, 매 rerun 에는 문자열 하나를 st.markdown 한 번으로 보낸다.
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from rules import GAME_MODES
+
+# ---------- 이모지 ----------
+# 모드별 재료 표시 순서/아이콘은 rules.GAME_MODES 에 있음
+ROUND_ING_EMOJI = GAME_MODES["round"]["ing_emoji"]
+STEP_ING_EMOJI = GAME_MODES["step"]["ing_emoji"]
+COOK_EMOJI = {"찜": "🧺", "군만두": "🍳", "물만두": "🥘"}
+
+_ING_EMOJI = {mode: cfg["ing_emoji"] for mode, cfg in GAME_MODES.items()}
+
+# ---------- 작은 조각 (캐시) ----------
+@lru_cache(maxsize=None)
+def pill(text):
+    return f"<span style='padding:4px 10px;border-radius:999px;background:#f1f5f9;border:1px solid #e2e8f0;font-size:0.9rem;'>{text}</span>"
+
+@lru_cache(maxsize=None)
+def ing_label(name: str, mode: str = "step") -> str:
+    return f"{_ING_EMOJI[mode][name]} {name}"
+
+def _ings(names, mode: str) -> str:
+    return "&nbsp;&nbsp;".join(ing_label(i, mode) for i in names)
+
+# ---------- 주문 카드 ----------
+# 카드 항목 하나 = <p> 한 줄. 어떤 항목을 어떤 열에 놓을지는 rules.GAME_MODES[mode]["card"]
+CARD_FIELDS = {
+    "protein": lambda o, mode: f"<p>{pill('메인 단백질')} {_ING_EMOJI[mode][o.required_protein]} <b>{o.required_protein}</b></p>",
+    "must": lambda o, mode: f"<p>{pill('필수 재료')} {_ings(o.must_have, mode)}</p>",
+    "mix": lambda o, mode: f"<p>{pill('선호 믹스')} {_ings(o.optional_mixes, mode)}</p>",
+    "avoid": lambda o, mode: f"<p>{pill('회피 재료')} {_ings(o.avoid, mode)}</p>",
+    "pleats": lambda o, mode: f"<p>{pill('주름 수')} <b>{o.pleats_min} ~ {o.pleats_max}개</b></p>",
+    "method": lambda o, mode: f"<p>{pill('조리법')} {COOK_EMOJI[o.method]} <b>{o.method}</b></p>",
+    "time": lambda o, mode: f"<p>{pill('시간')} <b>{o.time_target[0]}~{o.time_target[1]}분</b></p>",
+    "note": lambda o, mode: f"<p>{pill('사장님 메모')} <i>{o.note}</i></p>",
+    "note_caption": lambda o, mode: f"<p style='font-size:0.875rem;opacity:0.6;'>사장님 메모: <i>{o.note}</i></p>",
+}
+
+def card_fields(mode: str) -> list:
+    """모드 카드에 나오는 항목 이름 (열 순서대로)"""
+    return [f for _, _, fields in GAME_MODES[mode]["card"] for f in fields]
+
+def _build_card(order, mode: str) -> str:
+    columns = GAME_MODES[mode]["card"]
+    parts = ["".join([CARD_FIELDS[f](order, mode) for f in fields]) for _, _, fields in columns]
+    if len(columns) == 1:       # 한 열: 한 줄씩 그대로 (스텝 모드)
+        return parts[0]
+    # 여러 열: flex 로 나란히, 좁으면 줄바꿈 (라운드 모드)
+    return ("<div style='display:flex;gap:1rem;flex-wrap:wrap;'>"
+            + "".join(f"<div style='flex:{flex};min-width:{width};'>{html}</div>"
+                      for (flex, width, _), html in zip(columns, parts))
+            + "</div>")
+
+_CARD_CACHE_SIZE = 512
+
+# id(order) -> (order, html). order 를 같이 들고 있어서 캐시에 있는 동안 id 가 재사용되지 않는다.
+_card_cache = OrderedDict()
+_card_lock = threading.Lock()
+
+def order_card_html(order, mode: str = "step") -> str:
+    """주문 카드 HTML. 같은 주문 객체면 (세션이 달라도) 한 번만 만든다."""
+    key = (id(order), mode)
+    with _card_lock:
+        hit = _card_cache.get(key)
+        if hit is not None and hit[0] is order:
+            _card_cache.move_to_end(key)
+            return hit[1]
+    html = _build_card(order, mode)
+    with _card_lock:
+        _card_cache[key] = (order, html)
+        if len(_card_cache) > _CARD_CACHE_SIZE:
+            _card_cache.popitem(last=False)
+    return html
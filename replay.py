@@ -0,0 +1,98 @@
+# replay.py
+# 이벤트 로그 재생: 기록된 최종 시도를 다시 채점해서 기록된 점수와 맞는지 확인
+# 실행: python replay.py [로그 폴더] [--scalar] [--chunk 100000]
+# 파일을 통째로 읽지 않고 레코드를 흘려보내면서 chunk 개씩 모아 한 번에 채점한다.
+
+import argparse
+import os
+import time
+from collections import Counter
+
+import numpy as np
+
+import batch_score as bs
+import eventlog as ev
+from core import evaluate
+
+def replay(paths, chunk: int = 100_000, scalar: bool = False, on_mismatch=None) -> dict:
+    kinds = Counter()
+    checked = mismatched = 0
+    buf = bytearray()
+    buffered = 0
+
+    def check_chunk():
+        nonlocal checked, mismatched
+        arr = np.frombuffer(bytes(buf), dtype=ev.RESULT_DTYPE)
+        o, a = ev.result_columns(arr)
+        points = np.empty(len(arr), dtype=np.int64)
+        for code, mode in enumerate(ev.MODES):     # 모드마다 가중치가 다를 수 있음
+            sel = arr["mode"] == code
+            if sel.any():
+                points[sel] = bs.score_encoded({k: v[sel] for k, v in o.items()},
+                                               {k: v[sel] for k, v in a.items()}, mode)
+        bad = np.nonzero(points != arr["points"])[0]
+        checked += len(arr)
+        mismatched += len(bad)
+        if on_mismatch:
+            for i in bad:
+                on_mismatch(ev.decode_result(bytes(buf[i * arr.itemsize:(i + 1) * arr.itemsize])), int(points[i]))
+
+    for kind, ts, sid, body in ev.iter_raw(paths):
+        kinds[kind] += 1
+        if kind != ev.RESULT:
+            continue
+        if scalar:
+            # 한 건씩 원래 채점 함수로 (느리지만 NumPy 경로와 독립적인 확인)
+            rec = ev.decode_result(body)
+            pts = evaluate(rec["order"], rec["attempt"], rec["mode"]).points
+            checked += 1
+            if pts != rec["points"]:
+                mismatched += 1
+                if on_mismatch:
+                    on_mismatch(rec, pts)
+            continue
+        buf += body
+        buffered += 1
+        if buffered >= chunk:
+            check_chunk()
+            buf.clear()
+            buffered = 0
+    if buffered:
+        check_chunk()
+
+    return {"kinds": kinds, "checked": checked, "mismatched": mismatched}
+
+KIND_NAMES = {ev.ORDER: "order", ev.STEP: "step", ev.EDIT: "edit", ev.RESULT: "result"}
+
+def main():
+    p = argparse.ArgumentParser(description="이벤트 로그 재생/재채점")
+    p.add_argument("log_dir", nargs="?", default=ev.LOG_DIR)
+    p.add_argument("--chunk", type=int, default=100_000, help="한 번에 채점할 결과 레코드 수")
+    p.add_argument("--scalar", action="store_true", help="core.evaluate 로 한 건씩 채점")
+    p.add_argument("--show", type=int, default=5, help="불일치 예시 출력 개수")
+    args = p.parse_args()
+
+    paths = ev.log_files(args.log_dir)
+    if not paths:
+        print(f"로그 없음: {args.log_dir}")
+        return
+    size = sum(os.path.getsize(x) for x in paths)
+
+    shown = []
+    def show(rec, pts):
+        if len(shown) < args.show:
+            shown.append((rec, pts))
+
+    t0 = time.perf_counter()
+    r = replay(paths, chunk=args.chunk, scalar=args.scalar, on_mismatch=show)
+    dt = time.perf_counter() - t0
+
+    total = sum(r["kinds"].values())
+    print(f"파일 {len(paths)}개, {size / 1e6:.1f}MB, 레코드 {total:,}개 ({total / dt:,.0f} rec/s)")
+    print("  " + ", ".join(f"{KIND_NAMES.get(k, k)}={n:,}" for k, n in sorted(r["kinds"].items())))
+    print(f"재채점 {r['checked']:,}건, 불일치 {r['mismatched']:,}건")
+    for rec, pts in shown:
+        print(f"  기록 {rec['points']}점 / 재채점 {pts}점: {rec['order']} {rec['attempt']}")
+
+if __name__ == "__main__":
+    main()
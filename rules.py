@@ -0,0 +1,97 @@
+# rules.py
+# 게임 모드별 규칙 (선언형 설정, 코드 없음)
+# 라운드 모드(ex1.py)와 스텝 모드(test.py)의 차이는 전부 여기에 있다.
+# 새 모드는 GAME_MODES 에 항목 하나를 추가하면 되고, core 가 시작할 때 모드별 채점 함수를 만들어 둔다.
+# GAME_MODES 순서가 이벤트 로그/공유 코드의 모드 번호다 → 새 모드는 맨 뒤에 추가 (앞 순서를 바꾸면 옛 기록이 틀어짐).
+
+# ---------- 채점 가중치 ----------
+SCORE_WEIGHTS = {
+    "protein": 30,                  # 메인 단백질 포함
+    "must": 10,                     # 필수 재료 하나당
+    "avoid": -15,                   # 회피 재료 하나당
+    "mix": 5,                       # 선호 믹스 하나당
+    "pleats_ok": 20,                # 주름 수 범위 안
+    "pleats_slope": 4,              # 범위 밖: 1개 차이당 감점
+    "pleats_cap": 20,               #          감점 상한
+    "method_ok": 20,                # 조리법 일치
+    "method_miss": -10,             #        불일치
+    "time_ok": 15,                  # 조리 시간 범위 안
+    "time_slope": 5,                # 범위 밖: 1분 차이당 감점 (반올림)
+    "time_cap": 15,                 #          감점 상한
+    "total_min": 0,                 # 최종 점수 범위
+    "total_max": 100,
+}
+
+# ---------- 조리 시간 ----------
+METHOD_TIMES = {"찜": (7, 10), "군만두": (6, 8), "물만두": (4, 6)}    # 조리법별 기본 허용 범위 (분)
+TIME_TIGHTEN = {"쉬움": 1.5, "보통": 1.0, "어려움": 0.5}             # 난이도별 범위 폭 배율 (가운데 기준)
+
+# ---------- 사장님 메모 ----------
+ROUND_NOTES = [
+    "속은 촉촉하게, 겉은 바삭하게!",
+    "향이 너무 강하면 안 좋아하세요.",
+    "식감 조화 중요! 너무 질기면 감점!",
+    "담백한 맛 선호.",
+    "매콤한 풍미 좋아하심.",
+]
+STEP_NOTES = [
+    "향이 너무 강하면 싫대요.",
+    "담백하지만 감칠맛 있게!",
+    "식감 중요! 질기면 감점.",
+    "겉바속촉 선호.",
+    "약간 매콤 OK.",
+]
+
+# ---------- 모드 ----------
+GAME_MODES = {
+    "round": {
+        "must_n": {"쉬움": 2, "보통": 2, "어려움": 2},
+        "pleats": {"쉬움": (6, 8), "보통": (7, 10), "어려움": (8, 12)},
+        "notes": ROUND_NOTES,
+        "time_limit": {"쉬움": 60, "보통": 60, "어려움": 60},   # 초 (사이드바 슬라이더 기본값)
+        "preview": {"쉬움": True, "보통": True, "어려움": False},  # 입력 중 예상 점수 표시
+        "score": SCORE_WEIGHTS,
+        "times": METHOD_TIMES,
+        "time_tighten": TIME_TIGHTEN,
+        # 채점 문구에 끼워 넣는 모드별 표현 (messages.MESSAGES 의 {w[...]})
+        "wording": {
+            "ko": {"must_ok": "필수 재료 모두 포함", "mix": "취향 저격 믹스 추가", "pleat_range": "주름 수 범위"},
+            "en": {"must_ok": "All must-have fillings in", "mix": "Bonus mix added", "pleat_range": "Pleat count range"},
+        },
+        # 주문 카드: 열마다 (flex, 최소 폭, 항목들). 항목 이름은 render.CARD_FIELDS
+        "card": [
+            (3, "14rem", ("protein", "must", "mix")),
+            (2, "10rem", ("pleats", "method", "time")),
+            (2, "10rem", ("note",)),
+        ],
+        # 화면 표시 순서/아이콘
+        "ing_emoji": {
+            "돼지고기": "🐖", "닭고기": "🐓", "새우": "🦐", "두부": "🧀",  # 대체 아이콘
+            "부추": "🌿", "양파": "🧅", "마늘": "🧄", "김치": "🥬",
+            "당면": "🍜", "표고": "🍄", "당근": "🥕",
+        },
+    },
+    "step": {
+        "must_n": {"쉬움": 1, "보통": 2, "어려움": 3},
+        "pleats": {"쉬움": (6, 10), "보통": (8, 12), "어려움": (10, 12)},  # 난이도 높을수록 빡빡
+        "notes": STEP_NOTES,
+        "time_limit": {"쉬움": 30, "보통": 20, "어려움": 12},   # 초
+        "preview": {"쉬움": True, "보통": True, "어려움": False},
+        "score": SCORE_WEIGHTS,
+        "times": METHOD_TIMES,
+        "time_tighten": TIME_TIGHTEN,
+        "wording": {
+            "ko": {"must_ok": "필수 재료 OK", "mix": "취향 저격 믹스", "pleat_range": "주름 범위"},
+            "en": {"must_ok": "Must-haves OK", "mix": "Bonus mix", "pleat_range": "Pleat range"},
+        },
+        # 열 하나면 감싸는 div 없이 한 줄씩
+        "card": [
+            (None, None, ("protein", "must", "mix", "avoid", "pleats", "method", "time", "note_caption")),
+        ],
+        "ing_emoji": {
+            "돼지고기": "🐖", "닭고기": "🐓", "새우": "🦐", "두부": "🧊",
+            "김치": "🥬", "부추": "🌿", "양파": "🧅", "마늘": "🧄",
+            "표고": "🍄", "당근": "🥕", "당면": "🍜",
+        },
+    },
+}
@@ -0,0 +1,161 @@
+# score_load.py
+# score_server.py 부하 생성기: 묶음 채점 vs 요청마다 채점(--batch-max 1) 비교
+# 실행: python score_load.py --connections 64 --duration 10
+#       python score_load.py --url 127.0.0.1:8765 --connections 200      # 이미 떠 있는 서버 하나만
+# 연결마다 keep-alive 로 응답을 받자마자 다음 /score 요청을 보낸다 (닫힌 루프, 연결 수 = 동시 요청 수).
+# 서버는 따로 프로세스로 띄운다 (같은 프로세스면 클라이언트와 GIL 을 나눠 써서 서버 숫자가 흐려짐).
+# 보고: 초당 요청 수, 지연 p50/p95/p99 (ms), 상태 코드별 오류, 서버가 센 평균 묶음 크기.
+# 클라이언트도 프로세스 하나라 연결이 아주 많으면 클라이언트 쪽이 먼저 포화될 수 있다 (--procs 로 나눔).
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+from dataclasses import asdict
+
+import numpy as np
+
+from core import ALL_ING, COOK_METHODS, DIFFICULTIES, OrderGenerator
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def request_bodies(n: int, seed: int = 0) -> list:
+    """미리 만든 /score 요청 본문 (bytes) n개"""
+    rng = random.Random(seed)
+    gen = OrderGenerator("step", seed)
+    out = []
+    for _ in range(n):
+        attempt = {"ingredients": rng.sample(ALL_ING, rng.randint(1, 6)), "pleats": rng.randint(4, 16),
+                   "method": rng.choice(COOK_METHODS), "cook_time": rng.randint(4, 24) / 2}
+        body = {"order": asdict(gen.order(rng.choice(DIFFICULTIES))), "attempt": attempt}
+        out.append(json.dumps(body, ensure_ascii=False).encode())
+    return out
+
+async def _call(reader, writer, host: str, path: str, body: bytes = b"") -> tuple:
+    method = "POST" if body else "GET"
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line[:15].lower() == b"content-length:":
+            length = int(line[15:])
+    return status, await reader.readexactly(length)
+
+async def _client(host, port, bodies, t_end, lat, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    i = random.randrange(len(bodies))
+    try:
+        while time.monotonic() < t_end:
+            t0 = time.perf_counter()
+            try:
+                status, _ = await _call(reader, writer, host, "/score", bodies[i % len(bodies)])
+            except (asyncio.IncompleteReadError, ConnectionError):
+                errors["끊김"] += 1
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+                continue
+            if status == 200:
+                lat.append(time.perf_counter() - t0)
+            else:
+                errors[status] += 1
+            i += 1
+    finally:
+        writer.close()
+
+async def _run(host, port, connections, duration, seed) -> tuple:
+    bodies = request_bodies(2000, seed)
+    lat, errors = [], Counter()
+    t_end = time.monotonic() + duration
+    await asyncio.gather(*(_client(host, port, bodies, t_end, lat, errors) for _ in range(connections)))
+    return lat, errors
+
+def _run_proc(args) -> tuple:
+    return asyncio.run(_run(*args))
+
+async def health(host, port) -> dict:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        _, data = await _call(reader, writer, host, "/health")
+        return json.loads(data)
+    finally:
+        writer.close()
+
+def measure(host: str, port: int, args) -> dict:
+    """--procs 개 프로세스에 연결을 나눠서 --duration 초"""
+    per = [args.connections // args.procs + (i < args.connections % args.procs) for i in range(args.procs)]
+    jobs = [(host, port, n, args.duration, args.seed + i) for i, n in enumerate(per) if n]
+    before = asyncio.run(health(host, port))
+    t0 = time.monotonic()
+    if len(jobs) == 1:
+        results = [_run_proc(jobs[0])]
+    else:
+        with multiprocessing.Pool(len(jobs)) as pool:
+            results = pool.map(_run_proc, jobs)
+    elapsed = time.monotonic() - t0
+    after = asyncio.run(health(host, port))
+    lat = [x for r, _ in results for x in r]
+    errors = sum((e for _, e in results), Counter())
+    batches = after["batches"] - before["batches"]
+    return {"lat": lat, "errors": errors, "elapsed": elapsed,
+            "avg_batch": (after["scored"] - before["scored"]) / max(1, batches)}
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_server(port: int, extra: list) -> subprocess.Popen:
+    proc = subprocess.Popen([sys.executable, os.path.join(HERE, "score_server.py"), "--port", str(port), *extra],
+                            stdout=subprocess.DEVNULL)
+    for _ in range(100):        # 뜰 때까지 (NumPy import 포함) 최대 10초
+        try:
+            asyncio.run(health("127.0.0.1", port))
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("채점 서버가 뜨지 않았어요")
+
+def report(name: str, r: dict):
+    ms = np.asarray(r["lat"]) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99]) if len(ms) else (0.0, 0.0, 0.0)
+    errs = ", ".join(f"{k}: {n}" for k, n in r["errors"].most_common()) or "없음"
+    print(f"{name:<16}{len(ms) / r['elapsed']:>10.0f}{p50:>8.2f}{p95:>8.2f}{p99:>8.2f}{r['avg_batch']:>9.1f}   오류 {errs}")
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--url", help="host:port. 주면 그 서버만 잰다 (비교 없이)")
+    p.add_argument("--connections", type=int, default=64, help="동시 연결 = 동시 요청 수")
+    p.add_argument("--duration", type=float, default=10.0, help="초")
+    p.add_argument("--procs", type=int, default=1, help="클라이언트 프로세스 수")
+    p.add_argument("--window-ms", type=float, default=None, help="묶음 서버 대기 시간 (기본: 서버 기본값)")
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args()
+
+    print(f"연결 {args.connections}개 x {args.duration:.0f}초 (클라이언트 프로세스 {args.procs})")
+    print(f"{'':<16}{'req/s':>10}{'p50':>8}{'p95':>8}{'p99':>8}{'평균 묶음':>7}")
+    if args.url:
+        host, port = args.url.rsplit(":", 1)
+        report(args.url, measure(host, int(port), args))
+        return
+    window = ["--window-ms", str(args.window_ms)] if args.window_ms is not None else []
+    for name, extra in (("요청마다 채점", ["--batch-max", "1"]), ("묶음 채점", window)):
+        port = free_port()
+        proc = start_server(port, extra)
+        try:
+            report(name, measure("127.0.0.1", port, args))
+        finally:
+            proc.terminate()
+            proc.wait()
+
+if __name__ == "__main__":
+    main()
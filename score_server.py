@@ -0,0 +1,330 @@
+# score_server.py
+# 모바일 등 외부 클라이언트용 주문/채점 HTTP(JSON) 서버 (asyncio, 표준 라이브러리 + NumPy, Streamlit 없음)
+# 실행: python score_server.py --port 8765
+#       python score_server.py --batch-max 1      # 묶지 않고 요청마다 채점 (비교 기준)
+# API (HTTP/1.1 keep-alive):
+#   POST /order  {"difficulty": "보통", "mode": "step", "seed": 선택}  → {"order": {...}, "code": 공유 코드}
+#   POST /score  {"order": {...} 또는 "code": 공유 코드, "attempt": {...}, "mode": "step"}  → {"points": 점수}
+#                "reasons": true 면 문구 목록도 (그 요청만 묶지 않고 core.score_attempt 로)
+#   GET  /health → 처리 건수, 묶음 수/평균 크기, 대기 중 요청 수
+# 동시에 들어온 채점 요청은 BATCH_WINDOW 동안(또는 BATCH_MAX 개까지) 모아서 batch_score 로 한 번에 채점한다.
+# 과부하 보호: 동시 연결 MAX_CONNECTIONS, 채점 대기열 MAX_PENDING 을 넘으면 바로 503 (+ Retry-After),
+#             본문 MAX_BODY 바이트 초과는 413, 연결이 KEEPALIVE_SECS 동안 조용하면 닫는다.
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from dataclasses import asdict
+
+from batch_score import score_batch
+from core import (ALL_ING, COOK_METHODS, DIFFICULTIES, Attempt, Order, OrderGenerator, generate_orders,
+                  score_attempt)
+from orderspace import parse_share_code, share_code
+from rules import GAME_MODES
+
+BATCH_WINDOW = 0.002        # 초. 첫 요청이 이만큼 기다리는 동안 들어온 것까지 한 묶음
+BATCH_MAX = 256
+MAX_PENDING = 4096          # 채점 대기열
+MAX_CONNECTIONS = 1024
+MAX_BODY = 16 * 1024
+KEEPALIVE_SECS = 15.0
+MAX_GENERATORS = 1024      # seed 별 주문 생성기 (넘으면 비움)
+MAX_PLEATS = 100           # 주름 수 허용 범위 (batch_score 의 int16 열에 들어가게)
+MAX_MINUTES = 60.0         # 조리 시간 허용 범위 (분)
+
+_STATUS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+# ---------- JSON <-> 주문/시도 ----------
+def order_json(order: Order) -> dict:
+    return asdict(order)
+
+# 채점 전에 값 범위를 확인한다 (범위 밖 숫자는 NumPy 변환에서 OverflowError 가 난다)
+def _ings(value, field: str) -> list:
+    if not isinstance(value, list) or any(i not in ALL_ING for i in value):
+        raise HTTPError(400, f"{field}: 재료는 {ALL_ING} 중에서")
+    return value
+
+def _method(value, field: str) -> str:
+    if value not in COOK_METHODS:
+        raise HTTPError(400, f"{field}: 조리법은 {COOK_METHODS} 중 하나")
+    return value
+
+def _pleats(value, field: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or not 0 <= value <= MAX_PLEATS:
+        raise HTTPError(400, f"{field}: 0~{MAX_PLEATS} 정수")
+    return value
+
+def _minutes(value, field: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value) \
+            or not 0 <= value <= MAX_MINUTES:
+        raise HTTPError(400, f"{field}: 0~{MAX_MINUTES:g} 사이 숫자")
+    return float(value)
+
+def parse_order(d: dict) -> Order:
+    if not isinstance(d, dict):
+        raise HTTPError(400, "order: JSON 객체여야 함")
+    try:
+        o = Order(**d)
+    except TypeError as e:
+        raise HTTPError(400, f"order: {e}")
+    if o.required_protein not in ALL_ING:
+        raise HTTPError(400, f"order.required_protein: {o.required_protein!r}")
+    for field in ("must_have", "optional_mixes", "avoid"):
+        _ings(getattr(o, field), f"order.{field}")
+    o.pleats_min, o.pleats_max = _pleats(o.pleats_min, "order.pleats_min"), _pleats(o.pleats_max, "order.pleats_max")
+    if o.pleats_min > o.pleats_max:
+        raise HTTPError(400, "order: pleats_min > pleats_max")
+    _method(o.method, "order.method")
+    if not isinstance(o.time_target, list) or len(o.time_target) != 2:
+        raise HTTPError(400, "order.time_target: [최소, 최대]")
+    o.time_target = tuple(_minutes(t, "order.time_target") for t in o.time_target)
+    return o
+
+def parse_attempt(d: dict) -> Attempt:
+    if not isinstance(d, dict):
+        raise HTTPError(400, "attempt: JSON 객체여야 함")
+    try:
+        ingredients, pleats, method, cook_time = d["ingredients"], d["pleats"], d["method"], d["cook_time"]
+    except KeyError as e:
+        raise HTTPError(400, f"attempt.{e.args[0]}: 없음")
+    return Attempt(_ings(ingredients, "attempt.ingredients"), _pleats(pleats, "attempt.pleats"),
+                   _method(method, "attempt.method"), _minutes(cook_time, "attempt.cook_time"))
+
+def _mode(body: dict) -> str:
+    mode = body.get("mode", "step")
+    if mode not in GAME_MODES:
+        raise HTTPError(400, f"mode: {mode}")
+    return mode
+
+# ---------- 묶음 채점 ----------
+class Batcher:
+    """채점 요청을 모아 batch_score 한 번으로. 대기열이 차면 HTTPError(503)"""
+
+    def __init__(self, window: float = BATCH_WINDOW, max_size: int = BATCH_MAX, max_pending: int = MAX_PENDING):
+        self.window, self.max_size = window, max_size
+        self.queue = asyncio.Queue(max_pending)
+        self.batches = 0
+        self.scored = 0
+
+    async def score(self, order: Order, attempt: Attempt, mode: str) -> int:
+        fut = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((order, attempt, mode, fut))
+        except asyncio.QueueFull:
+            raise HTTPError(503, "busy")
+        return await fut
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_size:
+                if self.queue.empty():
+                    remain = deadline - loop.time()
+                    if remain <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self.queue.get(), remain))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self.queue.get_nowait())
+            try:
+                self._score(batch)
+            except Exception as e:
+                # 묶음 하나가 실패해도 채점 태스크는 계속 (그 묶음 요청들만 500)
+                print(f"[score_server] 묶음 채점 실패: {e!r}", file=sys.stderr)
+                for _, _, _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(HTTPError(500, f"scoring failed: {e!r}"))
+
+    def _score(self, batch):
+        # 모드마다 한 번 (가중치 표가 모드별)
+        by_mode = {}
+        for item in batch:
+            by_mode.setdefault(item[2], []).append(item)
+        for mode, items in by_mode.items():
+            try:
+                points = score_batch([o for o, _, _, _ in items], [a for _, a, _, _ in items], mode).tolist()
+            except Exception:
+                # 입력 검사를 빠져나간 값이 섞임 → 하나씩 (잘못된 요청만 400)
+                points = []
+                for o, a, _, _ in items:
+                    try:
+                        points.append(int(score_batch([o], [a], mode)[0]))
+                    except Exception as e:
+                        points.append(HTTPError(400, f"bad value: {e!r}"))
+            for (_, _, _, fut), p in zip(items, points):
+                if fut.done():          # 클라이언트가 먼저 끊음 (취소됨)
+                    continue
+                if isinstance(p, HTTPError):
+                    fut.set_exception(p)
+                else:
+                    fut.set_result(p)
+        self.batches += 1
+        self.scored += len(batch)
+
+# ---------- HTTP ----------
+class ScoreServer:
+    def __init__(self, batcher: Batcher, max_connections: int = MAX_CONNECTIONS):
+        self.batcher = batcher
+        self.max_connections = max_connections
+        self.connections = 0
+        self.requests = 0
+        self.rejected = 0
+        self.started = time.time()
+        self._generators = {}       # (모드, seed) -> OrderGenerator (같은 seed 면 이어서 다음 주문)
+
+    async def handle(self, method: str, path: str, body: dict) -> dict:
+        if path == "/health":
+            return {"requests": self.requests, "scored": self.batcher.scored, "batches": self.batcher.batches,
+                    "avg_batch": self.batcher.scored / max(1, self.batcher.batches),
+                    "pending": self.batcher.queue.qsize(), "connections": self.connections,
+                    "rejected": self.rejected, "uptime": time.time() - self.started}
+        if method != "POST":
+            raise HTTPError(405 if path in ("/order", "/score") else 404, path)
+        if path == "/order":
+            mode = _mode(body)
+            difficulty = body.get("difficulty", "보통")
+            if difficulty not in DIFFICULTIES:
+                raise HTTPError(400, f"difficulty: {difficulty}")
+            gen = None
+            if body.get("seed") is not None:
+                try:
+                    key = (mode, int(body["seed"]))
+                except (TypeError, ValueError):
+                    raise HTTPError(400, f"seed: {body['seed']!r}")
+                gen = self._generators.get(key)
+                if gen is None:
+                    if len(self._generators) >= MAX_GENERATORS:
+                        self._generators.clear()
+                    gen = self._generators[key] = OrderGenerator(*key)
+            order = gen.order(difficulty) if gen is not None else generate_orders(1, difficulty, mode=mode)[0]
+            return {"order": order_json(order), "code": share_code(order, mode, difficulty)}
+        if path == "/score":
+            mode = _mode(body)
+            if "code" in body:
+                try:
+                    mode, _, order = parse_share_code(body["code"])
+                except ValueError as e:
+                    raise HTTPError(400, f"code: {e}")
+            else:
+                order = parse_order(body.get("order") or {})
+            attempt = parse_attempt(body.get("attempt") or {})
+            if body.get("reasons"):
+                try:
+                    points, reasons = score_attempt(order, attempt, mode)
+                except (KeyError, TypeError, ValueError) as e:
+                    raise HTTPError(400, f"unknown value: {e!r}")
+                return {"points": points, "reasons": reasons}
+            return {"points": await self.batcher.score(order, attempt, mode)}
+        raise HTTPError(404, path)
+
+    async def serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        if self.connections >= self.max_connections:
+            self.rejected += 1
+            await self._respond(writer, 503, {"error": "too many connections"}, keep_alive=False)
+            writer.close()
+            return
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_SECS)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                        ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, path, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "bad request line"}, keep_alive=False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    k, _, v = line.partition(":")
+                    headers[k.strip().lower()] = v.strip()
+                conn = headers.get("connection", "").lower()
+                keep_alive = conn != "close" if version == "HTTP/1.1" else conn == "keep-alive"
+                length = headers.get("content-length") or "0"
+                if not (length.isascii() and length.isdigit()):     # 숫자가 아니거나 음수
+                    await self._respond(writer, 400, {"error": f"content-length: {length!r}"}, keep_alive=False)
+                    break
+                length = int(length)
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {"error": f"body > {MAX_BODY} bytes"}, keep_alive=False)
+                    break
+                raw = await reader.readexactly(length) if length else b""
+                self.requests += 1
+                try:
+                    body = json.loads(raw) if raw else {}
+                    if not isinstance(body, dict):
+                        raise HTTPError(400, "body must be a JSON object")
+                    status, payload = 200, await self.handle(method, path.split("?", 1)[0], body)
+                except json.JSONDecodeError as e:
+                    status, payload = 400, {"error": f"json: {e}"}
+                except HTTPError as e:
+                    status, payload = e.status, {"error": str(e)}
+                    if status == 503:
+                        self.rejected += 1
+                except Exception as e:  # 요청 하나 때문에 연결/서버가 죽지 않게
+                    status, payload = 500, {"error": repr(e)}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _respond(self, writer, status: int, payload: dict, keep_alive: bool):
+        data = json.dumps(payload, ensure_ascii=False).encode()
+        head = (f"HTTP/1.1 {status} {_STATUS[status]}\r\n"
+                "Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                + ("Retry-After: 1\r\n" if status == 503 else "") + "\r\n")
+        writer.write(head.encode() + data)
+        await writer.drain()
+
+async def serve(host: str, port: int, window: float = BATCH_WINDOW, batch_max: int = BATCH_MAX,
+                max_pending: int = MAX_PENDING, max_connections: int = MAX_CONNECTIONS):
+    batcher = Batcher(window, batch_max, max_pending)
+    server = ScoreServer(batcher, max_connections)
+    batch_task = asyncio.create_task(batcher.run())
+    srv = await asyncio.start_server(server.serve_client, host, port, limit=MAX_BODY, backlog=max_connections)
+    print(f"채점 서버: http://{host}:{port} (묶음 {window * 1000:.1f}ms/{batch_max}개)", flush=True)
+    try:
+        async with srv:
+            await srv.serve_forever()
+    finally:
+        batch_task.cancel()
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--window-ms", type=float, default=BATCH_WINDOW * 1000, help="묶음 대기 시간")
+    p.add_argument("--batch-max", type=int, default=BATCH_MAX, help="1 이면 요청마다 따로 채점")
+    p.add_argument("--max-pending", type=int, default=MAX_PENDING)
+    p.add_argument("--max-connections", type=int, default=MAX_CONNECTIONS)
+    args = p.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.window_ms / 1000, args.batch_max,
+                          args.max_pending, args.max_connections))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
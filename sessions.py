@@ -0,0 +1,354 @@
+# sessions.py
+# 세션 수명 관리: 오래 손 놓은 탭의 게임 상태를 줄이고 → 디스크로 내보내고 → TTL 이 지나면 버린다
+# 단계 (마지막 rerun 부터 잰 시간):
+#   COMPACT_SECS  다시 만들 수 있는 캐시(preview)를 버리고 Order/Attempt/채점 결과를 compact 버전으로
+#   SPILL_SECS    남은 게임 상태를 SPILL_DIR 에 pickle 로 쓰고 세션에서 지움 (sid/닉네임만 남김)
+#   TTL_SECS      내보낸 파일도 지우고 관리 목록에서 뺌 → 돌아오면 새 게임
+# Streamlit 런타임이 이미 버린 세션(탭을 닫고 재연결 유예도 지남)은 단계와 상관없이 다음 정리 때 바로 놓아 준다.
+# 앱은 스크립트(와 fragment) 맨 앞에서 touch() 만 부른다. 줄였거나 내보낸 세션이면 그 자리에서 되살린다.
+# 진행 중인 라운드(live)가 있는 세션은 건드리지 않는다 (마감 타이머가 세션 상태를 쓴다).
+# 정리는 백그라운드 스레드 하나가 SWEEP_SECS 마다. Streamlit 은 touch() 에서만 쓴다.
+# 설정: MANDU_SESSION_COMPACT / MANDU_SESSION_SPILL / MANDU_SESSION_TTL (초), MANDU_SESSION_DIR
+# 실행: python sessions.py [--purge]      # 내보낸 파일 현황 (--purge: TTL 지난 파일 삭제)
+#       python sessions.py --check        # 생성기가 내는 주문/시도가 전부 줄여지는지 확인 (실패하면 exit 1)
+
+import argparse
+import os
+import pickle
+import sys
+import threading
+import time
+import uuid
+
+from compact import compact, expand
+from core import Attempt
+from profiling import gauge
+
+COMPACT_SECS = float(os.environ.get("MANDU_SESSION_COMPACT", 5 * 60))
+SPILL_SECS = float(os.environ.get("MANDU_SESSION_SPILL", 15 * 60))
+TTL_SECS = float(os.environ.get("MANDU_SESSION_TTL", 6 * 3600))
+SPILL_DIR = os.environ.get("MANDU_SESSION_DIR", "sessions")
+SWEEP_SECS = max(1.0, min(60.0, COMPACT_SECS / 4))
+
+MARK = "_session_stage"                     # 세션 상태 안의 표시: "spilled" / "evicted"
+KEEP = {"sid", "player_name", MARK}         # 내보내도 메모리에 남기는 키
+DROP = {"preview"}                          # 줄일 때 그냥 버리는 캐시 (다음 rerun 에 다시 만들어짐)
+
+LIVE, COMPACTED, SPILLED = "live", "compacted", "spilled"
+
+def approx_size(obj, _seen=None) -> int:
+    """객체가 붙잡고 있는 대략의 바이트 (공유된 객체는 한 번만)"""
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(approx_size(k, seen) + approx_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(approx_size(x, seen) for x in obj)
+    elif not isinstance(obj, (str, bytes, int, float, bool, type(None))):
+        d = getattr(obj, "__dict__", None)
+        if d is not None:
+            size += approx_size(d, seen)
+        for name in getattr(type(obj), "__slots__", ()):
+            if hasattr(obj, name):
+                size += approx_size(getattr(obj, name), seen)
+    return size
+
+def _keys(state) -> list:
+    # Streamlit SessionState: 키 없는 위젯/내부 키를 뺀 사용자 키
+    filtered = getattr(state, "filtered_state", None)
+    return list(filtered if filtered is not None else state.keys())
+
+def _get(state, key, default=None):
+    try:
+        return state[key]
+    except KeyError:
+        return default
+
+def _set(state, key, value):
+    # 정리 스레드에서 쓸 때: 일반 대입은 스크립트 컨텍스트를 찾다가 매번 경고 로그를 남긴다
+    reset = getattr(state, "reset_state_value", None)
+    if reset is not None:
+        reset(key, value)
+    else:
+        state[key] = value
+
+def _runtime_knows(session_id) -> bool:
+    """런타임이 아직 이 세션을 들고 있나. 알 수 없으면(런타임 없음: AppTest/bare 실행 등) True"""
+    if session_id is None:
+        return True
+    try:
+        from streamlit.runtime import Runtime
+    except ImportError:
+        return True
+    if not Runtime.exists():
+        return True
+    runtime = Runtime.instance()
+    mgr = getattr(runtime, "_session_mgr", None)
+    if mgr is not None and hasattr(mgr, "get_session_info"):
+        return mgr.get_session_info(session_id) is not None    # 연결 끊겼어도 재연결 유예 중이면 있음
+    return runtime.is_active_session(session_id)
+
+def compact_state(state) -> int:
+    """줄이기 단계 본체: 캐시(DROP)는 버리고 Order/Attempt/채점 결과는 compact 버전으로. 줄인 바이트 (추정)"""
+    saved = 0
+    memo = {}   # 여러 키가 같은 주문을 가리키면 작은 버전도 하나 (test.py: ss.order 와 ss.result 안의 order)
+    for k in _keys(state):
+        v = state[k]
+        if k in DROP:
+            saved += approx_size(v)
+            del state[k]
+            continue
+        small = compact(v, memo)
+        if small is v or expand(small) != v:    # 줄일 게 없거나, 되돌렸을 때 달라지는 값 (중복 재료 등) → 그대로
+            continue
+        saved += approx_size(v) - approx_size(small)
+        _set(state, k, small)
+    return saved
+
+class _Entry:
+    __slots__ = ("state", "session_id", "lock", "last", "stage", "path", "saved")
+
+    def __init__(self, state, session_id=None):
+        self.state = state          # SessionState 자체 (slots dataclass 라 weakref 불가 → 런타임이 버리면 놓아 준다)
+        self.session_id = session_id
+        self.lock = threading.Lock()
+        self.last = time.monotonic()
+        self.stage = LIVE
+        self.path = None            # 내보낸 파일
+        self.saved = 0              # 이 세션에서 지금 메모리 밖에 있는 바이트 (추정)
+
+class SessionManager:
+    def __init__(self, spill_dir: str = SPILL_DIR, compact_secs: float = COMPACT_SECS,
+                 spill_secs: float = SPILL_SECS, ttl_secs: float = TTL_SECS):
+        self.spill_dir = spill_dir
+        self.compact_secs, self.spill_secs, self.ttl_secs = compact_secs, spill_secs, ttl_secs
+        self._entries = {}          # id(state) -> _Entry
+        self._lock = threading.Lock()
+        self.evicted = 0            # 누적
+        self.dropped = 0            # 누적 (런타임이 이미 버린 세션)
+        self.restored = 0
+        self.reclaimed = 0          # 누적 (줄이기 + 내보내기로 메모리에서 뺀 바이트, 추정)
+        os.makedirs(spill_dir, exist_ok=True)
+        purge(spill_dir, ttl_secs)  # 이전 프로세스가 남긴 파일 (그 세션들은 이미 없다)
+
+    # ---------- 앱 쪽 ----------
+    def touch(self, state, session_id=None):
+        """rerun 시작: 마지막 활동 시각 갱신 + 필요하면 복원. "restored"/"evicted"/None"""
+        key = id(state)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.state is not state:
+                entry = self._entries[key] = _Entry(state, session_id)
+        with entry.lock:
+            entry.last = time.monotonic()
+            status = None
+            if entry.stage == SPILLED:
+                self._load(entry)
+                status = "restored"
+            elif entry.stage == COMPACTED:
+                memo = {}
+                for k in _keys(state):
+                    v = state[k]
+                    big = expand(v, memo)
+                    if big is not v:
+                        state[k] = big
+                status = "restored"
+            elif _get(state, MARK) == "evicted":
+                status = "evicted"      # TTL 지나 버린 세션이 돌아옴 → 앱이 기본값으로 새로 시작
+            if status:
+                if MARK in _keys(state):
+                    del state[MARK]
+                if status == "restored":
+                    self.restored += 1
+                entry.stage, entry.saved = LIVE, 0
+        return status
+
+    # ---------- 단계별 처리 (entry.lock 잡고) ----------
+    def _compact(self, entry):
+        saved = compact_state(entry.state)
+        entry.stage, entry.saved = COMPACTED, saved
+        self.reclaimed += saved
+
+    def _spill(self, entry):
+        state = entry.state
+        memo = {}
+        data = {k: expand(state[k], memo) for k in _keys(state) if k not in KEEP}
+        try:
+            blob = pickle.dumps(data)
+        except Exception:
+            # 못 내보내는 값(락/스레드를 든 객체 등)은 메모리에 남긴다. 나머지는 한 번에 (서로 참조 유지)
+            for k in list(data):
+                try:
+                    pickle.dumps(data[k])
+                except Exception:
+                    del data[k]
+            blob = pickle.dumps(data)
+        size = approx_size(data)
+        path = os.path.join(self.spill_dir, f"{uuid.uuid4().hex}.pkl")
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+        for k in data:
+            del state[k]
+        _set(state, MARK, SPILLED)
+        self.reclaimed += max(0, size - entry.saved)    # 줄이기 단계에서 센 만큼은 빼고
+        entry.stage, entry.path, entry.saved = SPILLED, path, size
+
+    def _load(self, entry):
+        with open(entry.path, "rb") as f:
+            data = pickle.load(f)
+        for k, v in data.items():
+            entry.state[k] = v
+        self._remove_file(entry)
+
+    def _remove_file(self, entry):
+        if entry.path:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+            entry.path = None
+
+    # ---------- 정리 ----------
+    def sweep(self, now: float = None):
+        """한 번 훑기 (정리 스레드가 부름)"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entries = list(self._entries.items())
+        for key, entry in entries:
+            if not _runtime_knows(entry.session_id):
+                # 세션이 사라짐 → 다시 올 일 없으니 내보낸 파일과 참조를 바로 정리 (TTL 까지 붙잡지 않음)
+                with entry.lock:
+                    self._remove_file(entry)
+                with self._lock:
+                    self._entries.pop(key, None)
+                self.dropped += 1
+                continue
+            if now - entry.last < self.compact_secs:
+                continue
+            with entry.lock:        # 그사이 돌아왔으면 touch 가 last 를 바꿔 놓았다
+                idle = now - entry.last
+                live = _get(entry.state, "live")
+                if live is not None and getattr(live, "result", None) is None:
+                    continue
+                try:
+                    if idle >= self.ttl_secs:
+                        self._remove_file(entry)
+                        for k in _keys(entry.state):
+                            if k not in KEEP:
+                                del entry.state[k]
+                        _set(entry.state, MARK, "evicted")
+                        self.evicted += 1
+                        with self._lock:
+                            self._entries.pop(key, None)
+                    elif idle >= self.spill_secs and entry.stage != SPILLED:
+                        self._spill(entry)
+                    elif entry.stage == LIVE:
+                        self._compact(entry)
+                except Exception as e:  # 한 세션 문제로 정리 스레드가 죽지 않게
+                    print(f"[sessions] 정리 실패: {e!r}", file=sys.stderr)
+
+    def _sweep_loop(self):
+        while True:
+            time.sleep(SWEEP_SECS)
+            self.sweep()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = list(self._entries.values())
+        stages = [e.stage for e in entries]
+        return {
+            "live": stages.count(LIVE),
+            "compacted": stages.count(COMPACTED),
+            "spilled": stages.count(SPILLED),
+            "evicted_total": self.evicted,
+            "dropped_total": self.dropped,
+            "restored_total": self.restored,
+            "reclaimed_bytes": sum(e.saved for e in entries),
+            "reclaimed_bytes_total": self.reclaimed,
+        }
+
+_instance = None
+_instance_lock = threading.Lock()
+
+def get_session_manager() -> SessionManager:
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = SessionManager()
+                threading.Thread(target=_instance._sweep_loop, daemon=True, name="mandu-sessions").start()
+                for name in ("live", "compacted", "spilled", "evicted_total", "dropped_total", "reclaimed_bytes"):
+                    gauge(f"sessions_{name}", lambda n=name: _instance.stats()[n])
+    return _instance
+
+def touch():
+    """앱 스크립트/fragment 맨 앞에서. 스크립트 실행 중이 아니면(bare 실행 등) 아무것도 안 함"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None
+    # ctx.session_state 는 rerun 마다 새로 만드는 래퍼 → 세션과 수명이 같은 안쪽 SessionState 를 잡는다
+    state = getattr(ctx.session_state, "_state", ctx.session_state)
+    return get_session_manager().touch(state, getattr(ctx, "session_id", None))
+
+def purge(spill_dir: str = SPILL_DIR, ttl_secs: float = TTL_SECS) -> int:
+    """TTL 보다 오래된 내보낸 파일 삭제. 지운 개수"""
+    removed = 0
+    cutoff = time.time() - ttl_secs
+    for name in os.listdir(spill_dir):
+        path = os.path.join(spill_dir, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+def check_compaction(n: int = 2000, seed: int = 0) -> dict:
+    """모드 x 난이도마다 생성한 주문 n개와 (재료 순서를 섞은) 시도 n개 중 줄이기 단계에서 줄여지는 개수"""
+    import random
+    from core import ALL_ING, COOK_METHODS, DIFFICULTIES, OrderGenerator
+    from rules import GAME_MODES
+    rng = random.Random(seed)
+    out = {}
+    for mode in GAME_MODES:
+        for d in DIFFICULTIES:
+            gen = OrderGenerator(mode, seed)
+            ok = 0
+            for o in gen.orders(n, d):
+                a = Attempt(rng.sample(ALL_ING, rng.randint(0, len(ALL_ING))), rng.randint(4, 16),
+                            rng.choice(COOK_METHODS), rng.randint(4, 24) / 2)
+                ok += (expand(compact(o)) == o) + (expand(compact(a)) == a)
+            out[mode, d] = (ok, 2 * n)
+    return out
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--dir", default=SPILL_DIR)
+    p.add_argument("--purge", action="store_true", help=f"{TTL_SECS:.0f}초보다 오래된 파일 삭제")
+    p.add_argument("--check", action="store_true", help="줄이기 단계 확인")
+    args = p.parse_args()
+    if args.check:
+        result = check_compaction()
+        for (mode, d), (ok, n) in result.items():
+            print(f"{mode:<6} {d:<4} 줄여짐 {ok:,}/{n:,}")
+        sys.exit(0 if all(ok == n for ok, n in result.values()) else 1)
+    if not os.path.isdir(args.dir):
+        print(f"{args.dir}: 없음")
+        return
+    if args.purge:
+        print(f"삭제 {purge(args.dir)}개")
+    files = [os.path.join(args.dir, n) for n in os.listdir(args.dir)]
+    print(f"{args.dir}: 내보낸 세션 {len(files)}개, {sum(os.path.getsize(f) for f in files) / 1024:.1f}KB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# simulate.py
+# 난이도 밸런스용 몬테카를로 시뮬레이터
+# 실행: python simulate.py --rounds 1000000 --player noisy --workers 8
+# 라운드를 여러 프로세스로 나눠 돌리고, 워커마다 독립 난수 스트림을 쓴다.
+# 워커는 원본 결과 대신 (조리법별 점수 히스토그램)만 돌려보낸다.
+
+import argparse
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import batch_score as bs
+from core import ALL_ING, COOK_METHODS, DIFFICULTIES, GAME_MODES, Attempt, OrderGenerator
+
+N_BINS = 101        # 점수 0~100
+CHUNK = 5_000       # 워커 하나가 한 번에 처리하는 라운드 수
+
+# ---------- 플레이어 모델 ----------
+# (order, rng: random.Random) -> Attempt. PLAYERS 에 추가하면 --player 로 바로 쓸 수 있다.
+def _snap_time(t: float) -> float:
+    # 슬라이더와 같은 2.0~12.0, 0.5 단위
+    return min(12.0, max(2.0, round(t * 2) / 2))
+
+def random_player(order, rng):
+    ingredients = rng.sample(ALL_ING, rng.randint(1, len(ALL_ING)))
+    return Attempt(ingredients, rng.randint(4, 16), rng.choice(COOK_METHODS), rng.randint(4, 24) / 2)
+
+def greedy_player(order, rng):
+    # 주문서에 적힌 대로만: 단백질 + 필수 + 선호, 회피는 빼고, 범위 가운데
+    ingredients = [order.required_protein] + order.must_have + order.optional_mixes
+    pleats = (order.pleats_min + order.pleats_max) // 2
+    return Attempt(ingredients, pleats, order.method, _snap_time(sum(order.time_target) / 2))
+
+def noisy_expert_player(order, rng, slip=0.08):
+    # 정답을 알지만 손이 미끄러지는 플레이어: 재료 선택 실수, 주름/시간 오차, 가끔 조리법 착각
+    want = set([order.required_protein] + order.must_have + order.optional_mixes)
+    ingredients = [i for i in ALL_ING if (i in want) != (rng.random() < slip)]
+    pleats = min(16, max(4, round(rng.gauss((order.pleats_min + order.pleats_max) / 2, 1.5))))
+    method = order.method if rng.random() > slip else rng.choice(COOK_METHODS)
+    cook_time = _snap_time(rng.gauss(sum(order.time_target) / 2, 1.0))
+    return Attempt(ingredients, pleats, method, cook_time)
+
+PLAYERS = {
+    "random": random_player,
+    "greedy": greedy_player,
+    "noisy": noisy_expert_player,
+}
+
+# ---------- 워커 ----------
+def run_shard(mode: str, difficulty: str, player: str, n_rounds: int, seed_seq) -> tuple:
+    """n_rounds 라운드를 돌려 (difficulty, 조리법별 히스토그램[3, 101], 걸린 시간) 반환"""
+    order_seed, player_seed = (int(x) for x in seed_seq.generate_state(2))
+    gen = OrderGenerator(mode, order_seed)
+    rng = random.Random(player_seed)
+    play = PLAYERS[player]
+    hist = np.zeros((len(COOK_METHODS), N_BINS), dtype=np.int64)
+
+    t0 = time.perf_counter()
+    done = 0
+    while done < n_rounds:
+        n = min(CHUNK, n_rounds - done)
+        orders = gen.orders(n, difficulty)
+        attempts = [play(o, rng) for o in orders]
+        enc = bs.encode_orders(orders)
+        points = bs.score_encoded(enc, bs.encode_attempts(attempts), mode)
+        # (조리법, 점수) 2차원 카운트
+        np.add.at(hist, (enc["method"], points), 1)
+        done += n
+    return difficulty, hist, time.perf_counter() - t0
+
+# ---------- 집계 ----------
+def percentile(hist: np.ndarray, q: float) -> int:
+    total = hist.sum()
+    if total == 0:
+        return 0
+    return int(np.searchsorted(np.cumsum(hist), q * total))
+
+def summarize(hist: np.ndarray) -> dict:
+    total = int(hist.sum())
+    mean = float((hist * np.arange(N_BINS)).sum() / total) if total else 0.0
+    return {
+        "rounds": total,
+        "mean": round(mean, 2),
+        "p10": percentile(hist, 0.10),
+        "p50": percentile(hist, 0.50),
+        "p90": percentile(hist, 0.90),
+        "p99": percentile(hist, 0.99),
+    }
+
+def simulate(rounds: int, player: str = "noisy", mode: str = "step", difficulties=None,
+             workers: int = None, shards_per_difficulty: int = 16, seed: int = 0,
+             on_progress=None) -> dict:
+    """난이도별로 rounds 라운드씩 시뮬레이션.
+
+    반환: {"wall_secs", "rounds_per_sec", "by_difficulty": {difficulty: 히스토그램[3, 101]}}
+    """
+    difficulties = difficulties or DIFFICULTIES
+    root = np.random.SeedSequence(seed)
+    streams = root.spawn(len(difficulties) * shards_per_difficulty)
+
+    hists = {d: np.zeros((len(COOK_METHODS), N_BINS), dtype=np.int64) for d in difficulties}
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for di, d in enumerate(difficulties):
+            per = [rounds // shards_per_difficulty] * shards_per_difficulty
+            per[0] += rounds - sum(per)
+            for si, n in enumerate(per):
+                if n:
+                    stream = streams[di * shards_per_difficulty + si]
+                    futures.append(pool.submit(run_shard, mode, d, player, n, stream))
+        # 부분 히스토그램이 도착하는 대로 누적
+        for fut in as_completed(futures):
+            d, hist, _ = fut.result()
+            hists[d] += hist
+            if on_progress:
+                on_progress(d, hists[d])
+    wall = time.perf_counter() - t0
+
+    total = sum(int(h.sum()) for h in hists.values())
+    return {
+        "wall_secs": wall,
+        "rounds_per_sec": total / wall if wall else 0.0,
+        "by_difficulty": {d: h for d, h in hists.items()},
+    }
+
+def report(result: dict):
+    print(f"\n총 {result['rounds_per_sec']:,.0f} rounds/sec ({result['wall_secs']:.1f}s)")
+    for d, hist in result["by_difficulty"].items():
+        s = summarize(hist.sum(axis=0))
+        print(f"\n[{d}] rounds={s['rounds']:,} mean={s['mean']} "
+              f"p10={s['p10']} p50={s['p50']} p90={s['p90']} p99={s['p99']}")
+        for k, m in enumerate(COOK_METHODS):
+            s = summarize(hist[k])
+            print(f"  {m:<4} rounds={s['rounds']:,} mean={s['mean']} p10={s['p10']} p50={s['p50']} p90={s['p90']}")
+
+def main():
+    p = argparse.ArgumentParser(description="만두 게임 난이도 시뮬레이션")
+    p.add_argument("--rounds", type=int, default=100_000, help="난이도별 라운드 수")
+    p.add_argument("--player", choices=sorted(PLAYERS), default="noisy")
+    p.add_argument("--mode", choices=sorted(GAME_MODES), default="step")
+    p.add_argument("--difficulty", choices=DIFFICULTIES, action="append")
+    p.add_argument("--workers", type=int, default=None)
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args()
+
+    result = simulate(args.rounds, player=args.player, mode=args.mode, difficulties=args.difficulty,
+                      workers=args.workers, seed=args.seed)
+    report(result)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# solver.py
+# 주문별 최고 점수 / 최적 조합 계산기
+# 재료 부분집합(2^11) × 주름(4~16) × 조리법 × 조리 시간(2.0~12.0, 0.5 단위) 전체 점수표를
+# 항목별 부분합을 더하는 방식으로 한 번에 만든 뒤, 조회는 O(1)로 한다.
+
+from functools import lru_cache
+
+import numpy as np
+
+import batch_score as bs
+from core import COOK_METHODS, Attempt, mask_to_ings
+
+PLEATS = np.arange(4, 17)                    # 주름 입력 범위 (number_input 과 동일)
+COOK_TIMES = np.arange(4, 25) / 2            # 2.0 ~ 12.0, 0.5 단위 (slider 와 동일)
+MASKS = np.arange(bs.N_MASKS, dtype=np.int16)
+METHODS = np.arange(len(COOK_METHODS), dtype=np.int8)
+
+def order_signature(order) -> tuple:
+    """점수에 영향을 주는 값만 모은 키 (재료 순서/메모는 무시)"""
+    return (
+        bs.ING_BIT[order.required_protein],
+        bs.ing_mask(order.must_have),
+        bs.ing_mask(order.avoid),
+        bs.ing_mask(order.optional_mixes),
+        order.pleats_min,
+        order.pleats_max,
+        bs.METHOD_CODE[order.method],
+        tuple(order.time_target),
+    )
+
+class ScoreTable:
+    """한 주문에 대한 전체 점수표. table[mask, pleat_idx, method, time_idx]"""
+
+    def __init__(self, sig: tuple, mode: str = "step"):
+        protein, must, avoid, mix, pmin, pmax, method, (tmin, tmax) = sig
+        self.signature = sig
+        self.tables = t = bs.TABLES[mode]
+        self.lo, self.hi = t["w"]["total_min"], t["w"]["total_max"]
+
+        # 항목별 부분합 (축마다 독립)
+        self.ing_part = (bs.protein_points(protein, MASKS, t) + bs.must_points(must, MASKS, t)
+                         + bs.avoid_points(avoid, MASKS, t) + bs.mix_points(mix, MASKS, t)).astype(np.int16)
+        self.pleat_part = bs.pleat_points(pmin, pmax, PLEATS, t).astype(np.int16)
+        self.method_part = bs.method_points(method, METHODS, t).astype(np.int16)
+        self.time_part = bs.time_points(tmin, tmax, COOK_TIMES, t).astype(np.int16)
+
+        raw = (self.ing_part[:, None, None, None] + self.pleat_part[None, :, None, None]
+               + self.method_part[None, None, :, None] + self.time_part[None, None, None, :])
+        self.table = np.clip(raw, self.lo, self.hi).astype(np.int8)
+
+        # 축이 서로 독립이라 최적 조합 = 축별 최댓값 위치 (재료는 가장 작은 집합이 먼저 잡힘)
+        self.best_index = (int(np.argmax(self.ing_part)), int(np.argmax(self.pleat_part)),
+                           int(np.argmax(self.method_part)), int(np.argmax(self.time_part)))
+        self.best = int(self.table[self.best_index])
+
+    def best_attempt(self) -> Attempt:
+        m, p, k, t = self.best_index
+        return Attempt(mask_to_ings(m), int(PLEATS[p]), COOK_METHODS[k], float(COOK_TIMES[t]))
+
+    def score(self, attempt) -> int:
+        mask = bs.ing_mask(attempt.ingredients)
+        k = bs.METHOD_CODE[attempt.method]
+        t2 = attempt.cook_time * 2
+        if 4 <= attempt.pleats <= 16 and t2 == int(t2) and 4 <= t2 <= 24:
+            return int(self.table[mask, attempt.pleats - 4, k, int(t2) - 4])
+        # 표 밖 입력(슬라이더 단위가 아닌 시간 등)은 부분합으로 직접 계산
+        pmin, pmax, tmin, tmax = self.signature[4], self.signature[5], *self.signature[7]
+        raw = (int(self.ing_part[mask]) + int(bs.pleat_points(pmin, pmax, attempt.pleats, self.tables))
+               + int(self.method_part[k]) + int(bs.time_points(tmin, tmax, attempt.cook_time, self.tables)))
+        return max(self.lo, min(self.hi, raw))
+
+    def gap(self, attempt) -> int:
+        """최고 점수와의 차이"""
+        return self.best - self.score(attempt)
+
+@lru_cache(maxsize=64)
+def _table_for(sig: tuple, mode: str) -> ScoreTable:
+    return ScoreTable(sig, mode)
+
+def score_table(order, mode: str = "step") -> ScoreTable:
+    return _table_for(order_signature(order), mode)
+
+def best_score(order, mode: str = "step") -> int:
+    return score_table(order, mode).best
+
+def best_attempt(order, mode: str = "step") -> Attempt:
+    return score_table(order, mode).best_attempt()
+
+def gap_from_best(order, attempt, mode: str = "step") -> int:
+    return score_table(order, mode).gap(attempt)
@@ -0,0 +1,124 @@
+# timer.py
+# 라운드 제한 시간 처리 (서버 쪽 마감 스케줄러)
+# rerun 이 일어날 때만 남은 시간을 검사하던 방식 대신, 모든 세션의 마감 시각을 힙 하나에 모아두고
+# 백그라운드 스레드가 마감 시각에 바로 자동 채점한다. 화면은 결과만 가져다 보여주면 된다.
+
+import heapq
+import itertools
+import sys
+import threading
+import time
+from dataclasses import replace
+
+from core import Attempt, Order, evaluate
+from profiling import phase
+
+class DeadlineScheduler:
+    """key 별 마감 시각에 callback 을 한 번 호출. 스레드 하나로 모든 세션을 처리."""
+
+    def __init__(self):
+        self._heap = []                 # (deadline, seq, key)
+        self._active = {}               # key -> (seq, callback). 취소된 힙 항목은 꺼낼 때 버림
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._loop, name="deadline-scheduler", daemon=True)
+        self._thread.start()
+
+    def schedule(self, key, deadline: float, callback):
+        """deadline(time.monotonic 기준)에 callback() 호출. 같은 key 가 있으면 교체"""
+        with self._cond:
+            seq = next(self._seq)
+            self._active[key] = (seq, callback)
+            heapq.heappush(self._heap, (deadline, seq, key))
+            self._cond.notify()
+
+    def cancel(self, key):
+        with self._cond:
+            self._active.pop(key, None)
+
+    def __len__(self):
+        return len(self._active)
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while True:
+                    # 취소/교체된 항목 정리
+                    while self._heap and self._active.get(self._heap[0][2], (None,))[0] != self._heap[0][1]:
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    wait = self._heap[0][0] - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._cond.wait(wait)
+                _, _, key = heapq.heappop(self._heap)
+                _, callback = self._active.pop(key)
+            try:
+                callback()
+            except Exception as e:
+                # 콜백 하나가 실패해도 다른 세션 마감은 계속 처리
+                print(f"[timer] 마감 처리 실패: {e!r}", file=sys.stderr)
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler() -> DeadlineScheduler:
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = DeadlineScheduler()
+    return _scheduler
+
+class LiveRound:
+    """진행 중인 라운드 하나. 입력 스냅샷을 들고 있다가 제출 또는 마감 중 먼저 온 쪽으로 한 번만 채점."""
+
+    def __init__(self, order: Order, deadline: float, mode: str, attempt: Attempt, on_finish=None):
+        self.order = order
+        self.deadline = deadline
+        self.mode = mode
+        self.result = None              # (points, core.ScoreResult, timed_out)
+        self.attempt = None             # 실제로 채점된 시도
+        self._attempt = attempt
+        self._on_finish = on_finish     # (LiveRound) -> None, 기록용
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.monotonic())
+
+    def update(self, **inputs):
+        """현재 위젯 값 반영 (마감 시 이 값으로 자동 채점)"""
+        with self._lock:
+            if self.result is None:
+                self._attempt = replace(self._attempt, **inputs)
+
+    def submit(self, attempt: Attempt) -> tuple:
+        return self._finish(attempt, timed_out=False)
+
+    def expire(self) -> tuple:
+        return self._finish(None, timed_out=True)
+
+    def cancel(self):
+        get_scheduler().cancel(self)
+
+    def _finish(self, attempt, timed_out: bool) -> tuple:
+        with self._lock:
+            if self.result is not None:     # 이미 끝난 라운드면 그 결과 그대로
+                return self.result
+            self.attempt = attempt or self._attempt
+            with phase("score"):
+                r = evaluate(self.order, self.attempt, self.mode)    # 문구는 화면에서 필요할 때 만든다
+            self.result = (r.points, r, timed_out)
+        if not timed_out:
+            self.cancel()
+        if self._on_finish:
+            self._on_finish(self)
+        return self.result
+
+def start_round(order: Order, time_limit: float, mode: str, attempt: Attempt, on_finish=None) -> LiveRound:
+    """라운드 시작 + 마감 등록. attempt 는 아무것도 안 건드렸을 때의 기본 입력"""
+    live = LiveRound(order, time.monotonic() + time_limit, mode, attempt, on_finish)
+    get_scheduler().schedule(live, live.deadline, live.expire)
+    return live
@@ -0,0 +1,218 @@
+# tournament.py
+# 대회 모드: 여러 세션이 같은 순간에 같은 주문을 받아 점수 + 제출 시간으로 겨룬다 (Streamlit 없음)
+# 라운드 진행은 시계로 정해진다: 시작 시각부터 (제한 시간 + 쉬는 시간) 주기로 라운드 k 가 열리고 닫힌다.
+# 그래서 진행자 스레드 없이 어느 세션이 물어봐도 같은 라운드/주문/마감 시각이 나온다 (주문은 대회 seed 로 고정).
+# 점수판은 선수 이름 해시로 나눈 STRIPES 개의 칸마다 락이 따로 있어서, 동시에 몰린 제출이 한 락에 줄 서지 않는다.
+# 순위는 칸들을 모아 만든 불변 스냅샷을 통째로 바꿔 끼우고, 읽는 쪽은 락 없이 그 참조만 읽는다.
+# 스냅샷은 STALE_SECS 보다 오래됐고 바뀐 게 있을 때만 (한 스레드만) 다시 만든다 → 순위는 최대 STALE_SECS 남짓 늦다.
+# 실행: python tournament.py --players 500     # 동시 제출 부하 확인
+
+import argparse
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+
+from core import Attempt, Order, OrderGenerator, get_time_limit
+from timer import LiveRound, start_round
+
+STRIPES = 16
+STALE_SECS = 1.0
+
+# ---------- 점수판 ----------
+@dataclass(frozen=True, slots=True)
+class Standing:  # 순위표 한 줄
+    rank: int
+    name: str
+    points: int
+    secs: float         # 제출까지 걸린 시간 합 (동점이면 빠른 쪽이 위)
+    rounds: int
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    version: int
+    built: float                # time.monotonic()
+    overall: tuple              # (Standing, ...) 누적
+    by_round: dict              # 라운드 -> (Standing, ...)
+    ranks: dict                 # 이름 -> 누적 순위
+
+    def top(self, n: int = 10) -> tuple:
+        return self.overall[:n]
+
+def _ranked(rows) -> tuple:
+    # rows: (name, points, secs, rounds). 점수 높은 순, 같으면 시간 짧은 순
+    rows = sorted(rows, key=lambda r: (-r[1], r[2], r[0]))
+    return tuple(Standing(i, *r) for i, r in enumerate(rows, 1))
+
+class _Stripe:
+    __slots__ = ("lock", "players")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.players = {}       # 이름 -> {라운드: (점수, 걸린 시간)}
+
+class Scoreboard:
+    def __init__(self, stripes: int = STRIPES, stale_secs: float = STALE_SECS):
+        self._stripes = [_Stripe() for _ in range(stripes)]
+        self.stale_secs = stale_secs
+        self._dirty = threading.Event()
+        self._rebuild = threading.Lock()
+        self._snapshot = Snapshot(0, time.monotonic(), (), {}, {})
+
+    def _stripe(self, name: str) -> _Stripe:
+        # hash() 는 프로세스마다 달라서 crc32 (칸 배정이 재현되게)
+        return self._stripes[zlib.crc32(name.encode()) % len(self._stripes)]
+
+    def submit(self, name: str, round_no: int, points: int, secs: float) -> bool:
+        """라운드당 한 번만 (먼저 온 제출). 새로 기록됐으면 True"""
+        s = self._stripe(name)
+        with s.lock:
+            rounds = s.players.setdefault(name, {})
+            if round_no in rounds:
+                return False
+            rounds[round_no] = (points, secs)
+        self._dirty.set()
+        return True
+
+    def join(self, name: str):
+        # 아직 제출 전인 참가자도 순위표에 0점으로
+        s = self._stripe(name)
+        with s.lock:
+            if name in s.players:
+                return
+            s.players[name] = {}
+        self._dirty.set()
+
+    def snapshot(self) -> Snapshot:
+        """최대 stale_secs 남짓 지난 순위. 다시 만들 차례여도 이미 누가 만드는 중이면 기다리지 않고 이전 것"""
+        snap = self._snapshot
+        if not self._dirty.is_set() or time.monotonic() - snap.built < self.stale_secs:
+            return snap
+        if not self._rebuild.acquire(blocking=False):
+            return snap
+        try:
+            return self.rebuild()
+        finally:
+            self._rebuild.release()
+
+    def rebuild(self) -> Snapshot:
+        self._dirty.clear()     # 만드는 도중 들어온 제출은 다음 스냅샷에
+        overall, by_round = [], {}
+        for s in self._stripes:
+            with s.lock:        # 칸 하나씩 잠깐만 (복사만)
+                items = [(name, dict(rounds)) for name, rounds in s.players.items()]
+            for name, rounds in items:
+                overall.append((name, sum(p for p, _ in rounds.values()),
+                                round(sum(t for _, t in rounds.values()), 2), len(rounds)))
+                for k, (p, t) in rounds.items():
+                    by_round.setdefault(k, []).append((name, p, round(t, 2), 1))
+        ranked = _ranked(overall)
+        snap = self._snapshot = Snapshot(
+            self._snapshot.version + 1, time.monotonic(), ranked,
+            {k: _ranked(rows) for k, rows in by_round.items()},
+            {r.name: r.rank for r in ranked},
+        )
+        return snap
+
+# ---------- 라운드 진행 ----------
+@dataclass(frozen=True, slots=True)
+class RoundInfo:
+    number: int             # 1부터
+    order: Order
+    starts: float           # time.monotonic() 기준
+    deadline: float
+    next_starts: float      # 다음 라운드 시작 (마지막 라운드면 inf)
+
+class Tournament:
+    """시계로 진행되는 대회 하나. 라운드 k 주문은 seed 로 정해져 있어서 모든 세션에 같은 객체가 간다"""
+
+    def __init__(self, name: str, mode: str = "round", difficulty: str = "보통", rounds: int = 5,
+                 time_limit: float = None, break_secs: float = 15.0, start_in: float = 10.0, seed: int = None):
+        self.name, self.mode, self.difficulty = name, mode, difficulty
+        self.rounds = rounds
+        self.time_limit = time_limit or get_time_limit(difficulty, mode)
+        self.break_secs = break_secs
+        self.period = self.time_limit + break_secs
+        self.t0 = time.monotonic() + start_in
+        self.seed = zlib.crc32(name.encode()) if seed is None else seed
+        self.orders = OrderGenerator(mode, self.seed).orders(rounds, difficulty)
+        self.board = Scoreboard()
+
+    def current(self, now: float = None):
+        """지금 진행 중인 라운드 (RoundInfo) 또는 None (시작 전/쉬는 시간/끝)"""
+        now = time.monotonic() if now is None else now
+        k = int((now - self.t0) // self.period)
+        if not 0 <= k < self.rounds:
+            return None
+        info = self.round_info(k + 1)
+        return info if now < info.deadline else None
+
+    def round_info(self, number: int) -> RoundInfo:
+        starts = self.t0 + (number - 1) * self.period
+        return RoundInfo(number, self.orders[number - 1], starts, starts + self.time_limit,
+                         starts + self.period if number < self.rounds else float("inf"))
+
+    def next_round(self, now: float = None):
+        """다음에 열릴 라운드 (RoundInfo) 또는 None (끝)"""
+        now = time.monotonic() if now is None else now
+        k = max(0, int((now - self.t0) // self.period) + 1) if now >= self.t0 else 0
+        return self.round_info(k + 1) if k < self.rounds else None
+
+    def finished(self, now: float = None) -> bool:
+        now = time.monotonic() if now is None else now
+        return now >= self.t0 + (self.rounds - 1) * self.period + self.time_limit
+
+    def play(self, player: str, info: RoundInfo, attempt: Attempt) -> LiveRound:
+        """이 세션의 라운드 시작 (마감은 모두 같은 시각). 제출/마감되면 점수판에 기록"""
+        self.board.join(player)
+        def hook(live):
+            pts, _, _ = live.result
+            secs = min(time.monotonic(), info.deadline) - info.starts
+            self.board.submit(player, info.number, pts, secs)
+        return start_round(info.order, info.deadline - time.monotonic(), self.mode, attempt, on_finish=hook)
+
+_tournaments = {}
+_tournaments_lock = threading.Lock()
+
+def get_tournament(name: str, restart: bool = False, **options) -> Tournament:
+    """이름별 대회 (프로세스 전체 공용). 처음 부른 쪽의 options 로 만든다. restart 면 끝난 대회를 새로"""
+    t = _tournaments.get(name)
+    if t is None or (restart and t.finished()):
+        with _tournaments_lock:
+            t = _tournaments.get(name)
+            if t is None or (restart and t.finished()):
+                t = _tournaments[name] = Tournament(name, **options)
+    return t
+
+# ---------- 부하 확인 ----------
+def main():
+    # 선수 N명이 한 라운드에 (거의) 동시에 제출할 때 제출 지연과 스냅샷 재생성 시간
+    import random
+    import statistics
+    from concurrent.futures import ThreadPoolExecutor
+
+    p = argparse.ArgumentParser()
+    p.add_argument("--players", type=int, default=500)
+    p.add_argument("--threads", type=int, default=32)
+    p.add_argument("--stripes", type=int, default=STRIPES)
+    args = p.parse_args()
+
+    board = Scoreboard(args.stripes)
+    lat = []
+    def player(i):
+        rng = random.Random(i)
+        t0 = time.perf_counter()
+        board.submit(f"선수{i}", 1, rng.randint(0, 100), rng.uniform(5, 60))
+        lat.append(time.perf_counter() - t0)
+        board.snapshot()        # 화면 갱신 흉내 (대부분 락 없이 이전 스냅샷)
+    with ThreadPoolExecutor(args.threads) as ex:
+        list(ex.map(player, range(args.players)))
+    t0 = time.perf_counter()
+    snap = board.rebuild()
+    build_ms = (time.perf_counter() - t0) * 1000
+    us = sorted(x * 1e6 for x in lat)
+    print(f"제출 {len(us)}건: p50 {statistics.median(us):.1f}µs  p99 {us[int(len(us) * 0.99) - 1]:.1f}µs")
+    print(f"스냅샷 재생성 {build_ms:.2f}ms (v{snap.version}), 1위 {snap.top(1)[0]}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# tournament_app.py
+# 고향만두 대회 모드 (Streamlit)
+# 실행: streamlit run tournament_app.py
+# 같은 대회 이름으로 참가한 세션은 같은 시각에 같은 주문을 받고, 점수(동점이면 제출 시간)로 순위를 겨룬다.
+# 순위/남은 시간은 1초마다 부분 갱신(fragment)하고, 라운드가 열리거나 닫히면 전체 rerun.
+
+import math
+import time
+import streamlit as st
+
+from core import COOK_METHODS, Attempt, DIFFICULTIES
+from eventlog import new_session_id
+from sessions import touch as touch_session
+from render import ROUND_ING_EMOJI, order_card_html
+from tournament import STALE_SECS, get_tournament
+
+st.set_page_config(page_title="고향만두 대회", page_icon="🏁", layout="wide")
+
+_RERUN = getattr(st, "rerun", None) or getattr(st, "experimental_rerun", None)
+_FRAGMENT = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+def safe_rerun():
+    if _RERUN:
+        _RERUN()
+
+ING_EMOJI = ROUND_ING_EMOJI
+ALL_ING = list(ING_EMOJI.keys())
+
+ss = st.session_state
+touch_session()
+ss.setdefault("player_name", "익명")
+ss.setdefault("tournament_name", "오늘의 대회")
+ss.setdefault("joined", False)
+ss.setdefault("live", None)         # 이 세션의 현재 라운드 (timer.LiveRound)
+ss.setdefault("live_round", 0)      # live 가 몇 라운드 것인지
+ss.setdefault("phase", None)        # 마지막 전체 rerun 때의 라운드 번호 (쉬는 시간이면 0)
+if "sid" not in ss:
+    ss.sid = new_session_id()
+
+def player_id() -> str:
+    # 닉네임이 겹쳐도 세션끼리 섞이지 않게 세션 번호 4자리
+    return f"{ss.player_name}#{ss.sid % 10000:04d}"
+
+def standings_md(rows, me: str) -> str:
+    return "\n".join(
+        f"{r.rank}. {'**' + r.name + '**' if r.name == me else r.name} — {r.points}점 ({r.secs:.1f}초)"
+        for r in rows
+    )
+
+# ---------- 사이드바 ----------
+with st.sidebar:
+    st.title("🏁 고향만두 대회")
+    ss.player_name = st.text_input("닉네임", value=ss.player_name, max_chars=20, disabled=ss.joined)
+    ss.tournament_name = st.text_input("대회 이름", value=ss.tournament_name, max_chars=30, disabled=ss.joined,
+                                       help="같은 이름으로 들어온 사람끼리 겨뤄요.")
+    with st.expander("대회 설정 (처음 여는 사람 기준)"):
+        difficulty = st.radio("난이도", DIFFICULTIES, index=1, horizontal=True)
+        rounds = st.slider("라운드 수", 1, 10, 5)
+        break_secs = st.slider("쉬는 시간(초)", 5, 60, 15, step=5)
+    if not ss.joined and st.button("참가하기", type="primary"):
+        get_tournament(ss.tournament_name, restart=True, difficulty=difficulty, rounds=rounds, break_secs=break_secs)
+        ss.joined = True
+        safe_rerun()
+
+if not ss.joined:
+    st.info("왼쪽에서 닉네임과 대회 이름을 정하고 **참가하기**를 눌러 주세요. 같은 대회 참가자는 같은 순간에 같은 주문을 받아요!")
+    st.stop()
+
+t = get_tournament(ss.tournament_name)
+me = player_id()
+t.board.join(me)
+info = t.current()
+ss.phase = info.number if info else 0
+
+# ---------- 실시간 현황 (1초마다) ----------
+def live_status():
+    touch_session()     # 화면이 열려 있는 동안은 손 놓은 세션이 아니다
+    now = time.monotonic()
+    cur = t.current(now)
+    if (cur.number if cur else 0) != ss.phase:
+        safe_rerun()        # 라운드 열림/닫힘 → 전체 화면 다시
+    if cur is not None:
+        remain = math.ceil(cur.deadline - now)
+        st.progress(remain / t.time_limit, text=f"라운드 {cur.number}/{t.rounds} · 남은 시간 {remain}초")
+    elif not t.finished(now):
+        nxt = t.next_round(now)
+        st.info(f"⏳ 라운드 {nxt.number}/{t.rounds} 시작까지 {math.ceil(nxt.starts - now)}초")
+    snap = t.board.snapshot()
+    st.markdown(f"#### 🏆 순위 (참가 {len(snap.overall)}명)")
+    st.markdown(standings_md(snap.top(10), me) or "아직 기록이 없어요.")
+    rank = snap.ranks.get(me)
+    if rank and rank > 10:
+        st.caption(f"내 순위: {rank}위")
+    st.caption(f"순위는 최대 {STALE_SECS:.0f}초 남짓 늦게 반영돼요.")
+
+if _FRAGMENT:
+    live_status = _FRAGMENT(run_every=1)(live_status)
+
+st.header(f"🏁 {t.name}")
+main_col, board_col = st.columns([3, 2])
+with board_col:
+    live_status()
+
+with main_col:
+    if info is None:
+        if t.finished():
+            st.subheader("🎉 대회 종료!")
+            rank = t.board.snapshot().ranks.get(me)
+            st.metric("최종 순위", f"{rank}위" if rank else "-")
+            if st.button("새 대회 열기"):
+                ss.joined = False
+                safe_rerun()
+        else:
+            st.caption("다음 라운드를 기다리는 중… 주문은 라운드가 열리는 순간 모두에게 동시에 공개돼요.")
+        st.stop()
+
+    order = info.order
+    if ss.live_round != info.number:
+        # 이 라운드 처음: 입력 초기화 + 공용 마감으로 라운드 시작
+        if ss.live is not None:
+            ss.live.cancel()
+        ss.ingredients, ss.pleats, ss.method = [], order.pleats_min, order.method
+        ss.cook_time = round(sum(order.time_target) / 2, 1)
+        ss.live = t.play(me, info, Attempt([], ss.pleats, ss.method, ss.cook_time))
+        ss.live_round = info.number
+    live = ss.live
+
+    with st.container(border=True):
+        st.subheader(f"📋 라운드 {info.number} 주문")
+        st.markdown(order_card_html(order, "round"), unsafe_allow_html=True)
+
+    if live.result is not None:
+        pts, result, timed_out = live.result
+        st.success(f"제출 완료: {pts}점" + (" (⏰ 시간 초과 자동 제출)" if timed_out else ""))
+        for r in result.reasons("round"):
+            st.write(r)
+        st.caption("다음 라운드까지 기다려 주세요.")
+        st.stop()
+
+    ingredients = st.multiselect("속 재료", options=ALL_ING, default=ss.ingredients,
+                                 format_func=lambda x: f"{ING_EMOJI[x]} {x}")
+    cA, cB, cC = st.columns(3)
+    with cA:
+        pleats = st.number_input("주름(개)", min_value=4, max_value=16, value=ss.pleats, step=1)
+    with cB:
+        method = st.radio("조리법", COOK_METHODS, index=COOK_METHODS.index(ss.method), horizontal=True)
+    with cC:
+        cook_time = st.slider("조리 시간(분)", 2.0, 12.0, value=float(ss.cook_time), step=0.5)
+    ss.ingredients, ss.pleats, ss.method, ss.cook_time = ingredients, int(pleats), method, float(cook_time)
+    live.update(ingredients=ingredients, pleats=int(pleats), method=method, cook_time=float(cook_time))
+
+    if st.button("만두 완성! ✅", type="primary"):
+        live.submit(Attempt(ingredients, int(pleats), method, float(cook_time)))
+        safe_rerun()